@@ -11,6 +11,8 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 import sys
 import os
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Add src to Python path
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
@@ -23,6 +25,28 @@ except ImportError:
     st.warning("Advanced charts module not found. Using basic charts.")
     CHARTS_AVAILABLE = False
 
+from src.data.kernels import (
+    FLAG_DIGITAL_LEADER,
+    FLAG_DIGITAL_READY,
+    FLAG_EASY_ENTRY,
+    FLAG_EMERGING,
+    FLAG_EMERGING_GROWTH,
+    FLAG_HIGH_RISK,
+    FLAG_LARGE_MARKET,
+    FLAG_STABLE,
+    NORM_MINMAX,
+    NORMALIZATION_RULES,
+    scan_insight_flags,
+    score_indicators
+)
+from src.data.worldbank import create_session, request_json
+from src.data.sample_data import (
+    SAMPLE_COUNTRIES,
+    SAMPLE_GOVERNANCE,
+    SAMPLE_INDICATOR_RANGES,
+    SAMPLE_MARKET_INDICATORS
+)
+
 # Configure Streamlit page
 st.set_page_config(
     page_title="eCommerce Expansion Intelligence Dashboard",
@@ -31,8 +55,9 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS
-st.markdown("""
+# Custom CSS. Streamlit removes any element a rerun doesn't emit again, so this
+# must not be hidden behind st.cache_resource; unchanged deltas are cheap to resend.
+CUSTOM_CSS = """
 <style>
     .metric-card {
         background-color: #f0f2f6;
@@ -97,8 +122,14 @@ st.markdown("""
         font-size: 0.8rem;
         margin: 0.2rem 0;
     }
+    .caption-text {
+        color: rgba(49, 51, 63, 0.6);
+        font-size: 0.875rem;
+        line-height: 1.6;
+    }
 </style>
-""", unsafe_allow_html=True)
+"""
+st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
 
 # Category-specific configurations
 CATEGORY_INDICATORS = {
@@ -294,69 +325,206 @@ BUSINESS_TYPE_CONFIG = {
     }
 }
 
+# Indicators fetched for every category
+BASIC_INDICATORS = {
+    'NY.GDP.PCAP.PP.CD': 'gdp_per_capita_ppp',
+    'SP.POP.TOTL': 'population',
+    'SP.URB.TOTL.IN.ZS': 'urban_population_pct',
+    'IT.NET.USER.ZS': 'internet_users_pct',
+    'IT.CEL.SETS.P2': 'mobile_subscriptions',
+    'LP.LPI.OVRL.XQ': 'logistics_performance',
+    'SI.POV.GINI': 'gini_index',
+    'NE.CON.PRVT.PC.CD': 'consumption_per_capita'
+}
+
+# Digital readiness scoring profiles keyed by (digital readiness focus selected, business type).
+# Business type None is the B2C default. Scores are internet % and capped mobile
+# subscriptions combined with the (internet, mobile) weights.
+DIGITAL_READINESS_PROFILES = {
+    # Much more demanding requirements when digital focus is selected
+    (True, "B2B eCommerce"): {
+        'weights': (0.8, 0.2), 'mobile_cap': 150,
+        'context': "B2B + Digital Focus: Premium infrastructure requirements",
+        'excellence_threshold': 95, 'good_threshold': 85
+    },
+    (True, "Marketplace"): {
+        'weights': (0.6, 0.4), 'mobile_cap': 150,
+        'context': "Marketplace + Digital Focus: High consumer adoption needs",
+        'excellence_threshold': 90, 'good_threshold': 80
+    },
+    (True, None): {
+        'weights': (0.7, 0.3), 'mobile_cap': 150,
+        'context': "B2C + Digital Focus: Advanced consumer connectivity",
+        'excellence_threshold': 92, 'good_threshold': 82
+    },
+    # Standard requirements for other analysis focuses
+    (False, "B2B eCommerce"): {
+        'weights': (0.7, 0.3), 'mobile_cap': 120,
+        'context': "B2B Focus: Infrastructure quality & business connectivity",
+        'excellence_threshold': 85, 'good_threshold': 70
+    },
+    (False, "Marketplace"): {
+        'weights': (0.5, 0.5), 'mobile_cap': 120,
+        'context': "Marketplace Focus: Broad consumer digital adoption",
+        'excellence_threshold': 80, 'good_threshold': 65
+    },
+    (False, None): {
+        'weights': (0.6, 0.4), 'mobile_cap': 120,
+        'context': "B2C Focus: Consumer digital adoption & mobile-first",
+        'excellence_threshold': 82, 'good_threshold': 68
+    }
+}
+
+# Quadrant reference lines for the digital infrastructure matrix, keyed by digital readiness focus.
+# Higher thresholds apply when the analysis is digital-focused.
+DIGITAL_QUADRANT_LINES = {
+    True: (
+        dict(y=120, line_dash="dash", line_color="red", annotation_text="High Mobile Penetration (120%)"),
+        dict(x=85, line_dash="dash", line_color="red", annotation_text="High Internet Penetration (85%)")
+    ),
+    False: (
+        dict(y=100, line_dash="dash", line_color="gray", annotation_text="100% Mobile Penetration"),
+        dict(x=70, line_dash="dash", line_color="gray", annotation_text="70% Internet Penetration")
+    )
+}
+
+# Expansion phase durations for each risk tolerance
+EXPANSION_PHASE_DURATION = {
+    "Conservative": {"phase1": "6-12 months", "phase2": "12-18 months", "phase3": "18-24 months"},
+    "Moderate": {"phase1": "3-6 months", "phase2": "6-12 months", "phase3": "12-18 months"},
+    "Aggressive": {"phase1": "2-4 months", "phase2": "4-8 months", "phase3": "8-12 months"}
+}
+
+# Implementation roadmap shared by every business type
+IMPLEMENTATION_STEPS = [
+    "Market entry legal requirements research",
+    "Local partnership and vendor identification",
+    "Digital infrastructure and payment setup",
+    "Compliance and regulatory approval process",
+    "Local marketing and customer acquisition strategy",
+    "Operations and customer support localization"
+]
+
+# Performance benchmark milestones by business type (types without an entry show none)
+PERFORMANCE_BENCHMARKS = {
+    'B2C eCommerce': [
+        "Month 1-3: Market setup and initial traffic",
+        "Month 4-6: Customer acquisition and retention",
+        "Month 7-12: Revenue growth and profitability"
+    ],
+    'B2B eCommerce': [
+        "Month 1-6: Business partnership development",
+        "Month 7-12: Client acquisition and contract value",
+        "Year 2+: Market share and expansion"
+    ]
+}
+
+# Plotly config for read-only charts: render as a static image-like plot with no toolbar
+STATIC_CHART_CONFIG = {'staticPlot': True, 'displayModeBar': False}
+
+# Card markup for one expansion insight; css_class is expansion-insight or warning-insight
+INSIGHT_HTML = "<div class='{css_class}'><strong>{title}</strong><br>{message}</div>"
+
+# Worldwide Governance Indicators averaged into the overall governance score
+GOVERNANCE_COLUMNS = ['regulatory_quality', 'rule_of_law', 'control_corruption', 'govt_effectiveness']
+
+# (acceptable, moderate) governance score thresholds for each risk tolerance
+RISK_THRESHOLDS = {
+    'Conservative': (0.5, -0.5),
+    'Moderate': (0.0, -1.0),
+    'Aggressive': (-0.5, -1.5)
+}
+
+# Compliance advice shown when the governance score falls below the business type's threshold
+COMPLIANCE_ADVICE = {
+    'B2B eCommerce': (0.0, "Consider local business partnerships"),
+    'Marketplace': (-0.5, "May need extensive legal compliance"),
+    'SaaS Platform': (0.0, "Focus on data protection compliance")
+}
+
+# Recommended market entry approach for each risk tolerance
+ENTRY_APPROACH = {
+    'Conservative': [
+        "Start with highest governance score markets",
+        "Establish legal entity and compliance first",
+        "Partner with local legal experts"
+    ],
+    'Moderate': [
+        "Balance opportunity vs governance quality",
+        "Phased approach for moderate-risk markets",
+        "Monitor regulatory changes closely"
+    ],
+    'Aggressive': [
+        "Consider first-mover advantages",
+        "Prepare for regulatory uncertainty",
+        "Maintain operational flexibility"
+    ]
+}
+
 class WorldBankExpansionAPI:
     """World Bank API client for eCommerce expansion data"""
     
     BASE_URL = "https://api.worldbank.org/v2"
     
+    # Every column the indicator fetch can produce: each indicator value plus its _year
+    INDICATOR_FIELDS = frozenset(BASIC_INDICATORS.values()).union(
+        field for config in CATEGORY_INDICATORS.values() for field in config['primary_indicators'].values()
+    )
+    NUMERIC_FIELDS = INDICATOR_FIELDS.union(f'{field}_year' for field in INDICATOR_FIELDS)
+    
+    @staticmethod
+    @st.cache_resource
+    def get_session() -> requests.Session:
+        """Shared HTTP session so World Bank calls reuse pooled keep-alive connections"""
+        return create_session(pool_maxsize=10)
+    
+    @staticmethod
+    def _request_json(url: str, params: Optional[Dict] = None, timeout: int = 15) -> List:
+        """GET a World Bank API endpoint, serving the last good response if the API is down"""
+        return request_json(WorldBankExpansionAPI.get_session(), url, params=params, timeout=timeout)
+    
     @staticmethod
-    @st.cache_data(ttl=3600)
     def get_countries() -> pd.DataFrame:
-        """Get list of countries with codes"""
+        """Get list of countries with codes, falling back to sample countries if the API fails"""
         try:
-            st.info("🌐 Fetching country data from World Bank API...")
-            url = f"{WorldBankExpansionAPI.BASE_URL}/country?format=json&per_page=300"
-            response = requests.get(url, timeout=15)
-            
-            if response.status_code != 200:
-                raise Exception(f"API returned status code {response.status_code}")
-            
-            data = response.json()
-            if len(data) < 2 or not data[1]:
-                raise Exception("Invalid API response format")
-            
-            countries = []
-            for country in data[1]:
-                if (country.get('capitalCity') and 
-                    country.get('region', {}).get('value') != 'Aggregates' and
-                    country.get('region', {}).get('value') != ''):
-                    countries.append({
-                        'code': country['id'],
-                        'name': country['name'],
-                        'region': country['region']['value'],
-                        'income_level': country['incomeLevel']['value']
-                    })
-            
-            df = pd.DataFrame(countries)
-            st.success(f"✅ Successfully loaded {len(df)} countries from World Bank API")
-            return df
-            
+            return WorldBankExpansionAPI._fetch_countries()
         except Exception as e:
+            # Applied outside the cached fetch so the fallback isn't cached for a day;
+            # the next call tries the API again
             st.error(f"❌ Failed to load data from World Bank API: {e}")
             st.warning("🔄 Using sample data for demonstration. Real API data unavailable.")
             return WorldBankExpansionAPI._get_sample_countries()
     
+    @staticmethod
+    @st.cache_data(ttl=86400)
+    def _fetch_countries() -> pd.DataFrame:
+        """Country list from the World Bank API; raises if it is unavailable so failures aren't cached"""
+        st.info("🌐 Fetching country data from World Bank API...")
+        url = f"{WorldBankExpansionAPI.BASE_URL}/country?format=json&per_page=300"
+        data = WorldBankExpansionAPI._request_json(url, timeout=15)
+        if not data[1]:
+            raise Exception("Invalid API response format")
+        
+        countries = []
+        for country in data[1]:
+            if (country.get('capitalCity') and 
+                country.get('region', {}).get('value') != 'Aggregates' and
+                country.get('region', {}).get('value') != ''):
+                countries.append({
+                    'code': country['id'],
+                    'name': country['name'],
+                    'region': country['region']['value'],
+                    'income_level': country['incomeLevel']['value']
+                })
+        
+        df = pd.DataFrame(countries)
+        st.success(f"✅ Successfully loaded {len(df)} countries from World Bank API")
+        return df
+    
     @staticmethod
     def _get_sample_countries() -> pd.DataFrame:
         """Fallback sample countries"""
-        sample_countries = [
-            {'code': 'USA', 'name': 'United States', 'region': 'North America', 'income_level': 'High income'},
-            {'code': 'CHN', 'name': 'China', 'region': 'East Asia & Pacific', 'income_level': 'Upper middle income'},
-            {'code': 'DEU', 'name': 'Germany', 'region': 'Europe & Central Asia', 'income_level': 'High income'},
-            {'code': 'JPN', 'name': 'Japan', 'region': 'East Asia & Pacific', 'income_level': 'High income'},
-            {'code': 'GBR', 'name': 'United Kingdom', 'region': 'Europe & Central Asia', 'income_level': 'High income'},
-            {'code': 'FRA', 'name': 'France', 'region': 'Europe & Central Asia', 'income_level': 'High income'},
-            {'code': 'IND', 'name': 'India', 'region': 'South Asia', 'income_level': 'Lower middle income'},
-            {'code': 'BRA', 'name': 'Brazil', 'region': 'Latin America & Caribbean', 'income_level': 'Upper middle income'},
-            {'code': 'RUS', 'name': 'Russian Federation', 'region': 'Europe & Central Asia', 'income_level': 'Upper middle income'},
-            {'code': 'SGP', 'name': 'Singapore', 'region': 'East Asia & Pacific', 'income_level': 'High income'},
-            {'code': 'MEX', 'name': 'Mexico', 'region': 'Latin America & Caribbean', 'income_level': 'Upper middle income'},
-            {'code': 'KOR', 'name': 'Korea, Rep.', 'region': 'East Asia & Pacific', 'income_level': 'High income'},
-            {'code': 'IDN', 'name': 'Indonesia', 'region': 'East Asia & Pacific', 'income_level': 'Upper middle income'},
-            {'code': 'TUR', 'name': 'Turkey', 'region': 'Europe & Central Asia', 'income_level': 'Upper middle income'},
-            {'code': 'ARE', 'name': 'United Arab Emirates', 'region': 'Middle East & North Africa', 'income_level': 'High income'}
-        ]
-        return pd.DataFrame(sample_countries)
+        return SAMPLE_COUNTRIES.copy()
     
     @staticmethod
     @st.cache_data(ttl=86400, show_spinner=False)
@@ -378,76 +546,39 @@ class WorldBankExpansionAPI:
         indicators = category_config["primary_indicators"]
         
         # Always include basic indicators
-        basic_indicators = {
-            'NY.GDP.PCAP.PP.CD': 'gdp_per_capita_ppp',
-            'SP.POP.TOTL': 'population',
-            'SP.URB.TOTL.IN.ZS': 'urban_population_pct',
-            'IT.NET.USER.ZS': 'internet_users_pct',
-            'IT.CEL.SETS.P2': 'mobile_subscriptions',
-            'LP.LPI.OVRL.XQ': 'logistics_performance',
-            'SI.POV.GINI': 'gini_index',
-            'NE.CON.PRVT.PC.CD': 'consumption_per_capita'
-        }
+        all_indicators = {**BASIC_INDICATORS, **indicators}
         
-        # Merge category-specific with basic indicators
-        all_indicators = {**basic_indicators, **indicators}
+        indicator_codes = ";".join(all_indicators.keys())
         
-        all_data = []
-        api_success_count = 0
-        
-        for i, country in enumerate(countries):
-            try:
-                # Update progress
-                progress_container.info(f"🌐 Fetching data for {country} ({i+1}/{len(countries)})...")
-                
-                # Get all indicators in one call
-                indicator_codes = ";".join(all_indicators.keys())
-                url = f"{WorldBankExpansionAPI.BASE_URL}/country/{country}/indicator/{indicator_codes}"
-                params = {
-                    'format': 'json',
-                    'mrv': 1,  # Most recent 1 value for faster response
-                    'per_page': 100
-                }
-                
-                response = requests.get(url, params=params, timeout=10)  # Reduced timeout
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    if len(data) > 1 and data[1]:
-                        country_data = {'country_code': country}
-                        
-                        # Process each indicator
-                        for record in data[1]:
-                            if record and record.get('value') is not None:
-                                indicator_code = record['indicator']['id']
-                                if indicator_code in all_indicators:
-                                    field_name = all_indicators[indicator_code]
-                                    try:
-                                        country_data[field_name] = float(record['value'])
-                                        country_data[f'{field_name}_year'] = int(record['date'])
-                                    except (ValueError, TypeError):
-                                        continue
-                        
-                        # Only add if we got some meaningful data
-                        if len(country_data) > 1:
-                            all_data.append(country_data)
-                            api_success_count += 1
-                        
-                else:
-                    # Don't show warning for each failed country to reduce noise
-                    pass
-                
-            except Exception as e:
-                # Don't show warning for each failed country to reduce noise
-                continue
+        # Fetch every country in a single multi-country request; if that fails,
+        # fall back to concurrent per-country requests
+        try:
+            records = WorldBankExpansionAPI._fetch_indicator_records(countries, indicator_codes)
+        except Exception:
+            progress_container.info(f"🌐 Batch request failed, fetching {len(countries)} countries individually...")
+            records = []
+            with ThreadPoolExecutor(max_workers=min(8, len(countries))) as executor:
+                futures = [
+                    executor.submit(WorldBankExpansionAPI._fetch_indicator_records, [country], indicator_codes)
+                    for country in countries
+                ]
+                for future in as_completed(futures):
+                    try:
+                        records.extend(future.result())
+                    except Exception:
+                        # Don't show warning for each failed country to reduce noise
+                        continue
+        
+        # Reshape the long record list into one row per country
+        market_df = WorldBankExpansionAPI._records_to_frame(records, countries, all_indicators)
+        api_success_count = len(market_df)
         
         # Clear progress message
         progress_container.empty()
         
-        if all_data and api_success_count >= max(1, len(countries) * 0.3):  # At least 30% success or 1 country
-            df = pd.DataFrame(all_data)
+        if api_success_count >= max(1, len(countries) * 0.3):  # At least 30% success or 1 country
             # Fill missing values with medians from successful data
-            df = WorldBankExpansionAPI._fill_missing_data(df, category)
+            df = WorldBankExpansionAPI._fill_missing_data(market_df, category)
             st.success(f"✅ Successfully loaded real World Bank data for {api_success_count}/{len(countries)} countries")
             return df
         else:
@@ -458,6 +589,53 @@ class WorldBankExpansionAPI:
                 st.warning(f"⚠️ Limited API success ({api_success_count}/{len(countries)}). Supplementing with sample data.")
             return WorldBankExpansionAPI._get_sample_market_data(countries, category)
     
+    @staticmethod
+    def _fetch_indicator_records(countries: List[str], indicator_codes: str) -> List[Dict]:
+        """Fetch the most recent value of each indicator for one or more countries"""
+        url = f"{WorldBankExpansionAPI.BASE_URL}/country/{';'.join(countries)}/indicator/{indicator_codes}"
+        params = {
+            'format': 'json',
+            'mrv': 1,  # Most recent 1 value for faster response
+            'source': 2,  # Required by the API for multi-indicator queries
+            'per_page': max(100, len(countries) * (indicator_codes.count(';') + 1))
+        }
+        
+        data = WorldBankExpansionAPI._request_json(url, params=params, timeout=15)
+        return data[1] or []
+    
+    @staticmethod
+    def _records_to_frame(records: List[Dict], countries: List[str], indicators: Dict[str, str]) -> pd.DataFrame:
+        """Pivot long-format indicator records into one row per country"""
+        records = [record for record in records if record]
+        if not records:
+            return pd.DataFrame(columns=['country_code'])
+        
+        raw = pd.json_normalize(records)
+        raw = pd.DataFrame({
+            'country_code': raw['countryiso3code'],
+            'indicator': raw['indicator.id'],
+            'value': pd.to_numeric(raw['value'], errors='coerce'),
+            'year': pd.to_numeric(raw['date'], errors='coerce')
+        })
+        raw = raw[
+            raw['country_code'].isin(countries) &
+            raw['indicator'].isin(list(indicators)) &
+            raw['value'].notna()
+        ].drop_duplicates(['country_code', 'indicator'])
+        
+        if raw.empty:
+            return pd.DataFrame(columns=['country_code'])
+        
+        wide = raw.pivot(index='country_code', columns='indicator', values=['value', 'year'])
+        values = wide['value'].rename(columns=indicators)
+        years = wide['year'].rename(columns=lambda code: f"{indicators[code]}_year")
+        
+        # Keep the requested country order
+        order = [country for country in countries if country in values.index]
+        df = pd.concat([values, years], axis=1).reindex(order)
+        df.columns.name = None
+        return df.rename_axis('country_code').reset_index()
+    
     @staticmethod
     def get_market_indicators(countries: List[str]) -> pd.DataFrame:
         """Get basic market indicators (fallback method)"""
@@ -467,7 +645,7 @@ class WorldBankExpansionAPI:
     def _fill_missing_data(df: pd.DataFrame, category: str = "General") -> pd.DataFrame:
         """Fill missing data with reasonable defaults"""
         # Fill missing values with column medians or category-specific defaults
-        numeric_columns = df.select_dtypes(include=[np.number]).columns
+        numeric_columns = [col for col in df.columns if col in WorldBankExpansionAPI.NUMERIC_FIELDS]
         
         category_defaults = {
             "Electronics": {
@@ -489,137 +667,65 @@ class WorldBankExpansionAPI:
         
         defaults = category_defaults.get(category, {})
         
-        for col in numeric_columns:
-            if col.endswith('_year'):
-                df[col] = df[col].fillna(2023)
-            else:
-                default_val = defaults.get(col, df[col].median())
-                df[col] = df[col].fillna(default_val)
-        
-        return df
+        # Build one fill value per column and fill the whole frame in a single call
+        medians = df[numeric_columns].median()
+        fill_values = {
+            col: 2023 if col.endswith('_year') else defaults.get(col, medians[col])
+            for col in numeric_columns
+        }
+        return df.fillna(fill_values)
     
     @staticmethod
     def _get_sample_market_data(countries: List[str], category: str = "General") -> pd.DataFrame:
         """Generate consistent sample market data for demonstration"""
         sample_data = []
-        
-        # Consistent base data for major economies (not random)
-        base_indicators = {
-            'USA': {'gdp_per_capita_ppp': 76770, 'consumption_per_capita': 45000, 'population': 333000000, 
-                   'urban_population_pct': 83, 'internet_users_pct': 92, 'mobile_subscriptions': 121, 
-                   'logistics_performance': 3.89, 'gini_index': 39.8},
-            'CHN': {'gdp_per_capita_ppp': 19338, 'consumption_per_capita': 8500, 'population': 1412000000,
-                   'urban_population_pct': 65, 'internet_users_pct': 73, 'mobile_subscriptions': 124,
-                   'logistics_performance': 3.71, 'gini_index': 38.2},
-            'DEU': {'gdp_per_capita_ppp': 56956, 'consumption_per_capita': 32000, 'population': 83200000,
-                   'urban_population_pct': 77, 'internet_users_pct': 91, 'mobile_subscriptions': 107,
-                   'logistics_performance': 4.09, 'gini_index': 31.7},
-            'IND': {'gdp_per_capita_ppp': 8358, 'consumption_per_capita': 4200, 'population': 1380000000,
-                   'urban_population_pct': 35, 'internet_users_pct': 50, 'mobile_subscriptions': 87,
-                   'logistics_performance': 3.18, 'gini_index': 35.2},
-            'BRA': {'gdp_per_capita_ppp': 16727, 'consumption_per_capita': 9800, 'population': 215000000,
-                   'urban_population_pct': 87, 'internet_users_pct': 81, 'mobile_subscriptions': 107,
-                   'logistics_performance': 2.85, 'gini_index': 53.4},
-            'JPN': {'gdp_per_capita_ppp': 48705, 'consumption_per_capita': 28000, 'population': 125800000,
-                   'urban_population_pct': 92, 'internet_users_pct': 84, 'mobile_subscriptions': 135,
-                   'logistics_performance': 4.03, 'gini_index': 32.9},
-            'GBR': {'gdp_per_capita_ppp': 54603, 'consumption_per_capita': 31000, 'population': 67500000,
-                   'urban_population_pct': 84, 'internet_users_pct': 95, 'mobile_subscriptions': 119,
-                   'logistics_performance': 3.99, 'gini_index': 34.8},
-            'FRA': {'gdp_per_capita_ppp': 50962, 'consumption_per_capita': 29000, 'population': 68000000,
-                   'urban_population_pct': 81, 'internet_users_pct': 85, 'mobile_subscriptions': 110,
-                   'logistics_performance': 3.84, 'gini_index': 31.6},
-            'KOR': {'gdp_per_capita_ppp': 46762, 'consumption_per_capita': 22000, 'population': 51780000,
-                   'urban_population_pct': 82, 'internet_users_pct': 96, 'mobile_subscriptions': 129,
-                   'logistics_performance': 3.61, 'gini_index': 35.4},
-            'SGP': {'gdp_per_capita_ppp': 107728, 'consumption_per_capita': 38000, 'population': 5900000,
-                   'urban_population_pct': 100, 'internet_users_pct': 91, 'mobile_subscriptions': 148,
-                   'logistics_performance': 4.05, 'gini_index': 37.9},
-            'MEX': {'gdp_per_capita_ppp': 21362, 'consumption_per_capita': 9500, 'population': 128900000,
-                   'urban_population_pct': 81, 'internet_users_pct': 72, 'mobile_subscriptions': 89,
-                   'logistics_performance': 3.05, 'gini_index': 45.4},
-            'IDN': {'gdp_per_capita_ppp': 14841, 'consumption_per_capita': 6800, 'population': 273500000,
-                   'urban_population_pct': 57, 'internet_users_pct': 64, 'mobile_subscriptions': 119,
-                   'logistics_performance': 2.89, 'gini_index': 38.1},
-            'TUR': {'gdp_per_capita_ppp': 31033, 'consumption_per_capita': 11000, 'population': 84300000,
-                   'urban_population_pct': 76, 'internet_users_pct': 71, 'mobile_subscriptions': 98,
-                   'logistics_performance': 3.15, 'gini_index': 41.9},
-            'ARE': {'gdp_per_capita_ppp': 78255, 'consumption_per_capita': 32000, 'population': 9900000,
-                   'urban_population_pct': 87, 'internet_users_pct': 99, 'mobile_subscriptions': 209,
-                   'logistics_performance': 3.96, 'gini_index': 26.2},
-            'RUS': {'gdp_per_capita_ppp': 29485, 'consumption_per_capita': 12000, 'population': 146000000,
-                   'urban_population_pct': 75, 'internet_users_pct': 85, 'mobile_subscriptions': 168,
-                   'logistics_performance': 2.76, 'gini_index': 36.0}
-        }
+        lows, highs = np.array(list(SAMPLE_INDICATOR_RANGES.values()), dtype=float).T
         
         for country in countries:
-            if country in base_indicators:
-                data = base_indicators[country].copy()
+            if country in SAMPLE_MARKET_INDICATORS.index:
+                sample_data.append(SAMPLE_MARKET_INDICATORS.loc[country].to_numpy())
             else:
-                # For unknown countries, use consistent derived values based on country code
-                # This ensures the same country always gets the same sample data
-                seed_value = sum(ord(c) for c in country) % 1000
-                np.random.seed(seed_value)  # Consistent seed per country
-                
-                data = {
-                    'gdp_per_capita_ppp': np.random.uniform(5000, 60000),
-                    'consumption_per_capita': np.random.uniform(2000, 35000),
-                    'population': np.random.uniform(5000000, 100000000),
-                    'urban_population_pct': np.random.uniform(30, 95),
-                    'internet_users_pct': np.random.uniform(40, 95),
-                    'mobile_subscriptions': np.random.uniform(80, 130),
-                    'logistics_performance': np.random.uniform(2.0, 4.5),
-                    'gini_index': np.random.uniform(25, 60)
-                }
-            
-            # Add category-specific indicators if applicable
-            if category == "Electronics":
-                data['tech_exports_usd'] = data['gdp_per_capita_ppp'] * data['population'] * 0.001
-            elif category == "Fashion & Apparel":
-                data['female_employment_pct'] = 45 + (data['gdp_per_capita_ppp'] / 1000)
-            elif category == "Health & Beauty":
-                data['health_expenditure_per_capita'] = data['gdp_per_capita_ppp'] * 0.08
-                data['life_expectancy'] = 65 + (data['gdp_per_capita_ppp'] / 3000)
-                data['population_65_plus_pct'] = 5 + (data['gdp_per_capita_ppp'] / 5000)
-            
-            data['country_code'] = country
-            sample_data.append(data)
-        
-        return pd.DataFrame(sample_data)
+                # For unknown countries, draw all indicators at once from a generator seeded
+                # by country code. This ensures the same country always gets the same sample data
+                rng = np.random.default_rng(sum(ord(c) for c in country) % 1000)
+                sample_data.append(rng.uniform(lows, highs))
+        
+        df = pd.DataFrame(np.vstack(sample_data), columns=list(SAMPLE_INDICATOR_RANGES))
+        
+        # Add category-specific indicators if applicable
+        if category == "Electronics":
+            df['tech_exports_usd'] = df['gdp_per_capita_ppp'] * df['population'] * 0.001
+        elif category == "Fashion & Apparel":
+            df['female_employment_pct'] = 45 + (df['gdp_per_capita_ppp'] / 1000)
+        elif category == "Health & Beauty":
+            df['health_expenditure_per_capita'] = df['gdp_per_capita_ppp'] * 0.08
+            df['life_expectancy'] = 65 + (df['gdp_per_capita_ppp'] / 3000)
+            df['population_65_plus_pct'] = 5 + (df['gdp_per_capita_ppp'] / 5000)
+        
+        df['country_code'] = countries
+        return df
     
     @staticmethod
     @st.cache_data(ttl=86400)
     def get_governance_indicators(countries: List[str]) -> pd.DataFrame:
         """Get governance and business environment indicators"""
         
-        sample_data = []
-        
-        # Sample governance data (WGI scores range from -2.5 to 2.5)
-        governance_samples = {
-            'USA': {'regulatory_quality': 1.31, 'rule_of_law': 1.22, 'control_corruption': 1.21, 'govt_effectiveness': 1.42},
-            'CHN': {'regulatory_quality': -0.35, 'rule_of_law': -0.57, 'control_corruption': -0.35, 'govt_effectiveness': 0.23},
-            'DEU': {'regulatory_quality': 1.64, 'rule_of_law': 1.65, 'control_corruption': 1.92, 'govt_effectiveness': 1.50},
-            'SGP': {'regulatory_quality': 2.21, 'rule_of_law': 1.85, 'control_corruption': 2.16, 'govt_effectiveness': 2.23},
-            'IND': {'regulatory_quality': -0.41, 'rule_of_law': 0.08, 'control_corruption': -0.27, 'govt_effectiveness': 0.07},
-            'BRA': {'regulatory_quality': -0.18, 'rule_of_law': -0.23, 'control_corruption': -0.18, 'govt_effectiveness': -0.18}
-        }
+        governance_columns = ['regulatory_quality', 'rule_of_law', 'control_corruption', 'govt_effectiveness']
         
-        for country in countries:
-            if country in governance_samples:
-                data = governance_samples[country].copy()
+        scores = np.empty((len(countries), len(governance_columns)))
+        for i, country in enumerate(countries):
+            if country in SAMPLE_GOVERNANCE.index:
+                scores[i] = SAMPLE_GOVERNANCE.loc[country, governance_columns].to_numpy()
             else:
-                # Generate random governance scores
-                data = {
-                    'regulatory_quality': np.random.uniform(-1.5, 1.5),
-                    'rule_of_law': np.random.uniform(-1.5, 1.5),
-                    'control_corruption': np.random.uniform(-1.5, 1.5),
-                    'govt_effectiveness': np.random.uniform(-1.5, 1.5)
-                }
-            
-            data['country_code'] = country
-            sample_data.append(data)
-        
-        return pd.DataFrame(sample_data)
+                # For unknown countries, draw from a generator seeded by country code so
+                # the same country always gets the same scores, across reruns and cache expiry
+                rng = np.random.default_rng(sum(ord(c) for c in country) % 1000)
+                scores[i] = rng.uniform(-1.5, 1.5, size=len(governance_columns))
+        
+        # Scores sit in -2.5..2.5 and are shown to two decimals, so float32 is plenty
+        df = pd.DataFrame(scores.astype(np.float32), columns=governance_columns)
+        df['country_code'] = countries
+        return df
 
 class ExpansionAnalyzer:
     """Analyze market data for eCommerce expansion opportunities"""
@@ -630,7 +736,7 @@ class ExpansionAnalyzer:
                                             risk_tolerance: str = "Moderate",
                                             analysis_focus: str = "Market Size") -> pd.DataFrame:
         """Calculate composite market attractiveness score based on category and business type"""
-        df = market_data.copy()
+        df = market_data
         
         # Get category-specific weights
         if category in CATEGORY_INDICATORS:
@@ -709,141 +815,137 @@ class ExpansionAnalyzer:
         total_weight = sum(weights.values())
         weights = {k: v/total_weight for k, v in weights.items()}
         
-        # Store the adjusted weights for display
-        df.attrs['adjusted_weights'] = weights
-        
-        # Normalize indicators to 0-100 scale
-        for indicator, weight in weights.items():
-            if indicator in df.columns:
-                if indicator == 'logistics_performance':
-                    # Scale 1-5 to 0-100
-                    df[f'{indicator}_normalized'] = ((df[indicator] - 1) / 4) * 100
-                elif indicator == 'mobile_subscriptions':
-                    # Cap at 150 and scale to 0-100
-                    df[f'{indicator}_normalized'] = np.minimum(df[indicator], 150) / 150 * 100
-                elif indicator in ['internet_users_pct', 'urban_population_pct']:
-                    # Already percentage, ensure 0-100 range
-                    df[f'{indicator}_normalized'] = np.clip(df[indicator], 0, 100)
-                elif indicator == 'population':
-                    # Log scale for population
-                    df[f'{indicator}_normalized'] = (np.log10(df[indicator]) - 6) / 3 * 100
-                    df[f'{indicator}_normalized'] = np.clip(df[f'{indicator}_normalized'], 0, 100)
-                else:
-                    # Min-max normalization
-                    min_val = df[indicator].min()
-                    max_val = df[indicator].max()
-                    if max_val > min_val:
-                        df[f'{indicator}_normalized'] = ((df[indicator] - min_val) / (max_val - min_val)) * 100
-                    else:
-                        df[f'{indicator}_normalized'] = 50  # Default middle score
-        
-        # Calculate weighted score
-        df['market_attractiveness_score'] = 0
-        for indicator, weight in weights.items():
-            if f'{indicator}_normalized' in df.columns:
-                df['market_attractiveness_score'] += df[f'{indicator}_normalized'] * weight
+        # Normalize indicators to 0-100 scale and combine them into the weighted score
+        present = [indicator for indicator in weights if indicator in df.columns]
+        rules = np.array([NORMALIZATION_RULES.get(indicator, NORM_MINMAX) for indicator in present], dtype=np.int64)
+        # C-contiguous and writable, the layout the kernel was warmed with at import;
+        # to_numpy() alone gives a read-only Fortran-order view that would recompile it
+        normalized, scores = score_indicators(
+            np.require(df[present].to_numpy(), np.float64, ['C', 'W']),
+            rules,
+            np.array([weights[indicator] for indicator in present], dtype=np.float64)
+        )
         
-        # MAJOR RISK ADJUSTMENTS based on tolerance
+        # MAJOR RISK ADJUSTMENTS based on tolerance, applied to the score array in place
         if 'gini_index' in df.columns:
-            if risk_tolerance == "Conservative":
-                # Heavily penalize high inequality and uncertainty
-                inequality_penalty = (df['gini_index'] - df['gini_index'].min()) / (df['gini_index'].max() - df['gini_index'].min()) * 30
-                df['market_attractiveness_score'] -= inequality_penalty
-                # Boost high GDP per capita markets
-                if 'gdp_per_capita_ppp' in df.columns:
-                    high_gdp_boost = (df['gdp_per_capita_ppp'] > 30000).astype(int) * 15
-                    df['market_attractiveness_score'] += high_gdp_boost
-            elif risk_tolerance == "Moderate":
-                inequality_penalty = (df['gini_index'] - df['gini_index'].min()) / (df['gini_index'].max() - df['gini_index'].min()) * 15
-                df['market_attractiveness_score'] -= inequality_penalty
-            else:  # Aggressive
-                # Actually boost some risk factors
-                inequality_penalty = (df['gini_index'] - df['gini_index'].min()) / (df['gini_index'].max() - df['gini_index'].min()) * 5
-                df['market_attractiveness_score'] -= inequality_penalty
-                # Boost emerging markets (lower GDP per capita)
-                if 'gdp_per_capita_ppp' in df.columns:
-                    emerging_boost = (df['gdp_per_capita_ppp'] < 20000).astype(int) * 20
-                    df['market_attractiveness_score'] += emerging_boost
-        
-        # Ensure score is between 0-100
-        df['market_attractiveness_score'] = np.clip(df['market_attractiveness_score'], 0, 100)
+            gini = df['gini_index'].to_numpy(dtype=np.float64)
+            gini_min, gini_max = df['gini_index'].min(), df['gini_index'].max()
+            # Conservative heavily penalizes high inequality; Aggressive only lightly
+            penalty_points = {"Conservative": 30, "Moderate": 15}.get(risk_tolerance, 5)
+            with np.errstate(invalid='ignore', divide='ignore'):
+                scores -= (gini - gini_min) / (gini_max - gini_min) * penalty_points
+            
+            if 'gdp_per_capita_ppp' in df.columns:
+                gdp = df['gdp_per_capita_ppp'].to_numpy(dtype=np.float64)
+                if risk_tolerance == "Conservative":
+                    # Boost high GDP per capita markets
+                    scores += np.where(gdp > 30000, 15, 0)
+                elif risk_tolerance == "Aggressive":
+                    # Boost emerging markets (lower GDP per capita)
+                    scores += np.where(gdp < 20000, 20, 0)
+        
+        # Write all derived columns in one step; ensure score is between 0-100
+        derived = {f'{indicator}_normalized': normalized[:, j] for j, indicator in enumerate(present)}
+        derived['market_attractiveness_score'] = np.clip(scores, 0, 100)
+        df = df.assign(**derived)
+        
+        # Store the adjusted weights for display
+        df.attrs['adjusted_weights'] = weights
         
         return df
     
     @staticmethod
+    def _top_positions(values: np.ndarray, n: int) -> np.ndarray:
+        """Return positions of the n largest non-NaN values, largest first (like nlargest)"""
+        positions = np.flatnonzero(~np.isnan(values))
+        if positions.size > n:
+            # O(n) partial selection instead of a full sort
+            positions = np.sort(positions[np.argpartition(-values[positions], n - 1)[:n]])
+        return positions[np.argsort(-values[positions], kind='stable')]
+    
+    @staticmethod
+    @st.cache_data(ttl=3600, show_spinner=False)
     def generate_expansion_insights(market_data: pd.DataFrame, governance_data: pd.DataFrame, 
                                   category: str, business_type: str, risk_tolerance: str,
                                   analysis_focus: str = "Market Size") -> List[Dict]:
         """Generate expansion insights and recommendations"""
         insights = []
         
-        # Merge data
-        combined_data = market_data.merge(governance_data, on='country_code', how='left')
+        # Attach governance scores by country code; a merge would also duplicate
+        # the name/region columns both frames carry (as name_x/name_y)
+        governance = governance_data.set_index('country_code')
+        combined_data = market_data.assign(**{
+            indicator: market_data['country_code'].map(governance[indicator])
+            for indicator in GOVERNANCE_COLUMNS if indicator in governance.columns
+        })
+        
+        # Materialize every column the rules read once, with the same defaults the
+        # rules previously passed to combined_data.get. Always writable: the insight
+        # kernel is warmed for writable arrays, and read-only views would recompile it
+        def column(name: str, default: float) -> np.ndarray:
+            if name in combined_data.columns:
+                return np.require(combined_data[name].to_numpy(), np.float64, ['C', 'W'])
+            return np.full(len(combined_data), default, dtype=np.float64)
+        
+        codes = combined_data['country_code'].to_numpy(dtype=object)
+        names = combined_data['name'].to_numpy(dtype=object) if 'name' in combined_data.columns else codes
+        scores = column('market_attractiveness_score', np.nan)
+        population = column('population', np.nan)
+        internet = column('internet_users_pct', np.nan)
+        logistics = column('logistics_performance', 3)
+        rule_of_law = column('rule_of_law', 0)
+        gdp = column('gdp_per_capita_ppp', 0)
+        urban = column('urban_population_pct', np.nan)
+        
+        # Every threshold evaluated in a single pass over the rows
+        flags = scan_insight_flags(internet, logistics, rule_of_law, population, gdp, urban)
+        digital_ready_mask = flags[:, FLAG_DIGITAL_READY]
+        high_risk_mask = flags[:, FLAG_HIGH_RISK]
         
         # Analysis focus specific insights
         if analysis_focus == "Market Size":
-            large_markets = combined_data[combined_data['population'] > 50000000]
-            if not large_markets.empty:
-                # Safe access to country codes
-                large_countries = [market.get('country_code', 'Unknown') for _, market in large_markets.nlargest(3, 'population').iterrows()]
-                large_countries = [c for c in large_countries if c != 'Unknown'][:3]  # Filter out unknowns and limit to 3
-                
-                if large_countries:
-                    insights.append({
-                        'type': 'opportunity',
-                        'country': 'multiple',
-                        'title': f"Large Market Focus: {len(large_markets)} Major Markets",
-                        'message': f"Markets with >50M population: {', '.join(large_countries)}. Your Market Size focus prioritizes these high-population opportunities for maximum scale potential."
-                    })
+            large_mask = flags[:, FLAG_LARGE_MARKET]
+            if large_mask.any():
+                large_positions = np.flatnonzero(large_mask)
+                large_countries = codes[large_positions[ExpansionAnalyzer._top_positions(population[large_positions], 3)]]
+                insights.append({
+                    'type': 'opportunity',
+                    'country': 'multiple',
+                    'title': f"Large Market Focus: {large_mask.sum()} Major Markets",
+                    'message': f"Markets with >50M population: {', '.join(large_countries)}. Your Market Size focus prioritizes these high-population opportunities for maximum scale potential."
+                })
         
         elif analysis_focus == "Digital Readiness":
-            digital_leaders = combined_data[combined_data['internet_users_pct'] > 85]
-            if not digital_leaders.empty:
-                # Safe access to country codes
-                digital_countries = [market.get('country_code', 'Unknown') for _, market in digital_leaders.iterrows()]
-                digital_countries = [c for c in digital_countries if c != 'Unknown']
-                
-                if digital_countries:
-                    insights.append({
-                        'type': 'opportunity',
-                        'country': 'multiple',
-                        'title': f"Digital Readiness Focus: {len(digital_leaders)} Advanced Markets",
-                        'message': f"Markets with >85% internet penetration: {', '.join(digital_countries)}. Your Digital Readiness focus emphasizes these tech-advanced markets for immediate digital commerce success."
-                    })
+            leaders_mask = flags[:, FLAG_DIGITAL_LEADER]
+            if leaders_mask.any():
+                insights.append({
+                    'type': 'opportunity',
+                    'country': 'multiple',
+                    'title': f"Digital Readiness Focus: {leaders_mask.sum()} Advanced Markets",
+                    'message': f"Markets with >85% internet penetration: {', '.join(codes[leaders_mask])}. Your Digital Readiness focus emphasizes these tech-advanced markets for immediate digital commerce success."
+                })
         
         elif analysis_focus == "Ease of Entry":
-            easy_entry = combined_data[combined_data.get('logistics_performance', 3) > 3.5]
-            if not easy_entry.empty:
-                # Safe access to country codes
-                easy_countries = [market.get('country_code', 'Unknown') for _, market in easy_entry.iterrows()]
-                easy_countries = [c for c in easy_countries if c != 'Unknown']
-                
-                if easy_countries:
-                    insights.append({
-                        'type': 'opportunity',
-                        'country': 'multiple',
-                        'title': f"Ease of Entry Focus: {len(easy_entry)} Business-Friendly Markets",
-                        'message': f"Markets with excellent logistics (>3.5/5): {', '.join(easy_countries)}. Your Ease of Entry focus prioritizes these operationally efficient markets for smoother market entry."
-                    })
+            easy_mask = flags[:, FLAG_EASY_ENTRY]
+            if easy_mask.any():
+                insights.append({
+                    'type': 'opportunity',
+                    'country': 'multiple',
+                    'title': f"Ease of Entry Focus: {easy_mask.sum()} Business-Friendly Markets",
+                    'message': f"Markets with excellent logistics (>3.5/5): {', '.join(codes[easy_mask])}. Your Ease of Entry focus prioritizes these operationally efficient markets for smoother market entry."
+                })
         
         elif analysis_focus == "Growth Potential":
-            emerging_growth = combined_data[
-                (combined_data['gdp_per_capita_ppp'] < 25000) & 
-                (combined_data['urban_population_pct'] > 60)
-            ]
-            if not emerging_growth.empty:
-                # Safe access to top growth markets
-                top_growth = emerging_growth.nlargest(3, 'market_attractiveness_score')
-                growth_countries = [market.get('country_code', 'Unknown') for _, market in top_growth.iterrows()]
-                growth_countries = [c for c in growth_countries if c != 'Unknown']
-                
-                if growth_countries:
-                    insights.append({
-                        'type': 'opportunity',
-                        'country': 'multiple',
-                        'title': f"Growth Potential Focus: {len(emerging_growth)} Emerging Markets",
-                        'message': f"High-growth emerging markets: {', '.join(growth_countries)}. Your Growth Potential focus identifies these rapidly developing markets for long-term expansion opportunities."
-                    })
+            growth_mask = flags[:, FLAG_EMERGING_GROWTH]
+            growth_positions = np.flatnonzero(growth_mask)
+            top_growth = growth_positions[ExpansionAnalyzer._top_positions(scores[growth_positions], 3)]
+            if top_growth.size:
+                insights.append({
+                    'type': 'opportunity',
+                    'country': 'multiple',
+                    'title': f"Growth Potential Focus: {growth_mask.sum()} Emerging Markets",
+                    'message': f"High-growth emerging markets: {', '.join(codes[top_growth])}. Your Growth Potential focus identifies these rapidly developing markets for long-term expansion opportunities."
+                })
         
         # Category-specific insights
         if category in CATEGORY_INDICATORS:
@@ -870,95 +972,64 @@ class ExpansionAnalyzer:
             })
         
         # Top market opportunities (now influenced by analysis focus)
-        top_markets = combined_data.nlargest(3, 'market_attractiveness_score')
-        for _, market in top_markets.iterrows():
-            # Safe access to market name with fallback
-            market_name = market.get('name', market.get('country_code', 'Unknown Market'))
-            
+        for position in ExpansionAnalyzer._top_positions(scores, 3):
             focus_reason = ""
             if analysis_focus == "Market Size":
-                focus_reason = f" Large market size ({market.get('population', 0)/1e6:.0f}M people) aligns with your Market Size focus."
+                focus_reason = f" Large market size ({population[position]/1e6:.0f}M people) aligns with your Market Size focus."
             elif analysis_focus == "Digital Readiness":
-                focus_reason = f" Strong digital infrastructure ({market.get('internet_users_pct', 0):.0f}% internet) matches your Digital Readiness focus."
+                focus_reason = f" Strong digital infrastructure ({internet[position]:.0f}% internet) matches your Digital Readiness focus."
             elif analysis_focus == "Ease of Entry":
-                focus_reason = f" Excellent business environment (logistics: {market.get('logistics_performance', 0):.2f}/5) supports your Ease of Entry focus."
+                focus_reason = f" Excellent business environment (logistics: {logistics[position]:.2f}/5) supports your Ease of Entry focus."
             elif analysis_focus == "Growth Potential":
                 focus_reason = f" High growth potential indicators align with your Growth Potential focus."
             
             insights.append({
                 'type': 'opportunity',
-                'country': market.get('country_code', 'Unknown'),
-                'title': f"High Opportunity Market: {market_name}",
-                'message': f"Market attractiveness score: {market['market_attractiveness_score']:.1f}/100. Strong fundamentals (${market.get('gdp_per_capita_ppp', 0):,.0f} GDP per capita PPP).{focus_reason}"
+                'country': codes[position],
+                'title': f"High Opportunity Market: {names[position]}",
+                'message': f"Market attractiveness score: {scores[position]:.1f}/100. Strong fundamentals (${gdp[position]:,.0f} GDP per capita PPP).{focus_reason}"
             })
         
         # Digital readiness insights
-        digital_ready = combined_data[combined_data['internet_users_pct'] > 70]
-        if not digital_ready.empty:
-            # Safe access to country codes
-            digital_countries = [market.get('country_code', 'Unknown') for _, market in digital_ready.iterrows()]
-            digital_countries = [c for c in digital_countries if c != 'Unknown']
-            
-            if digital_countries:
-                focus_note = " (Especially relevant for your Digital Readiness focus)" if analysis_focus == "Digital Readiness" else ""
-                insights.append({
-                    'type': 'opportunity',
-                    'country': 'multiple',
-                    'title': f"Digital-Ready Markets ({len(digital_ready)} countries)",
-                    'message': f"Markets with >70% internet penetration: {', '.join(digital_countries)}. These markets show strong foundation for digital commerce adoption.{focus_note}"
-                })
+        if digital_ready_mask.any():
+            focus_note = " (Especially relevant for your Digital Readiness focus)" if analysis_focus == "Digital Readiness" else ""
+            insights.append({
+                'type': 'opportunity',
+                'country': 'multiple',
+                'title': f"Digital-Ready Markets ({digital_ready_mask.sum()} countries)",
+                'message': f"Markets with >70% internet penetration: {', '.join(codes[digital_ready_mask])}. These markets show strong foundation for digital commerce adoption.{focus_note}"
+            })
         
         # Risk warnings based on governance
-        high_risk = combined_data[
-            (combined_data.get('rule_of_law', 0) < -0.5) | 
-            (combined_data.get('logistics_performance', 3) < 2.5)
-        ]
-        for _, market in high_risk.iterrows():
-            # Safe access to market identifiers with fallback
-            market_name = market.get('name', market.get('country_code', 'Unknown Market'))
-            market_code = market.get('country_code', 'Unknown')
-            
-            focus_impact = ""
-            if analysis_focus == "Ease of Entry":
-                focus_impact = " This is particularly important given your Ease of Entry focus."
-            
+        focus_impact = " This is particularly important given your Ease of Entry focus." if analysis_focus == "Ease of Entry" else ""
+        for position in np.flatnonzero(high_risk_mask):
             insights.append({
                 'type': 'warning',
-                'country': market_code,
-                'title': f"Expansion Risk: {market_name}",
-                'message': f"Consider additional due diligence. Logistics performance: {market.get('logistics_performance', 0):.2f}/5, Rule of law: {market.get('rule_of_law', 0):.2f} (scale -2.5 to 2.5).{focus_impact}"
+                'country': codes[position],
+                'title': f"Expansion Risk: {names[position]}",
+                'message': f"Consider additional due diligence. Logistics performance: {logistics[position]:.2f}/5, Rule of law: {rule_of_law[position]:.2f} (scale -2.5 to 2.5).{focus_impact}"
             })
         
         # Risk tolerance specific advice
         if risk_tolerance == "Conservative":
-            stable_markets = combined_data[combined_data.get('rule_of_law', 0) > 1.0]
-            if not stable_markets.empty:
-                # Safe access to country codes
-                stable_countries = [market.get('country_code', 'Unknown') for _, market in stable_markets.iterrows()]
-                stable_countries = [c for c in stable_countries if c != 'Unknown']  # Filter out unknowns
-                
-                if stable_countries:
-                    insights.append({
-                        'type': 'recommendation',
-                        'country': 'strategy',
-                        'title': "Conservative Strategy Recommendation",
-                        'message': f"Focus on stable, high-governance markets: {', '.join(stable_countries)}. These markets offer lower regulatory risk and established business environments, perfect for your conservative approach."
-                    })
+            stable_mask = flags[:, FLAG_STABLE]
+            if stable_mask.any():
+                insights.append({
+                    'type': 'recommendation',
+                    'country': 'strategy',
+                    'title': "Conservative Strategy Recommendation",
+                    'message': f"Focus on stable, high-governance markets: {', '.join(codes[stable_mask])}. These markets offer lower regulatory risk and established business environments, perfect for your conservative approach."
+                })
         elif risk_tolerance == "Aggressive":
-            emerging_markets = combined_data[combined_data.get('gdp_per_capita_ppp', 0) < 20000]
-            if not emerging_markets.empty:
-                # Safe access to top emerging markets
-                top_emerging = emerging_markets.nlargest(3, 'market_attractiveness_score')
-                emerging_countries = [market.get('country_code', 'Unknown') for _, market in top_emerging.iterrows()]
-                emerging_countries = [c for c in emerging_countries if c != 'Unknown']  # Filter out unknowns
-                
-                if emerging_countries:
-                    insights.append({
-                        'type': 'recommendation',
-                        'country': 'strategy',
-                        'title': "Aggressive Strategy Opportunity",
-                        'message': f"Consider high-growth emerging markets: {', '.join(emerging_countries)}. Higher risk but potentially significant first-mover advantages, matching your aggressive risk tolerance."
-                    })
+            emerging_positions = np.flatnonzero(flags[:, FLAG_EMERGING])
+            top_emerging = emerging_positions[ExpansionAnalyzer._top_positions(scores[emerging_positions], 3)]
+            if top_emerging.size:
+                insights.append({
+                    'type': 'recommendation',
+                    'country': 'strategy',
+                    'title': "Aggressive Strategy Opportunity",
+                    'message': f"Consider high-growth emerging markets: {', '.join(codes[top_emerging])}. Higher risk but potentially significant first-mover advantages, matching your aggressive risk tolerance."
+                })
         
         return insights[:15]  # Limit to top 15 insights
 
@@ -978,6 +1049,189 @@ def create_section_header(title: str, description: str, help_text: str = None):
     # Always show the description
     st.markdown(f"<div class='section-description'>{description}</div>", unsafe_allow_html=True)
 
+WORLD_BANK_STATUS_URL = "https://api.worldbank.org/v2/country?format=json&per_page=1"
+API_STATUS_TTL = 60  # Seconds a connectivity check is reused across reruns
+
+def probe_world_bank(timeout: float) -> Optional[int]:
+    """Status code of a single World Bank request, or None if the API can't be reached.
+    
+    Deliberately a plain requests.get: the shared session's retries and backoff
+    would hold up the page for several seconds whenever the API is down.
+    """
+    try:
+        return requests.get(WORLD_BANK_STATUS_URL, timeout=timeout).status_code
+    except requests.RequestException:
+        return None
+
+def api_status_is_fresh() -> bool:
+    """Whether this session checked World Bank connectivity within API_STATUS_TTL"""
+    checked = st.session_state.get('api_status')
+    return checked is not None and time.time() - checked[1] < API_STATUS_TTL
+
+def get_api_status() -> Optional[int]:
+    """Status code from the session's last connectivity check (None if unreachable)"""
+    checked = st.session_state.get('api_status')
+    return checked[0] if checked else None
+
+def get_session_countries() -> pd.DataFrame:
+    """Return the country reference table, fetched once and shared via session state"""
+    if 'countries_df' not in st.session_state:
+        st.session_state['countries_df'] = WorldBankExpansionAPI.get_countries()
+    return st.session_state['countries_df']
+
+def get_country_lookup() -> Dict[str, Dict[str, str]]:
+    """Return code -> name and code -> region dicts for the session's country table"""
+    if 'country_lookup' not in st.session_state:
+        countries_df = get_session_countries()
+        st.session_state['country_lookup'] = {
+            column: dict(zip(countries_df['code'], countries_df[column]))
+            for column in ('name', 'region')
+        }
+    return st.session_state['country_lookup']
+
+def add_country_names(df: pd.DataFrame) -> pd.DataFrame:
+    """Attach country name and region columns by looking up country_code"""
+    lookup = get_country_lookup()
+    return df.assign(
+        name=df['country_code'].map(lookup['name']),
+        region=df['country_code'].map(lookup['region'])
+    )
+
+def in_selection_order(df: pd.DataFrame, countries: List[str]) -> pd.DataFrame:
+    """Reorder rows fetched under a sorted cache key back into the user's selection order"""
+    position = {code: i for i, code in enumerate(countries)}
+    order = np.argsort(df['country_code'].map(position).to_numpy(dtype=np.float64), kind='stable')
+    return df.iloc[order].reset_index(drop=True)
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def load_market_data(countries: Tuple[str, ...], category: str, business_type: str,
+                     risk_tolerance: str, analysis_focus: str) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """Fetch market data and attractiveness scores once per configuration"""
+    market_data = WorldBankExpansionAPI.get_category_specific_data(countries, category)
+    scored_data = ExpansionAnalyzer.calculate_market_attractiveness_score(
+        market_data,
+        category,
+        business_type,
+        risk_tolerance,
+        analysis_focus
+    )
+    return market_data, scored_data
+
+def get_market_tables(config) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """Market data and scores for the sidebar configuration, in selection order with country names"""
+    if not config['countries']:
+        return pd.DataFrame(), pd.DataFrame()
+    # Sorted key so reordering the selection reuses the cached result
+    tables = load_market_data(
+        tuple(sorted(config['countries'])),
+        config['product_category'],
+        config['business_type'],
+        config['risk_tolerance'],
+        config['analysis_focus']
+    )
+    market_data, scored_data = (
+        add_country_names(in_selection_order(table, config['countries'])) for table in tables
+    )
+    return market_data, scored_data
+
+def get_governance_table(config) -> pd.DataFrame:
+    """Governance indicators for the selected countries; independent of the market fetch and scoring"""
+    if not config['countries']:
+        return pd.DataFrame()
+    governance_data = WorldBankExpansionAPI.get_governance_indicators(tuple(sorted(config['countries'])))
+    return add_country_names(in_selection_order(governance_data, config['countries']))
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def build_attractiveness_chart(scored_data: pd.DataFrame, title: str) -> go.Figure:
+    """Build the horizontal market attractiveness ranking bar chart"""
+    fig = px.bar(
+        scored_data.sort_values('market_attractiveness_score', ascending=True),
+        x='market_attractiveness_score',
+        y='name',
+        orientation='h',
+        title=title,
+        color='market_attractiveness_score',
+        color_continuous_scale='Viridis',
+        hover_data=['region']
+    )
+    fig.update_layout(height=400, showlegend=False)
+    return fig
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def build_performance_matrix(scored_data: pd.DataFrame) -> Tuple[go.Figure, go.Figure]:
+    """Build the economic vs digital and market size vs attractiveness scatter plots"""
+    fig1 = px.scatter(
+        scored_data,
+        x='gdp_per_capita_ppp',
+        y='internet_users_pct',
+        size='population',
+        color='market_attractiveness_score',
+        hover_name='name',
+        title='Economic Power vs Digital Readiness',
+        labels={
+            'gdp_per_capita_ppp': 'GDP per Capita (PPP)',
+            'internet_users_pct': 'Internet Users (%)',
+            'market_attractiveness_score': 'Attractiveness Score'
+        }
+    )
+    
+    fig2 = px.scatter(
+        scored_data,
+        x='population',
+        y='market_attractiveness_score',
+        size='gdp_per_capita_ppp',
+        color='region',
+        hover_name='name',
+        title='Market Size vs Attractiveness',
+        labels={
+            'population': 'Population',
+            'market_attractiveness_score': 'Attractiveness Score'
+        }
+    )
+    # Use the correct plotly method for log scale
+    fig2.update_layout(xaxis_type="log")
+    return fig1, fig2
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def build_digital_infrastructure_chart(market_data: pd.DataFrame, digital_focus: bool) -> go.Figure:
+    """Build the internet vs mobile penetration scatter plot with quadrant lines"""
+    fig = px.scatter(
+        market_data,
+        x='internet_users_pct',
+        y='mobile_subscriptions',
+        size='population',
+        color='gdp_per_capita_ppp',
+        hover_name='name',
+        title='Digital Infrastructure Matrix',
+        labels={
+            'internet_users_pct': 'Internet Users (%)',
+            'mobile_subscriptions': 'Mobile Subscriptions (per 100)',
+            'gdp_per_capita_ppp': 'GDP per Capita (PPP)'
+        }
+    )
+    
+    mobile_line, internet_line = DIGITAL_QUADRANT_LINES[bool(digital_focus)]
+    fig.add_hline(**mobile_line)
+    fig.add_vline(**internet_line)
+    
+    fig.update_layout(height=400)
+    return fig
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def build_governance_heatmap(governance_data: pd.DataFrame) -> go.Figure:
+    """Build the governance indicator by country heatmap"""
+    fig = px.imshow(
+        governance_data[GOVERNANCE_COLUMNS].to_numpy().T,
+        x=governance_data['name'].tolist(),
+        y=GOVERNANCE_COLUMNS,
+        aspect="auto",
+        color_continuous_scale="RdYlGn",
+        title="Governance Quality Heatmap (Score: -2.5 to 2.5)",
+        labels=dict(x="Country", y="Governance Indicator", color="Score")
+    )
+    fig.update_layout(height=400)
+    return fig
+
 def render_sidebar():
     """Render enhanced sidebar controls for eCommerce expansion analysis"""
     st.sidebar.title("🛒 eCommerce Expansion Intelligence")
@@ -1022,7 +1276,7 @@ def render_sidebar():
     
     # Target Market Selection
     st.sidebar.subheader("🌎 Target Markets")
-    countries_df = WorldBankExpansionAPI.get_countries()
+    countries_df = get_session_countries()
     
     # Regional filters
     regions = countries_df['region'].unique()
@@ -1052,6 +1306,7 @@ def render_sidebar():
     
     # Country selection
     available_countries = filtered_countries['code'].tolist()
+    code_to_name = get_country_lookup()['name']
     default_countries = ['USA', 'DEU', 'GBR', 'FRA', 'CHN', 'JPN', 'KOR', 'SGP', 'BRA', 'IND']
     default_selection = [c for c in default_countries if c in available_countries][:8]
     
@@ -1059,7 +1314,7 @@ def render_sidebar():
         "Select Markets for Analysis",
         options=available_countries,
         default=default_selection,
-        format_func=lambda x: f"{x} - {filtered_countries[filtered_countries['code']==x]['name'].iloc[0] if len(filtered_countries[filtered_countries['code']==x]) > 0 else x}",
+        format_func=lambda x: f"{x} - {code_to_name.get(x, x)}",
         help="Choose specific countries for detailed analysis"
     )
     
@@ -1094,19 +1349,21 @@ def render_sidebar():
     # Summary of selections
     st.sidebar.markdown("---")
     
-    # Data source status
-    try:
-        test_response = requests.get("https://api.worldbank.org/v2/country?format=json&per_page=1", timeout=3)
-        if test_response.status_code == 200:
-            st.sidebar.success("🌐 Real World Bank Data")
-        else:
-            st.sidebar.warning("⚠️ Sample Data (API Issues)")
-    except:
+    # Data source status, from the connectivity check main() ran for this rerun
+    api_status = get_api_status()
+    if api_status == 200:
+        st.sidebar.success("🌐 Real World Bank Data")
+    elif api_status is not None:
+        st.sidebar.warning("⚠️ Sample Data (API Issues)")
+    else:
         st.sidebar.error("❌ Sample Data (No Connection)")
     
     # Clear cache button for refreshing data
     if st.sidebar.button("🔄 Refresh Data", help="Clear cache and fetch fresh data from World Bank API"):
         st.cache_data.clear()
+        st.session_state.pop('countries_df', None)
+        st.session_state.pop('country_lookup', None)
+        st.session_state.pop('api_status', None)
         st.rerun()
     
     st.sidebar.markdown("**📋 Current Analysis Setup:**")
@@ -1133,7 +1390,7 @@ def render_sidebar():
         'income_levels': income_levels
     }
 
-def render_market_overview(config):
+def render_market_overview(config, market_data: pd.DataFrame):
     """Render market overview with key metrics"""
     
     # Section header with description
@@ -1147,21 +1404,6 @@ def render_market_overview(config):
         st.info("👈 Please select target markets in the sidebar to see expansion analysis")
         return
     
-    # Load market data based on category
-    market_data = WorldBankExpansionAPI.get_category_specific_data(
-        config['countries'], 
-        config['product_category']
-    )
-    countries_df = WorldBankExpansionAPI.get_countries()
-    
-    # Merge with country names
-    market_data = market_data.merge(
-        countries_df[['code', 'name', 'region']], 
-        left_on='country_code', 
-        right_on='code', 
-        how='left'
-    )
-    
     if market_data.empty:
         st.warning("No market data available")
         return
@@ -1176,9 +1418,9 @@ def render_market_overview(config):
     st.markdown("### 📊 Market Metrics")
     with st.expander("🔍 See calculation details"):
         st.markdown("**Population Calculation:**")
-        for _, country in market_data.iterrows():
-            country_name = country.get('name', country['country_code'])
-            st.caption(f"• {country_name}: {country['population']:,.0f}")
+        country_names = market_data.get('name', market_data['country_code'])
+        for country_name, population in zip(country_names, market_data['population']):
+            st.caption(f"• {country_name}: {population:,.0f}")
         st.caption(f"**Total: {total_population:,.0f}**")
     
     # Display metrics
@@ -1264,7 +1506,7 @@ def render_market_overview(config):
     for insight in insights:
         st.markdown(insight)
 
-def render_market_analysis(config):
+def render_market_analysis(config, scored_data: pd.DataFrame):
     """Render detailed market analysis with category-specific scoring"""
     
     create_section_header(
@@ -1276,31 +1518,6 @@ def render_market_analysis(config):
     if not config['countries']:
         return
     
-    # Load and analyze data with category-specific focus
-    market_data = WorldBankExpansionAPI.get_category_specific_data(
-        config['countries'], 
-        config['product_category']
-    )
-    countries_df = WorldBankExpansionAPI.get_countries()
-    
-    # Calculate attractiveness scores with business type and risk considerations
-    analyzer = ExpansionAnalyzer()
-    scored_data = analyzer.calculate_market_attractiveness_score(
-        market_data, 
-        config['product_category'],
-        config['business_type'],
-        config['risk_tolerance'],
-        config['analysis_focus']  # Now actually using this parameter!
-    )
-    
-    # Merge with country names
-    scored_data = scored_data.merge(
-        countries_df[['code', 'name', 'region']], 
-        left_on='country_code', 
-        right_on='code', 
-        how='left'
-    )
-    
     if scored_data.empty:
         st.warning("No market data available")
         return
@@ -1363,38 +1580,27 @@ def render_market_analysis(config):
     
     with col1:
         # Market attractiveness ranking chart
-        fig = px.bar(
-            scored_data.sort_values('market_attractiveness_score', ascending=True),
-            x='market_attractiveness_score',
-            y='name',
-            orientation='h',
-            title=f'{config["product_category"]} Market Attractiveness Score (0-100)<br><sub>Focus: {config["analysis_focus"]} | Business: {config["business_type"]} | Risk: {config["risk_tolerance"]}</sub>',
-            color='market_attractiveness_score',
-            color_continuous_scale='Viridis',
-            hover_data=['region']
+        fig = build_attractiveness_chart(
+            scored_data,
+            f'{config["product_category"]} Market Attractiveness Score (0-100)<br><sub>Focus: {config["analysis_focus"]} | Business: {config["business_type"]} | Risk: {config["risk_tolerance"]}</sub>'
         )
-        fig.update_layout(height=400, showlegend=False)
         st.plotly_chart(fig, use_container_width=True)
     
     with col2:
         # Top markets summary with category context
         st.markdown("**🏆 Top Markets**")
         top_markets = scored_data.nlargest(5, 'market_attractiveness_score')
+        scores = top_markets['market_attractiveness_score'].to_numpy()
         
-        for i, (_, market) in enumerate(top_markets.iterrows(), 1):
-            score = market['market_attractiveness_score']
-            if score >= 80:
-                emoji = "🟢"
-                level = "Excellent"
-            elif score >= 60:
-                emoji = "🟡" 
-                level = "Good"
-            else:
-                emoji = "🔴"
-                level = "Fair"
-            
-            st.markdown(f"{i}. {emoji} **{market['name']}**")
-            st.caption(f"Score: {score:.1f}/100 ({level})")
+        # Label the whole list at once and render it as a single block
+        tiers = [scores >= 80, scores >= 60]
+        emojis = np.select(tiers, ["🟢", "🟡"], default="🔴")
+        levels = np.select(tiers, ["Excellent", "Good"], default="Fair")
+        
+        st.markdown("\n\n".join(
+            f"{i}. {emoji} **{name}**<br><span class='caption-text'>Score: {score:.1f}/100 ({level})</span>"
+            for i, (emoji, name, score, level) in enumerate(zip(emojis, top_markets['name'], scores, levels), 1)
+        ), unsafe_allow_html=True)
     
     # Show the actual weights being used
     st.markdown("### 📊 Active Scoring Weights")
@@ -1402,15 +1608,19 @@ def render_market_analysis(config):
     if hasattr(scored_data, 'attrs') and 'adjusted_weights' in scored_data.attrs:
         weights = scored_data.attrs['adjusted_weights']
         
+        # Sort once and reuse for the chart and the breakdown
+        weight_series = pd.Series(weights, dtype=np.float64).sort_values(ascending=False, kind='stable')
+        
         # Create weight comparison
         col1, col2 = st.columns(2)
         
         with col1:
             st.markdown("**Current Weights (Adjusted):**")
-            weights_df = pd.DataFrame([
-                {"Factor": factor.replace('_', ' ').title(), "Weight": f"{weight:.1%}", "Raw Weight": weight}
-                for factor, weight in sorted(weights.items(), key=lambda x: x[1], reverse=True)
-            ])
+            weights_df = pd.DataFrame({
+                "Factor": weight_series.index.str.replace('_', ' ').str.title(),
+                "Weight": weight_series.map('{:.1%}'.format).to_numpy(),
+                "Raw Weight": weight_series.to_numpy()
+            })
             
             fig_weights = px.bar(
                 weights_df,
@@ -1425,19 +1635,22 @@ def render_market_analysis(config):
         
         with col2:
             st.markdown("**Weight Breakdown:**")
-            for factor, weight in sorted(weights.items(), key=lambda x: x[1], reverse=True):
-                if factor in scored_data.columns:
-                    avg_value = scored_data[factor].mean()
-                    if factor.endswith('_pct'):
-                        st.caption(f"• **{factor.replace('_', ' ').title()}**: {avg_value:.1f}% (Weight: {weight:.1%})")
-                    elif factor == 'gdp_per_capita_ppp':
-                        st.caption(f"• **GDP per Capita (PPP)**: ${avg_value:,.0f} (Weight: {weight:.1%})")
-                    elif factor == 'logistics_performance':
-                        st.caption(f"• **Logistics Performance**: {avg_value:.2f}/5 (Weight: {weight:.1%})")
-                    elif factor == 'population':
-                        st.caption(f"• **Population**: {avg_value/1e6:.0f}M avg (Weight: {weight:.1%})")
-                    else:
-                        st.caption(f"• **{factor.replace('_', ' ').title()}**: {avg_value:,.0f} (Weight: {weight:.1%})")
+            present = [factor for factor in weight_series.index if factor in scored_data.columns]
+            averages = scored_data[present].mean()
+            breakdown = []
+            for factor in present:
+                avg_value, weight = averages[factor], weight_series[factor]
+                if factor.endswith('_pct'):
+                    breakdown.append(f"• **{factor.replace('_', ' ').title()}**: {avg_value:.1f}% (Weight: {weight:.1%})")
+                elif factor == 'gdp_per_capita_ppp':
+                    breakdown.append(f"• **GDP per Capita (PPP)**: ${avg_value:,.0f} (Weight: {weight:.1%})")
+                elif factor == 'logistics_performance':
+                    breakdown.append(f"• **Logistics Performance**: {avg_value:.2f}/5 (Weight: {weight:.1%})")
+                elif factor == 'population':
+                    breakdown.append(f"• **Population**: {avg_value/1e6:.0f}M avg (Weight: {weight:.1%})")
+                else:
+                    breakdown.append(f"• **{factor.replace('_', ' ').title()}**: {avg_value:,.0f} (Weight: {weight:.1%})")
+            st.caption("  \n".join(breakdown))
     
     # Performance matrix showing multiple dimensions
     st.markdown("### 🎯 Multi-Dimensional Performance Matrix")
@@ -1445,44 +1658,17 @@ def render_market_analysis(config):
     # Create a scatter plot matrix showing different performance dimensions
     col1, col2 = st.columns(2)
     
+    fig1, fig2 = build_performance_matrix(scored_data)
+    
     with col1:
         # Economic vs Digital readiness
-        fig1 = px.scatter(
-            scored_data,
-            x='gdp_per_capita_ppp',
-            y='internet_users_pct',
-            size='population',
-            color='market_attractiveness_score',
-            hover_name='name',
-            title='Economic Power vs Digital Readiness',
-            labels={
-                'gdp_per_capita_ppp': 'GDP per Capita (PPP)',
-                'internet_users_pct': 'Internet Users (%)',
-                'market_attractiveness_score': 'Attractiveness Score'
-            }
-        )
         st.plotly_chart(fig1, use_container_width=True)
     
     with col2:
-        # Market size vs attractiveness  
-        fig2 = px.scatter(
-            scored_data,
-            x='population',
-            y='market_attractiveness_score',
-            size='gdp_per_capita_ppp',
-            color='region',
-            hover_name='name',
-            title='Market Size vs Attractiveness',
-            labels={
-                'population': 'Population',
-                'market_attractiveness_score': 'Attractiveness Score'
-            }
-        )
-        # Use the correct plotly method for log scale
-        fig2.update_layout(xaxis_type="log")
+        # Market size vs attractiveness
         st.plotly_chart(fig2, use_container_width=True)
 
-def render_digital_readiness(config):
+def render_digital_readiness(config, market_data: pd.DataFrame):
     """Render digital readiness analysis"""
     
     create_section_header(
@@ -1494,20 +1680,6 @@ def render_digital_readiness(config):
     if not config['countries']:
         return
     
-    market_data = WorldBankExpansionAPI.get_category_specific_data(
-        config['countries'], 
-        config['product_category']
-    )
-    countries_df = WorldBankExpansionAPI.get_countries()
-    
-    # Merge with country names
-    market_data = market_data.merge(
-        countries_df[['code', 'name', 'region']], 
-        left_on='country_code', 
-        right_on='code', 
-        how='left'
-    )
-    
     # Show how analysis focus affects digital readiness assessment
     st.markdown("### 🎯 Digital Readiness Configuration")
     
@@ -1556,32 +1728,8 @@ def render_digital_readiness(config):
     col1, col2 = st.columns(2)
     
     with col1:
-        # Internet penetration vs Mobile subscriptions
-        fig = px.scatter(
-            market_data,
-            x='internet_users_pct',
-            y='mobile_subscriptions',
-            size='population',
-            color='gdp_per_capita_ppp',
-            hover_name='name',
-            title='Digital Infrastructure Matrix',
-            labels={
-                'internet_users_pct': 'Internet Users (%)',
-                'mobile_subscriptions': 'Mobile Subscriptions (per 100)',
-                'gdp_per_capita_ppp': 'GDP per Capita (PPP)'
-            }
-        )
-        
-        # Add quadrant lines based on analysis focus
-        if config['analysis_focus'] == "Digital Readiness":
-            # Higher thresholds for digital-focused analysis
-            fig.add_hline(y=120, line_dash="dash", line_color="red", annotation_text="High Mobile Penetration (120%)")
-            fig.add_vline(x=85, line_dash="dash", line_color="red", annotation_text="High Internet Penetration (85%)")
-        else:
-            fig.add_hline(y=100, line_dash="dash", line_color="gray", annotation_text="100% Mobile Penetration")
-            fig.add_vline(x=70, line_dash="dash", line_color="gray", annotation_text="70% Internet Penetration")
-        
-        fig.update_layout(height=400)
+        # Internet penetration vs Mobile subscriptions, with quadrant lines based on analysis focus
+        fig = build_digital_infrastructure_chart(market_data, config['analysis_focus'] == "Digital Readiness")
         st.plotly_chart(fig, use_container_width=True)
     
     with col2:
@@ -1589,84 +1737,40 @@ def render_digital_readiness(config):
         st.markdown("**📱 Digital Readiness Assessment**")
         
         # Calculate digital readiness score adjusted for business type AND analysis focus
-        if config['analysis_focus'] == "Digital Readiness":
-            # Much more demanding requirements when digital focus is selected
-            if config['business_type'] == 'B2B eCommerce':
-                market_data['digital_score'] = (
-                    market_data['internet_users_pct'] * 0.8 +  # Even higher weight
-                    np.minimum(market_data['mobile_subscriptions'], 150) * 0.2
-                )
-                readiness_context = "B2B + Digital Focus: Premium infrastructure requirements"
-                excellence_threshold = 95
-                good_threshold = 85
-            elif config['business_type'] == 'Marketplace':
-                market_data['digital_score'] = (
-                    market_data['internet_users_pct'] * 0.6 +
-                    np.minimum(market_data['mobile_subscriptions'], 150) * 0.4
-                )
-                readiness_context = "Marketplace + Digital Focus: High consumer adoption needs"
-                excellence_threshold = 90
-                good_threshold = 80
-            else:
-                market_data['digital_score'] = (
-                    market_data['internet_users_pct'] * 0.7 +
-                    np.minimum(market_data['mobile_subscriptions'], 150) * 0.3
-                )
-                readiness_context = "B2C + Digital Focus: Advanced consumer connectivity"
-                excellence_threshold = 92
-                good_threshold = 82
-        else:
-            # Standard requirements for other analysis focuses
-            if config['business_type'] == 'B2B eCommerce':
-                market_data['digital_score'] = (
-                    market_data['internet_users_pct'] * 0.7 +
-                    np.minimum(market_data['mobile_subscriptions'], 120) * 0.3
-                )
-                readiness_context = "B2B Focus: Infrastructure quality & business connectivity"
-                excellence_threshold = 85
-                good_threshold = 70
-            elif config['business_type'] == 'Marketplace':
-                market_data['digital_score'] = (
-                    market_data['internet_users_pct'] * 0.5 +
-                    np.minimum(market_data['mobile_subscriptions'], 120) * 0.5
-                )
-                readiness_context = "Marketplace Focus: Broad consumer digital adoption"
-                excellence_threshold = 80
-                good_threshold = 65
-            else:
-                market_data['digital_score'] = (
-                    market_data['internet_users_pct'] * 0.6 +
-                    np.minimum(market_data['mobile_subscriptions'], 120) * 0.4
-                )
-                readiness_context = "B2C Focus: Consumer digital adoption & mobile-first"
-                excellence_threshold = 82
-                good_threshold = 68
+        digital_focus = config['analysis_focus'] == "Digital Readiness"
+        profile = DIGITAL_READINESS_PROFILES.get(
+            (digital_focus, config['business_type']),
+            DIGITAL_READINESS_PROFILES[(digital_focus, None)]
+        )
+        digital_inputs = np.column_stack([
+            market_data['internet_users_pct'].to_numpy(dtype=np.float64),
+            np.minimum(market_data['mobile_subscriptions'].to_numpy(dtype=np.float64), profile['mobile_cap'])
+        ])
+        market_data['digital_score'] = digital_inputs @ np.array(profile['weights'])
+        readiness_context = profile['context']
+        excellence_threshold = profile['excellence_threshold']
+        good_threshold = profile['good_threshold']
         
         st.caption(readiness_context)
         
-        digital_ranked = market_data.nlargest(len(market_data), 'digital_score')
-        
-        for _, country in digital_ranked.iterrows():
-            score = country['digital_score']
-            if score >= excellence_threshold:
-                emoji = "🚀"
-                level = "Excellent"
-                advice = "Perfect for advanced digital commerce"
-            elif score >= good_threshold:
-                emoji = "✅"
-                level = "Good"
-                advice = "Strong foundation for eCommerce"
-            elif score >= 60:
-                emoji = "⚠️"
-                level = "Moderate"
-                advice = "Consider mobile-first approach"
-            else:
-                emoji = "❌"
-                level = "Low"
-                advice = "May need alternative access strategies"
-            
-            st.markdown(f"{emoji} **{country['name']}**: {score:.1f}/100")
-            st.caption(f"{level} - {advice}")
+        digital_ranked = market_data.dropna(subset=['digital_score']).sort_values(
+            'digital_score', ascending=False, kind='stable'
+        )
+        scores = digital_ranked['digital_score'].to_numpy()
+        
+        # Label every market at once and render the ranking as a single block
+        tiers = [scores >= excellence_threshold, scores >= good_threshold, scores >= 60]
+        emojis = np.select(tiers, ["🚀", "✅", "⚠️"], default="❌")
+        assessments = np.select(tiers, [
+            "Excellent - Perfect for advanced digital commerce",
+            "Good - Strong foundation for eCommerce",
+            "Moderate - Consider mobile-first approach"
+        ], default="Low - May need alternative access strategies")
+        
+        st.markdown("\n\n".join(
+            f"{emoji} **{name}**: {score:.1f}/100<br><span class='caption-text'>{assessment}</span>"
+            for emoji, name, score, assessment in zip(emojis, digital_ranked['name'], scores, assessments)
+        ), unsafe_allow_html=True)
     
     # Detailed digital infrastructure breakdown
     st.markdown("### 🔍 Infrastructure Deep Dive")
@@ -1683,24 +1787,28 @@ def render_digital_readiness(config):
                 threshold = 85 if config['analysis_focus'] == "Digital Readiness" else 75
                 internet_leaders = market_data[market_data['internet_users_pct'] >= threshold]
                 if not internet_leaders.empty:
-                    for _, country in internet_leaders.nlargest(3, 'internet_users_pct').iterrows():
-                        st.success(f"• {country['name']}: {country['internet_users_pct']:.1f}%")
+                    top = internet_leaders.nlargest(3, 'internet_users_pct')
+                    for name, value in zip(top['name'], top['internet_users_pct']):
+                        st.success(f"• {name}: {value:.1f}%")
                 else:
                     st.warning("No markets meet high digital standards")
-                    for _, country in market_data.nlargest(3, 'internet_users_pct').iterrows():
-                        st.caption(f"• {country['name']}: {country['internet_users_pct']:.1f}%")
+                    top = market_data.nlargest(3, 'internet_users_pct')
+                    for name, value in zip(top['name'], top['internet_users_pct']):
+                        st.caption(f"• {name}: {value:.1f}%")
             
             with col2:
                 st.markdown("**📱 Mobile Adoption Leaders**")
                 threshold = 120 if config['analysis_focus'] == "Digital Readiness" else 100
                 mobile_leaders = market_data[market_data['mobile_subscriptions'] >= threshold]
                 if not mobile_leaders.empty:
-                    for _, country in mobile_leaders.nlargest(3, 'mobile_subscriptions').iterrows():
-                        st.success(f"• {country['name']}: {country['mobile_subscriptions']:.0f} per 100")
+                    top = mobile_leaders.nlargest(3, 'mobile_subscriptions')
+                    for name, value in zip(top['name'], top['mobile_subscriptions']):
+                        st.success(f"• {name}: {value:.0f} per 100")
                 else:
                     st.warning("No markets meet high mobile standards")
-                    for _, country in market_data.nlargest(3, 'mobile_subscriptions').iterrows():
-                        st.caption(f"• {country['name']}: {country['mobile_subscriptions']:.0f} per 100")
+                    top = market_data.nlargest(3, 'mobile_subscriptions')
+                    for name, value in zip(top['name'], top['mobile_subscriptions']):
+                        st.caption(f"• {name}: {value:.0f} per 100")
             
             with col3:
                 st.markdown("**⚡ Digital Growth Opportunities**")
@@ -1718,15 +1826,15 @@ def render_digital_readiness(config):
                     ]
                 
                 if not growth_opportunities.empty:
-                    for _, country in growth_opportunities.head(3).iterrows():
-                        st.caption(f"• {country['name']}: High GDP, growing digital")
+                    for name in growth_opportunities['name'].head(3):
+                        st.caption(f"• {name}: High GDP, growing digital")
                 else:
                     if config['analysis_focus'] == "Digital Readiness":
                         st.success("All wealthy markets have excellent digital adoption!")
                     else:
                         st.caption("All high-GDP markets have strong digital adoption")
 
-def render_business_environment(config):
+def render_business_environment(config, governance_data: pd.DataFrame):
     """Render business environment and regulatory analysis"""
     
     create_section_header(
@@ -1738,83 +1846,40 @@ def render_business_environment(config):
     if not config['countries']:
         return
     
-    # Load governance data
-    governance_data = WorldBankExpansionAPI.get_governance_indicators(config['countries'])
-    countries_df = WorldBankExpansionAPI.get_countries()
-    
-    # Merge with country names
-    governance_data = governance_data.merge(
-        countries_df[['code', 'name', 'region']], 
-        left_on='country_code', 
-        right_on='code', 
-        how='left'
-    )
-    
     col1, col2 = st.columns(2)
     
     with col1:
         # Governance indicators heatmap
-        governance_metrics = governance_data.set_index('name')[
-            ['regulatory_quality', 'rule_of_law', 'control_corruption', 'govt_effectiveness']
-        ]
-        
-        fig = px.imshow(
-            governance_metrics.T,
-            aspect="auto",
-            color_continuous_scale="RdYlGn",
-            title="Governance Quality Heatmap (Score: -2.5 to 2.5)",
-            labels=dict(x="Country", y="Governance Indicator", color="Score")
+        st.plotly_chart(
+            build_governance_heatmap(governance_data[['name'] + GOVERNANCE_COLUMNS]),
+            use_container_width=True,
+            config=STATIC_CHART_CONFIG
         )
-        fig.update_layout(height=400)
-        st.plotly_chart(fig, use_container_width=True)
     
     with col2:
         # Business environment risk assessment with business type context
         st.markdown("**⚖️ Regulatory Risk Assessment**")
         st.caption(f"Risk tolerance: {config['risk_tolerance']} | Business type: {config['business_type']}")
         
-        for _, country in governance_data.iterrows():
-            # Calculate overall governance score
-            gov_score = (country['regulatory_quality'] + country['rule_of_law'] + 
-                        country['control_corruption'] + country['govt_effectiveness']) / 4
-            
-            # Adjust risk tolerance based on user preference
-            if config['risk_tolerance'] == 'Conservative':
-                risk_threshold_high = 0.5
-                risk_threshold_low = -0.5
-            elif config['risk_tolerance'] == 'Moderate':
-                risk_threshold_high = 0.0
-                risk_threshold_low = -1.0
-            else:  # Aggressive
-                risk_threshold_high = -0.5
-                risk_threshold_low = -1.5
-            
-            # Determine risk level based on user's tolerance
-            if gov_score >= risk_threshold_high:
-                risk_level = "Acceptable Risk"
-                emoji = "🟢"
-                color = "green"
-            elif gov_score >= risk_threshold_low:
-                risk_level = "Moderate Risk"
-                emoji = "🟡"
-                color = "orange"
-            else:
-                risk_level = "High Risk"
-                emoji = "🔴"
-                color = "red"
-            
-            # Business type specific advice
-            if config['business_type'] == 'B2B eCommerce' and gov_score < 0.0:
-                advice = "Consider local business partnerships"
-            elif config['business_type'] == 'Marketplace' and gov_score < -0.5:
-                advice = "May need extensive legal compliance"
-            elif config['business_type'] == 'SaaS Platform' and gov_score < 0.0:
-                advice = "Focus on data protection compliance"
-            else:
-                advice = "Standard compliance procedures"
-            
-            st.markdown(f"{emoji} **{country['name']}**: {risk_level}")
-            st.caption(f"Score: {gov_score:.2f} - {advice}")
+        # Score and classify every country at once against the user's risk tolerance
+        gov_scores = governance_data[GOVERNANCE_COLUMNS].mean(axis=1, skipna=False).to_numpy()
+        risk_threshold_high, risk_threshold_low = RISK_THRESHOLDS.get(
+            config['risk_tolerance'], RISK_THRESHOLDS['Aggressive']
+        )
+        tiers = [gov_scores >= risk_threshold_high, gov_scores >= risk_threshold_low]
+        emojis = np.select(tiers, ["🟢", "🟡"], default="🔴")
+        risk_levels = np.select(tiers, ["Acceptable Risk", "Moderate Risk"], default="High Risk")
+        
+        # Business type specific advice
+        advice_threshold, advice_text = COMPLIANCE_ADVICE.get(config['business_type'], (-np.inf, ""))
+        advice = np.where(gov_scores < advice_threshold, advice_text, "Standard compliance procedures")
+        
+        st.markdown("\n\n".join(
+            f"{emoji} **{name}**: {risk_level}<br><span class='caption-text'>Score: {gov_score:.2f} - {country_advice}</span>"
+            for emoji, name, risk_level, gov_score, country_advice in zip(
+                emojis, governance_data['name'], risk_levels, gov_scores, advice
+            )
+        ), unsafe_allow_html=True)
     
     # Detailed governance breakdown
     st.markdown("### 📊 Governance Component Analysis")
@@ -1822,29 +1887,18 @@ def render_business_environment(config):
     # Show specific governance strengths and concerns
     col1, col2, col3, col4 = st.columns(4)
     
-    with col1:
-        st.markdown("**⚖️ Rule of Law**")
-        rule_of_law_ranked = governance_data.nlargest(3, 'rule_of_law')
-        for _, country in rule_of_law_ranked.iterrows():
-            st.caption(f"• {country['name']}: {country['rule_of_law']:.2f}")
-    
-    with col2:
-        st.markdown("**📋 Regulatory Quality**")
-        reg_quality_ranked = governance_data.nlargest(3, 'regulatory_quality')
-        for _, country in reg_quality_ranked.iterrows():
-            st.caption(f"• {country['name']}: {country['regulatory_quality']:.2f}")
-    
-    with col3:
-        st.markdown("**🛡️ Corruption Control**")
-        corruption_ranked = governance_data.nlargest(3, 'control_corruption')
-        for _, country in corruption_ranked.iterrows():
-            st.caption(f"• {country['name']}: {country['control_corruption']:.2f}")
-    
-    with col4:
-        st.markdown("**⚙️ Government Effectiveness**")
-        effectiveness_ranked = governance_data.nlargest(3, 'govt_effectiveness')
-        for _, country in effectiveness_ranked.iterrows():
-            st.caption(f"• {country['name']}: {country['govt_effectiveness']:.2f}")
+    component_headers = {
+        'rule_of_law': "**⚖️ Rule of Law**",
+        'regulatory_quality': "**📋 Regulatory Quality**",
+        'control_corruption': "**🛡️ Corruption Control**",
+        'govt_effectiveness': "**⚙️ Government Effectiveness**"
+    }
+    for column, (metric, header) in zip((col1, col2, col3, col4), component_headers.items()):
+        with column:
+            st.markdown(header)
+            ranked = governance_data.nlargest(3, metric)
+            for name, value in zip(ranked['name'], ranked[metric]):
+                st.caption(f"• {name}: {value:.2f}")
     
     # Business-specific regulatory considerations
     st.markdown("### 🎯 Business-Specific Regulatory Considerations")
@@ -1862,85 +1916,49 @@ def render_business_environment(config):
         
         with col2:
             st.markdown("**Recommended Market Entry Approach:**")
-            if config['risk_tolerance'] == 'Conservative':
-                st.caption("• Start with highest governance score markets")
-                st.caption("• Establish legal entity and compliance first")
-                st.caption("• Partner with local legal experts")
-            elif config['risk_tolerance'] == 'Moderate':
-                st.caption("• Balance opportunity vs governance quality")
-                st.caption("• Phased approach for moderate-risk markets")
-                st.caption("• Monitor regulatory changes closely")
-            else:  # Aggressive
-                st.caption("• Consider first-mover advantages")
-                st.caption("• Prepare for regulatory uncertainty")
-                st.caption("• Maintain operational flexibility")
+            approach = ENTRY_APPROACH.get(config['risk_tolerance'], ENTRY_APPROACH['Aggressive'])
+            st.caption("  \n".join(f"• {step}" for step in approach))
 
-def render_expansion_insights(config):
+def render_expansion_insights(config, scored_data: pd.DataFrame, governance_data: pd.DataFrame):
     """Render AI-powered expansion insights and recommendations"""
+    product_category = config['product_category']
+    business_type = config['business_type']
+    risk_tolerance = config['risk_tolerance']
+    analysis_focus = config['analysis_focus']
     
     create_section_header(
         "🎯 Strategic Expansion Insights & Recommendations",
-        f"AI-powered strategic recommendations tailored for {config['product_category']} {config['business_type']} expansion. Comprehensive analysis synthesizing market data, risk assessment, and industry best practices.",
-        f"This section synthesizes all market intelligence to provide actionable expansion strategies specifically designed for your business profile. Our AI analysis combines market attractiveness scores, digital readiness assessments, regulatory risk evaluations, and industry benchmarks to generate personalized recommendations. The insights are calibrated for {config['business_type']} operations in the {config['product_category']} sector, considering your {config['risk_tolerance'].lower()} risk tolerance and focus on {config['analysis_focus'].lower()}. Each recommendation includes specific rationale, implementation considerations, and success metrics to guide your expansion planning and resource allocation decisions."
+        f"AI-powered strategic recommendations tailored for {product_category} {business_type} expansion. Comprehensive analysis synthesizing market data, risk assessment, and industry best practices.",
+        f"This section synthesizes all market intelligence to provide actionable expansion strategies specifically designed for your business profile. Our AI analysis combines market attractiveness scores, digital readiness assessments, regulatory risk evaluations, and industry benchmarks to generate personalized recommendations. The insights are calibrated for {business_type} operations in the {product_category} sector, considering your {risk_tolerance.lower()} risk tolerance and focus on {analysis_focus.lower()}. Each recommendation includes specific rationale, implementation considerations, and success metrics to guide your expansion planning and resource allocation decisions."
     )
     
     if not config['countries']:
         st.info("Select target markets to see expansion insights")
         return
     
-    # Load data
-    market_data = WorldBankExpansionAPI.get_category_specific_data(
-        config['countries'], 
-        config['product_category']
-    )
-    governance_data = WorldBankExpansionAPI.get_governance_indicators(config['countries'])
-    countries_df = WorldBankExpansionAPI.get_countries()
-    
-    # Calculate scores
-    analyzer = ExpansionAnalyzer()
-    scored_data = analyzer.calculate_market_attractiveness_score(
-        market_data, 
-        config['product_category'],
-        config['business_type'],
-        config['risk_tolerance'],
-        config['analysis_focus']  # Now using analysis focus
-    )
-    
-    # Merge with country names BEFORE generating insights
-    scored_data = scored_data.merge(
-        countries_df[['code', 'name', 'region']], 
-        left_on='country_code', 
-        right_on='code', 
-        how='left'
-    )
-    
-    # Also merge governance data with country names
-    governance_data = governance_data.merge(
-        countries_df[['code', 'name', 'region']], 
-        left_on='country_code', 
-        right_on='code', 
-        how='left'
-    )
-    
     # Generate insights
+    analyzer = ExpansionAnalyzer()
     insights = analyzer.generate_expansion_insights(
         scored_data, 
         governance_data,
-        config['product_category'],
-        config['business_type'],
-        config['risk_tolerance'],
-        config['analysis_focus']  # Now passing analysis focus
+        product_category,
+        business_type,
+        risk_tolerance,
+        analysis_focus
     )
     
     if not insights:
         st.warning("No insights available for selected markets")
         return
     
-    # Display insights by type
-    opportunities = [i for i in insights if i['type'] == 'opportunity']
-    warnings = [i for i in insights if i['type'] == 'warning']
-    recommendations = [i for i in insights if i['type'] == 'recommendation']
-    info_insights = [i for i in insights if i['type'] == 'info']
+    # Display insights by type, partitioned in a single pass
+    insights_by_type = defaultdict(list)
+    for insight in insights:
+        insights_by_type[insight['type']].append(insight)
+    opportunities = insights_by_type['opportunity']
+    warnings = insights_by_type['warning']
+    recommendations = insights_by_type['recommendation']
+    info_insights = insights_by_type['info']
     
     # Show strategy context first
     if info_insights:
@@ -1950,36 +1968,31 @@ def render_expansion_insights(config):
     
     if opportunities:
         st.markdown("### 🚀 Market Opportunities")
-        for insight in opportunities:
-            st.markdown(f"<div class='expansion-insight'><strong>{insight['title']}</strong><br>{insight['message']}</div>", 
-                       unsafe_allow_html=True)
+        st.markdown("\n".join(
+            INSIGHT_HTML.format(css_class='expansion-insight', title=insight['title'], message=insight['message'])
+            for insight in opportunities
+        ), unsafe_allow_html=True)
     
     if recommendations:
         st.markdown("### 💡 Strategic Recommendations")
-        for insight in recommendations:
-            st.markdown(f"<div class='expansion-insight'><strong>{insight['title']}</strong><br>{insight['message']}</div>", 
-                       unsafe_allow_html=True)
+        st.markdown("\n".join(
+            INSIGHT_HTML.format(css_class='expansion-insight', title=insight['title'], message=insight['message'])
+            for insight in recommendations
+        ), unsafe_allow_html=True)
     
     if warnings:
         st.markdown("### ⚠️ Important Considerations")
-        for insight in warnings:
-            st.markdown(f"<div class='warning-insight'><strong>{insight['title']}</strong><br>{insight['message']}</div>", 
-                       unsafe_allow_html=True)
+        st.markdown("\n".join(
+            INSIGHT_HTML.format(css_class='warning-insight', title=insight['title'], message=insight['message'])
+            for insight in warnings
+        ), unsafe_allow_html=True)
     
     # Enhanced strategic recommendations
     st.markdown("### 📈 Expansion Timeline & Strategy")
     
     # Create expansion timeline based on user preferences
-    timeline_data = []
     top_markets = scored_data.nlargest(4, 'market_attractiveness_score')
-    
-    phase_duration = {
-        "Conservative": {"phase1": "6-12 months", "phase2": "12-18 months", "phase3": "18-24 months"},
-        "Moderate": {"phase1": "3-6 months", "phase2": "6-12 months", "phase3": "12-18 months"}, 
-        "Aggressive": {"phase1": "2-4 months", "phase2": "4-8 months", "phase3": "8-12 months"}
-    }
-    
-    duration = phase_duration[config['risk_tolerance']]
+    duration = EXPANSION_PHASE_DURATION[risk_tolerance]
     
     col1, col2, col3 = st.columns(3)
     
@@ -1988,10 +2001,9 @@ def render_expansion_insights(config):
         st.markdown(f"*Timeline: {duration['phase1']}*")
         
         phase1_markets = top_markets.head(2)
-        for _, market in phase1_markets.iterrows():
-            score = market['market_attractiveness_score']
-            # Use country code as fallback if name is missing
-            market_name = market.get('name', market.get('country_code', 'Unknown'))
+        # Use country code as fallback if name is missing
+        market_names = phase1_markets.get('name', phase1_markets['country_code'])
+        for market_name, score in zip(market_names, phase1_markets['market_attractiveness_score']):
             st.markdown(f"• **{market_name}** (Score: {score:.1f}/100)")
         
         st.caption("Focus on highest-scoring markets with established infrastructure")
@@ -2001,10 +2013,9 @@ def render_expansion_insights(config):
         st.markdown(f"*Timeline: {duration['phase2']}*")
         
         phase2_markets = top_markets.iloc[2:4] if len(top_markets) > 2 else top_markets.tail(1)
-        for _, market in phase2_markets.iterrows():
-            score = market['market_attractiveness_score']
-            # Use country code as fallback if name is missing
-            market_name = market.get('name', market.get('country_code', 'Unknown'))
+        # Use country code as fallback if name is missing
+        market_names = phase2_markets.get('name', phase2_markets['country_code'])
+        for market_name, score in zip(market_names, phase2_markets['market_attractiveness_score']):
             st.markdown(f"• **{market_name}** (Score: {score:.1f}/100)")
         
         st.caption("Leverage learnings from Phase 1 for these markets")
@@ -2020,24 +2031,15 @@ def render_expansion_insights(config):
     # Implementation roadmap
     st.markdown("### 🗺️ Implementation Roadmap")
     
-    if config['business_type'] in BUSINESS_TYPE_CONFIG:
-        business_config = BUSINESS_TYPE_CONFIG[config['business_type']]
+    if business_type in BUSINESS_TYPE_CONFIG:
+        business_config = BUSINESS_TYPE_CONFIG[business_type]
         success_metrics = business_config['success_metrics']
         
         col1, col2 = st.columns(2)
         
         with col1:
             st.markdown("**📋 Implementation Checklist:**")
-            implementation_steps = [
-                "Market entry legal requirements research",
-                "Local partnership and vendor identification", 
-                "Digital infrastructure and payment setup",
-                "Compliance and regulatory approval process",
-                "Local marketing and customer acquisition strategy",
-                "Operations and customer support localization"
-            ]
-            
-            for step in implementation_steps:
+            for step in IMPLEMENTATION_STEPS:
                 st.caption(f"• {step}")
         
         with col2:
@@ -2046,14 +2048,109 @@ def render_expansion_insights(config):
                 st.caption(f"• {metric}")
             
             st.markdown("**🎯 Performance Benchmarks:**")
-            if config['business_type'] == 'B2C eCommerce':
-                st.caption("• Month 1-3: Market setup and initial traffic")
-                st.caption("• Month 4-6: Customer acquisition and retention")
-                st.caption("• Month 7-12: Revenue growth and profitability")
-            elif config['business_type'] == 'B2B eCommerce':
-                st.caption("• Month 1-6: Business partnership development")
-                st.caption("• Month 7-12: Client acquisition and contract value")
-                st.caption("• Year 2+: Market share and expansion")
+            for benchmark in PERFORMANCE_BENCHMARKS.get(business_type, []):
+                st.caption(f"• {benchmark}")
+
+def _active_changes_html(changes: List[str]) -> str:
+    """Build the 'Active Changes' block shown under a live configuration setting"""
+    items = "<br>".join(f"• {change}" for change in changes)
+    return f"<p>🔄 <strong>Active Changes:</strong></p><div class='caption-text'>{items}</div>"
+
+# Live Configuration Impact blocks, keyed by setting and then by selected value.
+# Built once so each rerun emits a single markdown element per column.
+LIVE_IMPACT_HTML = {
+    'business_type': {
+        "B2B eCommerce": _active_changes_html([
+            "Logistics scores boosted +150%",
+            "Business environment prioritized",
+            "Consumer metrics reduced -50%"
+        ]),
+        "Marketplace": _active_changes_html([
+            "Population size heavily weighted",
+            "Digital adoption boosted +150%",
+            "Urban markets prioritized"
+        ]),
+        "SaaS Platform": _active_changes_html([
+            "Tech infrastructure emphasized",
+            "Internet penetration boosted +100%",
+            "Education factors weighted higher"
+        ])
+    },
+    'analysis_focus': {
+        "Market Size": _active_changes_html([
+            "Population weighted 40%",
+            "Consumer spending doubled",
+            "Large markets prioritized"
+        ]),
+        "Digital Readiness": _active_changes_html([
+            "Internet penetration tripled",
+            "Mobile adoption boosted 2.5x",
+            "Tech infrastructure critical"
+        ]),
+        "Ease of Entry": _active_changes_html([
+            "Logistics performance tripled",
+            "Regulatory quality emphasized",
+            "Business environment prioritized"
+        ]),
+        "Growth Potential": _active_changes_html([
+            "Emerging markets boosted",
+            "Urbanization doubled",
+            "Development indicators prioritized"
+        ])
+    },
+    'risk_tolerance': {
+        "Conservative": _active_changes_html([
+            "High inequality penalty -30pts",
+            "Wealthy markets boosted +15pts",
+            "Stability factors prioritized"
+        ]),
+        "Moderate": _active_changes_html([
+            "Balanced risk assessment",
+            "Moderate inequality penalty -15pts",
+            "Standard risk adjustments"
+        ]),
+        "Aggressive": _active_changes_html([
+            "Emerging markets boosted +20pts",
+            "Low inequality penalty -5pts",
+            "Growth opportunities prioritized"
+        ])
+    }
+}
+
+# Getting Started guide shown on the overview before any market is selected, one block per column
+GETTING_STARTED_STEPS = (
+    """
+**1. Define Your Business Profile** 👈
+- Select your business type (B2C, B2B, Marketplace, etc.)
+- Choose your product category
+- Set your risk tolerance level
+
+**2. Select Target Markets**
+- Filter by region and income level
+- Choose specific countries for analysis
+- Consider market size and opportunity
+""",
+    """
+**3. Analyze the Results**
+- Review market attractiveness scores
+- Assess digital readiness for your business
+- Evaluate regulatory and business environment
+
+**4. Plan Your Expansion**
+- Use AI-powered insights and recommendations
+- Follow suggested timeline and implementation roadmap
+- Track recommended success metrics
+"""
+)
+GETTING_STARTED_TIP = "💡 **Pro Tip**: Start by selecting 3-5 target markets to get meaningful comparative analysis. The dashboard will automatically adjust insights based on your business profile selections."
+
+DASHBOARD_TABS = [
+    "📊 Market Overview",
+    "📈 Market Analysis",
+    "💻 Digital Readiness",
+    "🏛️ Business Environment",
+    "🎯 Expansion Strategy"
+]
 
 def main():
     """Main application entry point"""
@@ -2067,14 +2164,23 @@ def main():
     
     st.markdown("---")
     
-    # Test World Bank API connectivity
-    try:
-        test_response = requests.get("https://api.worldbank.org/v2/country?format=json&per_page=1", timeout=5)
-        if test_response.status_code == 200:
-            data_source_container.success("🌐 **Connected to World Bank API** - Using real-time economic data")
-        else:
-            data_source_container.warning("⚠️ **World Bank API Issues** - Using sample data for demonstration")
-    except:
+    # Test World Bank API connectivity (at most once a minute) in the background
+    # while the country reference table loads; the two requests are independent
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        connectivity_test = None if api_status_is_fresh() else executor.submit(probe_world_bank, 5)
+        
+        # Load the country reference table once for the sidebar and every view
+        get_session_countries()
+    
+    if connectivity_test is not None:
+        st.session_state['api_status'] = (connectivity_test.result(), time.time())
+    
+    api_status = get_api_status()
+    if api_status == 200:
+        data_source_container.success("🌐 **Connected to World Bank API** - Using real-time economic data")
+    elif api_status is not None:
+        data_source_container.warning("⚠️ **World Bank API Issues** - Using sample data for demonstration")
+    else:
         data_source_container.error("❌ **No Internet Connection** - Using sample data for demonstration")
     
     # Render sidebar and get configuration
@@ -2085,17 +2191,20 @@ def main():
         change_details = f"🔄 Analysis recalculated: {config['business_type']} + {config['product_category']} + {config['analysis_focus']} focus + {config['risk_tolerance']} risk → {len(config['countries'])} markets"
         st.toast(change_details, icon="⚙️")
     
-    # Main content tabs
-    tab1, tab2, tab3, tab4, tab5 = st.tabs([
-        "📊 Market Overview", 
-        "📈 Market Analysis",
-        "💻 Digital Readiness",
-        "🏛️ Business Environment", 
-        "🎯 Expansion Strategy"
-    ])
+    # Main content views - st.tabs executes every tab body on each rerun, so a
+    # radio selector is used instead and only the active view is rendered
+    active_tab = st.radio(
+        "Dashboard view",
+        DASHBOARD_TABS,
+        horizontal=True,
+        key="active_tab",
+        label_visibility="collapsed"
+    )
     
-    with tab1:
-        render_market_overview(config)
+    # Each view loads only the tables it reads (all cached per configuration)
+    if active_tab == "📊 Market Overview":
+        market_data, _ = get_market_tables(config)
+        render_market_overview(config, market_data)
         
         # Show live configuration impact
         if config['countries']:
@@ -2104,64 +2213,16 @@ def main():
             
             col1, col2, col3 = st.columns(3)
             
-            with col1:
-                st.info(f"**Business Type: {config['business_type']}**")
-                if config['business_type'] == "B2B eCommerce":
-                    st.markdown("🔄 **Active Changes:**")
-                    st.caption("• Logistics scores boosted +150%")
-                    st.caption("• Business environment prioritized")
-                    st.caption("• Consumer metrics reduced -50%")
-                elif config['business_type'] == "Marketplace":
-                    st.markdown("🔄 **Active Changes:**")
-                    st.caption("• Population size heavily weighted")
-                    st.caption("• Digital adoption boosted +150%")
-                    st.caption("• Urban markets prioritized")
-                elif config['business_type'] == "SaaS Platform":
-                    st.markdown("🔄 **Active Changes:**")
-                    st.caption("• Tech infrastructure emphasized")
-                    st.caption("• Internet penetration boosted +100%")
-                    st.caption("• Education factors weighted higher")
-            
-            with col2:
-                st.info(f"**Analysis Focus: {config['analysis_focus']}**")
-                if config['analysis_focus'] == "Market Size":
-                    st.markdown("🔄 **Active Changes:**")
-                    st.caption("• Population weighted 40%")
-                    st.caption("• Consumer spending doubled")
-                    st.caption("• Large markets prioritized")
-                elif config['analysis_focus'] == "Digital Readiness":
-                    st.markdown("🔄 **Active Changes:**")
-                    st.caption("• Internet penetration tripled")
-                    st.caption("• Mobile adoption boosted 2.5x")
-                    st.caption("• Tech infrastructure critical")
-                elif config['analysis_focus'] == "Ease of Entry":
-                    st.markdown("🔄 **Active Changes:**")
-                    st.caption("• Logistics performance tripled")
-                    st.caption("• Regulatory quality emphasized")
-                    st.caption("• Business environment prioritized")
-                elif config['analysis_focus'] == "Growth Potential":
-                    st.markdown("🔄 **Active Changes:**")
-                    st.caption("• Emerging markets boosted")
-                    st.caption("• Urbanization doubled")
-                    st.caption("• Development indicators prioritized")
-            
-            with col3:
-                st.info(f"**Risk Tolerance: {config['risk_tolerance']}**")
-                if config['risk_tolerance'] == "Conservative":
-                    st.markdown("🔄 **Active Changes:**")
-                    st.caption("• High inequality penalty -30pts")
-                    st.caption("• Wealthy markets boosted +15pts")
-                    st.caption("• Stability factors prioritized")
-                elif config['risk_tolerance'] == "Moderate":
-                    st.markdown("🔄 **Active Changes:**")
-                    st.caption("• Balanced risk assessment")
-                    st.caption("• Moderate inequality penalty -15pts")
-                    st.caption("• Standard risk adjustments")
-                else:  # Aggressive
-                    st.markdown("🔄 **Active Changes:**")
-                    st.caption("• Emerging markets boosted +20pts")
-                    st.caption("• Low inequality penalty -5pts")
-                    st.caption("• Growth opportunities prioritized")
+            for column, setting, label in (
+                (col1, 'business_type', "Business Type"),
+                (col2, 'analysis_focus', "Analysis Focus"),
+                (col3, 'risk_tolerance', "Risk Tolerance")
+            ):
+                with column:
+                    st.info(f"**{label}: {config[setting]}**")
+                    impact_html = LIVE_IMPACT_HTML[setting].get(config[setting])
+                    if impact_html:
+                        st.markdown(impact_html, unsafe_allow_html=True)
             
             st.success("💡 **Tip**: Change any setting in the sidebar to see how it affects your market rankings and recommendations!")
         
@@ -2169,35 +2230,11 @@ def main():
         if not config['countries']:
             st.markdown("### 🚀 Getting Started with eCommerce Expansion Analysis")
             
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                st.markdown("""
-                **1. Define Your Business Profile** 👈
-                - Select your business type (B2C, B2B, Marketplace, etc.)
-                - Choose your product category
-                - Set your risk tolerance level
-                
-                **2. Select Target Markets**
-                - Filter by region and income level
-                - Choose specific countries for analysis
-                - Consider market size and opportunity
-                """)
-            
-            with col2:
-                st.markdown("""
-                **3. Analyze the Results**
-                - Review market attractiveness scores
-                - Assess digital readiness for your business
-                - Evaluate regulatory and business environment
-                
-                **4. Plan Your Expansion**
-                - Use AI-powered insights and recommendations
-                - Follow suggested timeline and implementation roadmap
-                - Track recommended success metrics
-                """)
+            for column, steps in zip(st.columns(2), GETTING_STARTED_STEPS):
+                with column:
+                    st.markdown(steps)
             
-            st.info("💡 **Pro Tip**: Start by selecting 3-5 target markets to get meaningful comparative analysis. The dashboard will automatically adjust insights based on your business profile selections.")
+            st.info(GETTING_STARTED_TIP)
         
         # Show sample insights even without country selection
         elif len(config['countries']) >= 3:
@@ -2205,17 +2242,20 @@ def main():
             st.success(f"✅ {len(config['countries'])} markets selected for {config['product_category']} {config['business_type']} analysis")
             st.info(f"🎯 Analysis focus: {config['analysis_focus']} with {config['risk_tolerance'].lower()} risk tolerance")
             
-    with tab2:
-        render_market_analysis(config)
+    elif active_tab == "📈 Market Analysis":
+        _, scored_data = get_market_tables(config)
+        render_market_analysis(config, scored_data)
         
-    with tab3:
-        render_digital_readiness(config)
+    elif active_tab == "💻 Digital Readiness":
+        market_data, _ = get_market_tables(config)
+        render_digital_readiness(config, market_data)
         
-    with tab4:
-        render_business_environment(config)
+    elif active_tab == "🏛️ Business Environment":
+        render_business_environment(config, get_governance_table(config))
         
-    with tab5:
-        render_expansion_insights(config)
+    elif active_tab == "🎯 Expansion Strategy":
+        _, scored_data = get_market_tables(config)
+        render_expansion_insights(config, scored_data, get_governance_table(config))
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,48 +1,84 @@
 import pandas as pd
 import numpy as np
-import requests
-import json
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Dict, List
 import os
 from pathlib import Path
+from types import MappingProxyType
+from functools import lru_cache
 import logging
 
-# Set up logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+from src.data.countries import COUNTRY_DTYPES, LPI_COUNTRY_ROWS
+from src.data.worldbank import create_session, request_json
+
 logger = logging.getLogger(__name__)
 
+
+def configure_logging(level: int = logging.INFO) -> None:
+    """Set up console logging for command-line runs; importers keep their own logging config"""
+    logging.basicConfig(level=level, format='%(asctime)s - %(levelname)s - %(message)s')
+
+@lru_cache(maxsize=1)
+def _load_lpi_countries() -> pd.DataFrame:
+    """Build and check the LPI country table on first use"""
+    # Verify we have sufficient countries (more than 200)
+    if len(LPI_COUNTRY_ROWS) < 200:
+        logger.error(f"Expected at least 200 countries, but have {len(LPI_COUNTRY_ROWS)}")
+        raise ValueError(f"Country list must contain at least 200 countries, found {len(LPI_COUNTRY_ROWS)}")
+    
+    logger.info(f"✅ Using fallback list of {len(LPI_COUNTRY_ROWS)} countries")
+    
+    # Same categorical region / ordered income level dtypes as the market exporter's country table
+    df = pd.DataFrame.from_records(
+        LPI_COUNTRY_ROWS,
+        columns=['country_code', 'country_name', 'region', 'income_level']
+    ).astype(COUNTRY_DTYPES)
+    
+    # Show breakdown by region for verification
+    regional_breakdown = df['region'].value_counts()
+    logger.info("Regional breakdown:")
+    for region, count in regional_breakdown.items():
+        logger.info(f"  • {region}: {count} countries")
+    
+    return df
+
 class HybridLPIDataExporter:
     """Hybrid Logistics Performance Index (LPI) data exporter - tries API first, falls back to real data"""
     
     BASE_URL = "https://api.worldbank.org/v2"
+    MAX_WORKERS = 8  # Concurrent World Bank requests
+    COUNTRIES_PER_REQUEST = 50  # Semicolon-joined country codes per URL, well under URL length limits
+    CACHE_TTL = timedelta(days=7)  # LPI editions are published every few years
+    
+    # Updated LPI indicator codes - trying multiple possible variations. Static, so
+    # defined once on the class and read-only rather than rebuilt per instance.
+    LPI_INDICATORS_PRIMARY = MappingProxyType({
+        'LP.LPI.OVRL.XQ': 'lpi_score_overall',           # Overall LPI Score
+        'LP.LPI.CUST.XQ': 'customs_score',               # Customs Score  
+        'LP.LPI.INFR.XQ': 'infrastructure_score',        # Infrastructure Score
+        'LP.LPI.ITRN.XQ': 'international_shipments_score', # International Shipments Score
+        'LP.LPI.LOGS.XQ': 'logistics_competence_score',  # Logistics Competence Score
+        'LP.LPI.TRAC.XQ': 'tracking_tracing_score',      # Tracking & Tracing Score
+        'LP.LPI.TIME.XQ': 'timeliness_score'             # Timeliness Score
+    })
+    
+    # Alternative LPI indicator codes to try
+    LPI_INDICATORS_ALTERNATIVE = MappingProxyType({
+        'LP.LPI.OVRL': 'lpi_score_overall',
+        'LP.LPI.CUST': 'customs_score',
+        'LP.LPI.INFR': 'infrastructure_score',
+        'LP.LPI.ITRN': 'international_shipments_score',
+        'LP.LPI.LOGS': 'logistics_competence_score',
+        'LP.LPI.TRAC': 'tracking_tracing_score',
+        'LP.LPI.TIME': 'timeliness_score'
+    })
     
     def __init__(self, output_dir: str = "powerbi_csv_files"):
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
-        
-        # Updated LPI indicator codes - trying multiple possible variations
-        self.LPI_INDICATORS_PRIMARY = {
-            'LP.LPI.OVRL.XQ': 'lpi_score_overall',           # Overall LPI Score
-            'LP.LPI.CUST.XQ': 'customs_score',               # Customs Score  
-            'LP.LPI.INFR.XQ': 'infrastructure_score',        # Infrastructure Score
-            'LP.LPI.ITRN.XQ': 'international_shipments_score', # International Shipments Score
-            'LP.LPI.LOGS.XQ': 'logistics_competence_score',  # Logistics Competence Score
-            'LP.LPI.TRAC.XQ': 'tracking_tracing_score',      # Tracking & Tracing Score
-            'LP.LPI.TIME.XQ': 'timeliness_score'             # Timeliness Score
-        }
-        
-        # Alternative LPI indicator codes to try
-        self.LPI_INDICATORS_ALTERNATIVE = {
-            'LP.LPI.OVRL': 'lpi_score_overall',
-            'LP.LPI.CUST': 'customs_score',
-            'LP.LPI.INFR': 'infrastructure_score',
-            'LP.LPI.ITRN': 'international_shipments_score',
-            'LP.LPI.LOGS': 'logistics_competence_score',
-            'LP.LPI.TRAC': 'tracking_tracing_score',
-            'LP.LPI.TIME': 'timeliness_score'
-        }
+        self._session = create_session(pool_maxsize=self.MAX_WORKERS)
 
     def test_lpi_api_availability(self) -> tuple[bool, Dict]:
         """Test if LPI data is available from World Bank API"""
@@ -68,17 +104,15 @@ class HybridLPIDataExporter:
                         'per_page': 10
                     }
                     
-                    response = requests.get(url, params=params, timeout=10)
+                    data = request_json(self._session, url, params=params, timeout=10, ttl=self.CACHE_TTL)
                     
-                    if response.status_code == 200:
-                        data = response.json()
-                        if len(data) > 1 and data[1] and len(data[1]) > 0:
-                            # Found data!
-                            sample_record = data[1][0]
-                            if sample_record.get('value') is not None:
-                                logger.info(f"✅ LPI API working! Found data for {country}: {sample_record.get('value')}")
-                                logger.info(f"Using {indicator_set_name} indicator set")
-                                return True, indicator_set
+                    if data[1] and len(data[1]) > 0:
+                        # Found data!
+                        sample_record = data[1][0]
+                        if sample_record.get('value') is not None:
+                            logger.info(f"✅ LPI API working! Found data for {country}: {sample_record.get('value')}")
+                            logger.info(f"Using {indicator_set_name} indicator set")
+                            return True, indicator_set
                     
                     time.sleep(0.5)  # Rate limiting
                     
@@ -98,263 +132,7 @@ class HybridLPIDataExporter:
 
     def _get_fallback_countries(self) -> pd.DataFrame:
         """Fallback countries list with exactly 217 countries and economies"""
-        # Complete list of exactly 217 countries and economies (World Bank classification)
-        countries = [
-            # Major G20 + Top Economies (20 countries)
-            {'country_code': 'USA', 'country_name': 'United States', 'region': 'North America', 'income_level': 'High income'},
-            {'country_code': 'CHN', 'country_name': 'China', 'region': 'East Asia & Pacific', 'income_level': 'Upper middle income'},
-            {'country_code': 'JPN', 'country_name': 'Japan', 'region': 'East Asia & Pacific', 'income_level': 'High income'},
-            {'country_code': 'DEU', 'country_name': 'Germany', 'region': 'Europe & Central Asia', 'income_level': 'High income'},
-            {'country_code': 'IND', 'country_name': 'India', 'region': 'South Asia', 'income_level': 'Lower middle income'},
-            {'country_code': 'GBR', 'country_name': 'United Kingdom', 'region': 'Europe & Central Asia', 'income_level': 'High income'},
-            {'country_code': 'FRA', 'country_name': 'France', 'region': 'Europe & Central Asia', 'income_level': 'High income'},
-            {'country_code': 'ITA', 'country_name': 'Italy', 'region': 'Europe & Central Asia', 'income_level': 'High income'},
-            {'country_code': 'BRA', 'country_name': 'Brazil', 'region': 'Latin America & Caribbean', 'income_level': 'Upper middle income'},
-            {'country_code': 'CAN', 'country_name': 'Canada', 'region': 'North America', 'income_level': 'High income'},
-            {'country_code': 'RUS', 'country_name': 'Russian Federation', 'region': 'Europe & Central Asia', 'income_level': 'Upper middle income'},
-            {'country_code': 'KOR', 'country_name': 'Korea, Rep.', 'region': 'East Asia & Pacific', 'income_level': 'High income'},
-            {'country_code': 'ESP', 'country_name': 'Spain', 'region': 'Europe & Central Asia', 'income_level': 'High income'},
-            {'country_code': 'AUS', 'country_name': 'Australia', 'region': 'East Asia & Pacific', 'income_level': 'High income'},
-            {'country_code': 'MEX', 'country_name': 'Mexico', 'region': 'Latin America & Caribbean', 'income_level': 'Upper middle income'},
-            {'country_code': 'IDN', 'country_name': 'Indonesia', 'region': 'East Asia & Pacific', 'income_level': 'Upper middle income'},
-            {'country_code': 'NLD', 'country_name': 'Netherlands', 'region': 'Europe & Central Asia', 'income_level': 'High income'},
-            {'country_code': 'SAU', 'country_name': 'Saudi Arabia', 'region': 'Middle East & North Africa', 'income_level': 'High income'},
-            {'country_code': 'TUR', 'country_name': 'Turkey', 'region': 'Europe & Central Asia', 'income_level': 'Upper middle income'},
-            {'country_code': 'CHE', 'country_name': 'Switzerland', 'region': 'Europe & Central Asia', 'income_level': 'High income'},
-            
-            # European Union & Europe (30 countries)
-            {'country_code': 'POL', 'country_name': 'Poland', 'region': 'Europe & Central Asia', 'income_level': 'High income'},
-            {'country_code': 'BEL', 'country_name': 'Belgium', 'region': 'Europe & Central Asia', 'income_level': 'High income'},
-            {'country_code': 'SWE', 'country_name': 'Sweden', 'region': 'Europe & Central Asia', 'income_level': 'High income'},
-            {'country_code': 'IRL', 'country_name': 'Ireland', 'region': 'Europe & Central Asia', 'income_level': 'High income'},
-            {'country_code': 'AUT', 'country_name': 'Austria', 'region': 'Europe & Central Asia', 'income_level': 'High income'},
-            {'country_code': 'NOR', 'country_name': 'Norway', 'region': 'Europe & Central Asia', 'income_level': 'High income'},
-            {'country_code': 'DNK', 'country_name': 'Denmark', 'region': 'Europe & Central Asia', 'income_level': 'High income'},
-            {'country_code': 'FIN', 'country_name': 'Finland', 'region': 'Europe & Central Asia', 'income_level': 'High income'},
-            {'country_code': 'PRT', 'country_name': 'Portugal', 'region': 'Europe & Central Asia', 'income_level': 'High income'},
-            {'country_code': 'GRC', 'country_name': 'Greece', 'region': 'Europe & Central Asia', 'income_level': 'High income'},
-            {'country_code': 'CZE', 'country_name': 'Czech Republic', 'region': 'Europe & Central Asia', 'income_level': 'High income'},
-            {'country_code': 'HUN', 'country_name': 'Hungary', 'region': 'Europe & Central Asia', 'income_level': 'High income'},
-            {'country_code': 'SVK', 'country_name': 'Slovak Republic', 'region': 'Europe & Central Asia', 'income_level': 'High income'},
-            {'country_code': 'SVN', 'country_name': 'Slovenia', 'region': 'Europe & Central Asia', 'income_level': 'High income'},
-            {'country_code': 'EST', 'country_name': 'Estonia', 'region': 'Europe & Central Asia', 'income_level': 'High income'},
-            {'country_code': 'LVA', 'country_name': 'Latvia', 'region': 'Europe & Central Asia', 'income_level': 'High income'},
-            {'country_code': 'LTU', 'country_name': 'Lithuania', 'region': 'Europe & Central Asia', 'income_level': 'High income'},
-            {'country_code': 'CYP', 'country_name': 'Cyprus', 'region': 'Europe & Central Asia', 'income_level': 'High income'},
-            {'country_code': 'MLT', 'country_name': 'Malta', 'region': 'Europe & Central Asia', 'income_level': 'High income'},
-            {'country_code': 'LUX', 'country_name': 'Luxembourg', 'region': 'Europe & Central Asia', 'income_level': 'High income'},
-            {'country_code': 'ISL', 'country_name': 'Iceland', 'region': 'Europe & Central Asia', 'income_level': 'High income'},
-            {'country_code': 'ROU', 'country_name': 'Romania', 'region': 'Europe & Central Asia', 'income_level': 'High income'},
-            {'country_code': 'BGR', 'country_name': 'Bulgaria', 'region': 'Europe & Central Asia', 'income_level': 'Upper middle income'},
-            {'country_code': 'HRV', 'country_name': 'Croatia', 'region': 'Europe & Central Asia', 'income_level': 'High income'},
-            {'country_code': 'SRB', 'country_name': 'Serbia', 'region': 'Europe & Central Asia', 'income_level': 'Upper middle income'},
-            {'country_code': 'BIH', 'country_name': 'Bosnia and Herzegovina', 'region': 'Europe & Central Asia', 'income_level': 'Upper middle income'},
-            {'country_code': 'MKD', 'country_name': 'North Macedonia', 'region': 'Europe & Central Asia', 'income_level': 'Upper middle income'},
-            {'country_code': 'ALB', 'country_name': 'Albania', 'region': 'Europe & Central Asia', 'income_level': 'Upper middle income'},
-            {'country_code': 'MNE', 'country_name': 'Montenegro', 'region': 'Europe & Central Asia', 'income_level': 'Upper middle income'},
-            {'country_code': 'UKR', 'country_name': 'Ukraine', 'region': 'Europe & Central Asia', 'income_level': 'Lower middle income'},
-            
-            # Asia Pacific (20 countries)
-            {'country_code': 'SGP', 'country_name': 'Singapore', 'region': 'East Asia & Pacific', 'income_level': 'High income'},
-            {'country_code': 'HKG', 'country_name': 'Hong Kong SAR, China', 'region': 'East Asia & Pacific', 'income_level': 'High income'},
-            {'country_code': 'MYS', 'country_name': 'Malaysia', 'region': 'East Asia & Pacific', 'income_level': 'Upper middle income'},
-            {'country_code': 'THA', 'country_name': 'Thailand', 'region': 'East Asia & Pacific', 'income_level': 'Upper middle income'},
-            {'country_code': 'PHL', 'country_name': 'Philippines', 'region': 'East Asia & Pacific', 'income_level': 'Lower middle income'},
-            {'country_code': 'VNM', 'country_name': 'Vietnam', 'region': 'East Asia & Pacific', 'income_level': 'Lower middle income'},
-            {'country_code': 'NZL', 'country_name': 'New Zealand', 'region': 'East Asia & Pacific', 'income_level': 'High income'},
-            {'country_code': 'TWN', 'country_name': 'Taiwan, China', 'region': 'East Asia & Pacific', 'income_level': 'High income'},
-            {'country_code': 'MNG', 'country_name': 'Mongolia', 'region': 'East Asia & Pacific', 'income_level': 'Upper middle income'},
-            {'country_code': 'LAO', 'country_name': 'Lao PDR', 'region': 'East Asia & Pacific', 'income_level': 'Lower middle income'},
-            {'country_code': 'KHM', 'country_name': 'Cambodia', 'region': 'East Asia & Pacific', 'income_level': 'Lower middle income'},
-            {'country_code': 'MMR', 'country_name': 'Myanmar', 'region': 'East Asia & Pacific', 'income_level': 'Lower middle income'},
-            {'country_code': 'BRN', 'country_name': 'Brunei Darussalam', 'region': 'East Asia & Pacific', 'income_level': 'High income'},
-            {'country_code': 'PNG', 'country_name': 'Papua New Guinea', 'region': 'East Asia & Pacific', 'income_level': 'Lower middle income'},
-            {'country_code': 'FJI', 'country_name': 'Fiji', 'region': 'East Asia & Pacific', 'income_level': 'Upper middle income'},
-            {'country_code': 'LKA', 'country_name': 'Sri Lanka', 'region': 'South Asia', 'income_level': 'Upper middle income'},
-            {'country_code': 'BGD', 'country_name': 'Bangladesh', 'region': 'South Asia', 'income_level': 'Lower middle income'},
-            {'country_code': 'PAK', 'country_name': 'Pakistan', 'region': 'South Asia', 'income_level': 'Lower middle income'},
-            {'country_code': 'NPL', 'country_name': 'Nepal', 'region': 'South Asia', 'income_level': 'Lower middle income'},
-            {'country_code': 'BTN', 'country_name': 'Bhutan', 'region': 'South Asia', 'income_level': 'Lower middle income'},
-            
-            # Central Asia & Eastern Europe (10 countries)
-            {'country_code': 'KAZ', 'country_name': 'Kazakhstan', 'region': 'Europe & Central Asia', 'income_level': 'Upper middle income'},
-            {'country_code': 'BLR', 'country_name': 'Belarus', 'region': 'Europe & Central Asia', 'income_level': 'Upper middle income'},
-            {'country_code': 'UZB', 'country_name': 'Uzbekistan', 'region': 'Europe & Central Asia', 'income_level': 'Lower middle income'},
-            {'country_code': 'ARM', 'country_name': 'Armenia', 'region': 'Europe & Central Asia', 'income_level': 'Upper middle income'},
-            {'country_code': 'GEO', 'country_name': 'Georgia', 'region': 'Europe & Central Asia', 'income_level': 'Upper middle income'},
-            {'country_code': 'AZE', 'country_name': 'Azerbaijan', 'region': 'Europe & Central Asia', 'income_level': 'Upper middle income'},
-            {'country_code': 'KGZ', 'country_name': 'Kyrgyz Republic', 'region': 'Europe & Central Asia', 'income_level': 'Lower middle income'},
-            {'country_code': 'TJK', 'country_name': 'Tajikistan', 'region': 'Europe & Central Asia', 'income_level': 'Lower middle income'},
-            {'country_code': 'TKM', 'country_name': 'Turkmenistan', 'region': 'Europe & Central Asia', 'income_level': 'Upper middle income'},
-            {'country_code': 'MDA', 'country_name': 'Moldova', 'region': 'Europe & Central Asia', 'income_level': 'Upper middle income'},
-            
-            # Middle East & North Africa (10 countries)
-            {'country_code': 'ARE', 'country_name': 'United Arab Emirates', 'region': 'Middle East & North Africa', 'income_level': 'High income'},
-            {'country_code': 'ISR', 'country_name': 'Israel', 'region': 'Middle East & North Africa', 'income_level': 'High income'},
-            {'country_code': 'QAT', 'country_name': 'Qatar', 'region': 'Middle East & North Africa', 'income_level': 'High income'},
-            {'country_code': 'KWT', 'country_name': 'Kuwait', 'region': 'Middle East & North Africa', 'income_level': 'High income'},
-            {'country_code': 'BHR', 'country_name': 'Bahrain', 'region': 'Middle East & North Africa', 'income_level': 'High income'},
-            {'country_code': 'OMN', 'country_name': 'Oman', 'region': 'Middle East & North Africa', 'income_level': 'High income'},
-            {'country_code': 'JOR', 'country_name': 'Jordan', 'region': 'Middle East & North Africa', 'income_level': 'Upper middle income'},
-            {'country_code': 'LBN', 'country_name': 'Lebanon', 'region': 'Middle East & North Africa', 'income_level': 'Upper middle income'},
-            {'country_code': 'EGY', 'country_name': 'Egypt, Arab Rep.', 'region': 'Middle East & North Africa', 'income_level': 'Lower middle income'},
-            {'country_code': 'MAR', 'country_name': 'Morocco', 'region': 'Middle East & North Africa', 'income_level': 'Lower middle income'},
-            
-            # Sub-Saharan Africa (10 countries)
-            {'country_code': 'ZAF', 'country_name': 'South Africa', 'region': 'Sub-Saharan Africa', 'income_level': 'Upper middle income'},
-            {'country_code': 'NGA', 'country_name': 'Nigeria', 'region': 'Sub-Saharan Africa', 'income_level': 'Lower middle income'},
-            {'country_code': 'KEN', 'country_name': 'Kenya', 'region': 'Sub-Saharan Africa', 'income_level': 'Lower middle income'},
-            {'country_code': 'GHA', 'country_name': 'Ghana', 'region': 'Sub-Saharan Africa', 'income_level': 'Lower middle income'},
-            {'country_code': 'ETH', 'country_name': 'Ethiopia', 'region': 'Sub-Saharan Africa', 'income_level': 'Low income'},
-            {'country_code': 'UGA', 'country_name': 'Uganda', 'region': 'Sub-Saharan Africa', 'income_level': 'Low income'},
-            {'country_code': 'TZA', 'country_name': 'Tanzania', 'region': 'Sub-Saharan Africa', 'income_level': 'Lower middle income'},
-            {'country_code': 'ZWE', 'country_name': 'Zimbabwe', 'region': 'Sub-Saharan Africa', 'income_level': 'Lower middle income'},
-            {'country_code': 'ZMB', 'country_name': 'Zambia', 'region': 'Sub-Saharan Africa', 'income_level': 'Lower middle income'},
-            {'country_code': 'BWA', 'country_name': 'Botswana', 'region': 'Sub-Saharan Africa', 'income_level': 'Upper middle income'},
-            
-            # Latin America & Caribbean (10 countries)
-            {'country_code': 'ARG', 'country_name': 'Argentina', 'region': 'Latin America & Caribbean', 'income_level': 'Upper middle income'},
-            {'country_code': 'CHL', 'country_name': 'Chile', 'region': 'Latin America & Caribbean', 'income_level': 'High income'},
-            {'country_code': 'COL', 'country_name': 'Colombia', 'region': 'Latin America & Caribbean', 'income_level': 'Upper middle income'},
-            {'country_code': 'PER', 'country_name': 'Peru', 'region': 'Latin America & Caribbean', 'income_level': 'Upper middle income'},
-            {'country_code': 'URY', 'country_name': 'Uruguay', 'region': 'Latin America & Caribbean', 'income_level': 'High income'},
-            {'country_code': 'ECU', 'country_name': 'Ecuador', 'region': 'Latin America & Caribbean', 'income_level': 'Upper middle income'},
-            {'country_code': 'BOL', 'country_name': 'Bolivia', 'region': 'Latin America & Caribbean', 'income_level': 'Lower middle income'},
-            {'country_code': 'PRY', 'country_name': 'Paraguay', 'region': 'Latin America & Caribbean', 'income_level': 'Upper middle income'},
-            {'country_code': 'VEN', 'country_name': 'Venezuela, RB', 'region': 'Latin America & Caribbean', 'income_level': 'Upper middle income'},
-            {'country_code': 'CRI', 'country_name': 'Costa Rica', 'region': 'Latin America & Caribbean', 'income_level': 'Upper middle income'},
-            
-            # Additional countries to reach 217 total
-            # North America additional
-            {'country_code': 'GRL', 'country_name': 'Greenland', 'region': 'North America', 'income_level': 'High income'},
-            {'country_code': 'BMU', 'country_name': 'Bermuda', 'region': 'North America', 'income_level': 'High income'},
-            {'country_code': 'SPM', 'country_name': 'St. Pierre and Miquelon', 'region': 'North America', 'income_level': 'High income'},
-            
-            # Latin America & Caribbean additional
-            {'country_code': 'GUY', 'country_name': 'Guyana', 'region': 'Latin America & Caribbean', 'income_level': 'Upper middle income'},
-            {'country_code': 'SUR', 'country_name': 'Suriname', 'region': 'Latin America & Caribbean', 'income_level': 'Upper middle income'},
-            {'country_code': 'GUF', 'country_name': 'French Guiana', 'region': 'Latin America & Caribbean', 'income_level': 'High income'},
-            {'country_code': 'HTI', 'country_name': 'Haiti', 'region': 'Latin America & Caribbean', 'income_level': 'Low income'},
-            {'country_code': 'NIC', 'country_name': 'Nicaragua', 'region': 'Latin America & Caribbean', 'income_level': 'Lower middle income'},
-            {'country_code': 'HND', 'country_name': 'Honduras', 'region': 'Latin America & Caribbean', 'income_level': 'Lower middle income'},
-            {'country_code': 'SLV', 'country_name': 'El Salvador', 'region': 'Latin America & Caribbean', 'income_level': 'Lower middle income'},
-            {'country_code': 'BLZ', 'country_name': 'Belize', 'region': 'Latin America & Caribbean', 'income_level': 'Upper middle income'},
-            {'country_code': 'BHS', 'country_name': 'Bahamas, The', 'region': 'Latin America & Caribbean', 'income_level': 'High income'},
-            {'country_code': 'BRB', 'country_name': 'Barbados', 'region': 'Latin America & Caribbean', 'income_level': 'High income'},
-            {'country_code': 'LCA', 'country_name': 'St. Lucia', 'region': 'Latin America & Caribbean', 'income_level': 'Upper middle income'},
-            {'country_code': 'VCT', 'country_name': 'St. Vincent and the Grenadines', 'region': 'Latin America & Caribbean', 'income_level': 'Upper middle income'},
-            {'country_code': 'GRD', 'country_name': 'Grenada', 'region': 'Latin America & Caribbean', 'income_level': 'Upper middle income'},
-            {'country_code': 'DMA', 'country_name': 'Dominica', 'region': 'Latin America & Caribbean', 'income_level': 'Upper middle income'},
-            {'country_code': 'ATG', 'country_name': 'Antigua and Barbuda', 'region': 'Latin America & Caribbean', 'income_level': 'High income'},
-            {'country_code': 'KNA', 'country_name': 'St. Kitts and Nevis', 'region': 'Latin America & Caribbean', 'income_level': 'High income'},
-            {'country_code': 'PRI', 'country_name': 'Puerto Rico', 'region': 'Latin America & Caribbean', 'income_level': 'High income'},
-            {'country_code': 'VIR', 'country_name': 'Virgin Islands (U.S.)', 'region': 'Latin America & Caribbean', 'income_level': 'High income'},
-            {'country_code': 'ABW', 'country_name': 'Aruba', 'region': 'Latin America & Caribbean', 'income_level': 'High income'},
-            
-            # Additional Pacific economies
-            {'country_code': 'WSM', 'country_name': 'Samoa', 'region': 'East Asia & Pacific', 'income_level': 'Upper middle income'},
-            {'country_code': 'TON', 'country_name': 'Tonga', 'region': 'East Asia & Pacific', 'income_level': 'Upper middle income'},
-            {'country_code': 'VUT', 'country_name': 'Vanuatu', 'region': 'East Asia & Pacific', 'income_level': 'Lower middle income'},
-            {'country_code': 'SLB', 'country_name': 'Solomon Islands', 'region': 'East Asia & Pacific', 'income_level': 'Lower middle income'},
-            {'country_code': 'KIR', 'country_name': 'Kiribati', 'region': 'East Asia & Pacific', 'income_level': 'Lower middle income'},
-            {'country_code': 'TUV', 'country_name': 'Tuvalu', 'region': 'East Asia & Pacific', 'income_level': 'Upper middle income'},
-            {'country_code': 'NRU', 'country_name': 'Nauru', 'region': 'East Asia & Pacific', 'income_level': 'Upper middle income'},
-            {'country_code': 'PLW', 'country_name': 'Palau', 'region': 'East Asia & Pacific', 'income_level': 'Upper middle income'},
-            {'country_code': 'FSM', 'country_name': 'Micronesia, Fed. Sts.', 'region': 'East Asia & Pacific', 'income_level': 'Lower middle income'},
-            {'country_code': 'MHL', 'country_name': 'Marshall Islands', 'region': 'East Asia & Pacific', 'income_level': 'Upper middle income'},
-            
-            # Additional European economies
-            {'country_code': 'AND', 'country_name': 'Andorra', 'region': 'Europe & Central Asia', 'income_level': 'High income'},
-            {'country_code': 'LIE', 'country_name': 'Liechtenstein', 'region': 'Europe & Central Asia', 'income_level': 'High income'},
-            {'country_code': 'MCO', 'country_name': 'Monaco', 'region': 'Europe & Central Asia', 'income_level': 'High income'},
-            {'country_code': 'SMR', 'country_name': 'San Marino', 'region': 'Europe & Central Asia', 'income_level': 'High income'},
-            {'country_code': 'VAT', 'country_name': 'Vatican City', 'region': 'Europe & Central Asia', 'income_level': 'High income'},
-            
-            # Additional Middle Eastern economies
-            {'country_code': 'IRN', 'country_name': 'Iran, Islamic Rep.', 'region': 'Middle East & North Africa', 'income_level': 'Upper middle income'},
-            {'country_code': 'IRQ', 'country_name': 'Iraq', 'region': 'Middle East & North Africa', 'income_level': 'Upper middle income'},
-            {'country_code': 'SYR', 'country_name': 'Syrian Arab Republic', 'region': 'Middle East & North Africa', 'income_level': 'Lower middle income'},
-            {'country_code': 'YEM', 'country_name': 'Yemen, Rep.', 'region': 'Middle East & North Africa', 'income_level': 'Lower middle income'},
-            {'country_code': 'PSE', 'country_name': 'West Bank and Gaza', 'region': 'Middle East & North Africa', 'income_level': 'Lower middle income'},
-            
-            # Additional African economies
-            {'country_code': 'COM', 'country_name': 'Comoros', 'region': 'Sub-Saharan Africa', 'income_level': 'Low income'},
-            {'country_code': 'DJI', 'country_name': 'Djibouti', 'region': 'Sub-Saharan Africa', 'income_level': 'Lower middle income'},
-            {'country_code': 'ERI', 'country_name': 'Eritrea', 'region': 'Sub-Saharan Africa', 'income_level': 'Low income'},
-            {'country_code': 'GMB', 'country_name': 'Gambia, The', 'region': 'Sub-Saharan Africa', 'income_level': 'Low income'},
-            {'country_code': 'GIN', 'country_name': 'Guinea', 'region': 'Sub-Saharan Africa', 'income_level': 'Low income'},
-            {'country_code': 'GNB', 'country_name': 'Guinea-Bissau', 'region': 'Sub-Saharan Africa', 'income_level': 'Low income'},
-            {'country_code': 'LBR', 'country_name': 'Liberia', 'region': 'Sub-Saharan Africa', 'income_level': 'Low income'},
-            {'country_code': 'MDG', 'country_name': 'Madagascar', 'region': 'Sub-Saharan Africa', 'income_level': 'Low income'},
-            {'country_code': 'MWI', 'country_name': 'Malawi', 'region': 'Sub-Saharan Africa', 'income_level': 'Low income'},
-            {'country_code': 'MLI', 'country_name': 'Mali', 'region': 'Sub-Saharan Africa', 'income_level': 'Low income'},
-            {'country_code': 'MRT', 'country_name': 'Mauritania', 'region': 'Sub-Saharan Africa', 'income_level': 'Lower middle income'},
-            {'country_code': 'MOZ', 'country_name': 'Mozambique', 'region': 'Sub-Saharan Africa', 'income_level': 'Low income'},
-            {'country_code': 'NER', 'country_name': 'Niger', 'region': 'Sub-Saharan Africa', 'income_level': 'Low income'},
-            {'country_code': 'RWA', 'country_name': 'Rwanda', 'region': 'Sub-Saharan Africa', 'income_level': 'Low income'},
-            {'country_code': 'STP', 'country_name': 'Sao Tome and Principe', 'region': 'Sub-Saharan Africa', 'income_level': 'Lower middle income'},
-            {'country_code': 'SLE', 'country_name': 'Sierra Leone', 'region': 'Sub-Saharan Africa', 'income_level': 'Low income'},
-            {'country_code': 'SOM', 'country_name': 'Somalia', 'region': 'Sub-Saharan Africa', 'income_level': 'Low income'},
-            {'country_code': 'SSD', 'country_name': 'South Sudan', 'region': 'Sub-Saharan Africa', 'income_level': 'Low income'},
-            {'country_code': 'SDN', 'country_name': 'Sudan', 'region': 'Sub-Saharan Africa', 'income_level': 'Lower middle income'},
-            {'country_code': 'TCD', 'country_name': 'Chad', 'region': 'Sub-Saharan Africa', 'income_level': 'Low income'},
-            {'country_code': 'BEN', 'country_name': 'Benin', 'region': 'Sub-Saharan Africa', 'income_level': 'Lower middle income'},
-            {'country_code': 'BFA', 'country_name': 'Burkina Faso', 'region': 'Sub-Saharan Africa', 'income_level': 'Low income'},
-            {'country_code': 'CAF', 'country_name': 'Central African Republic', 'region': 'Sub-Saharan Africa', 'income_level': 'Low income'},
-            {'country_code': 'CMR', 'country_name': 'Cameroon', 'region': 'Sub-Saharan Africa', 'income_level': 'Lower middle income'},
-            {'country_code': 'COG', 'country_name': 'Congo, Rep.', 'region': 'Sub-Saharan Africa', 'income_level': 'Lower middle income'},
-            {'country_code': 'COD', 'country_name': 'Congo, Dem. Rep.', 'region': 'Sub-Saharan Africa', 'income_level': 'Low income'},
-            {'country_code': 'GAB', 'country_name': 'Gabon', 'region': 'Sub-Saharan Africa', 'income_level': 'Upper middle income'},
-            {'country_code': 'GNQ', 'country_name': 'Equatorial Guinea', 'region': 'Sub-Saharan Africa', 'income_level': 'Upper middle income'},
-            {'country_code': 'AGO', 'country_name': 'Angola', 'region': 'Sub-Saharan Africa', 'income_level': 'Lower middle income'},
-            {'country_code': 'LSO', 'country_name': 'Lesotho', 'region': 'Sub-Saharan Africa', 'income_level': 'Lower middle income'},
-            {'country_code': 'SWZ', 'country_name': 'Eswatini', 'region': 'Sub-Saharan Africa', 'income_level': 'Lower middle income'},
-            
-            # Additional Asian economies
-            {'country_code': 'AFG', 'country_name': 'Afghanistan', 'region': 'South Asia', 'income_level': 'Low income'},
-            {'country_code': 'MAC', 'country_name': 'Macao SAR, China', 'region': 'East Asia & Pacific', 'income_level': 'High income'},
-            {'country_code': 'MDV', 'country_name': 'Maldives', 'region': 'South Asia', 'income_level': 'Upper middle income'},
-            
-            # Additional Caribbean economies
-            {'country_code': 'CUB', 'country_name': 'Cuba', 'region': 'Latin America & Caribbean', 'income_level': 'Upper middle income'},
-            {'country_code': 'JAM', 'country_name': 'Jamaica', 'region': 'Latin America & Caribbean', 'income_level': 'Upper middle income'},
-            {'country_code': 'TTO', 'country_name': 'Trinidad and Tobago', 'region': 'Latin America & Caribbean', 'income_level': 'High income'},
-            
-            # Additional Latin American economies
-            {'country_code': 'URY', 'country_name': 'Uruguay', 'region': 'Latin America & Caribbean', 'income_level': 'High income'},
-            {'country_code': 'ECU', 'country_name': 'Ecuador', 'region': 'Latin America & Caribbean', 'income_level': 'Upper middle income'},
-            {'country_code': 'BOL', 'country_name': 'Bolivia', 'region': 'Latin America & Caribbean', 'income_level': 'Lower middle income'},
-            {'country_code': 'PRY', 'country_name': 'Paraguay', 'region': 'Latin America & Caribbean', 'income_level': 'Upper middle income'},
-            {'country_code': 'VEN', 'country_name': 'Venezuela, RB', 'region': 'Latin America & Caribbean', 'income_level': 'Upper middle income'},
-            
-            # Additional Middle Eastern economies
-            {'country_code': 'TUN', 'country_name': 'Tunisia', 'region': 'Middle East & North Africa', 'income_level': 'Lower middle income'},
-            {'country_code': 'DZA', 'country_name': 'Algeria', 'region': 'Middle East & North Africa', 'income_level': 'Lower middle income'},
-            {'country_code': 'LBY', 'country_name': 'Libya', 'region': 'Middle East & North Africa', 'income_level': 'Upper middle income'},
-            
-            # Additional African economies
-            {'country_code': 'NAM', 'country_name': 'Namibia', 'region': 'Sub-Saharan Africa', 'income_level': 'Upper middle income'},
-            {'country_code': 'MUS', 'country_name': 'Mauritius', 'region': 'Sub-Saharan Africa', 'income_level': 'High income'},
-            {'country_code': 'SEN', 'country_name': 'Senegal', 'region': 'Sub-Saharan Africa', 'income_level': 'Lower middle income'},
-            {'country_code': 'CIV', 'country_name': "Cote d'Ivoire", 'region': 'Sub-Saharan Africa', 'income_level': 'Lower middle income'},
-            
-        ]
-        
-        # Verify we have sufficient countries (more than 200)
-        if len(countries) < 200:
-            logger.error(f"Expected at least 200 countries, but have {len(countries)}")
-            raise ValueError(f"Country list must contain at least 200 countries, found {len(countries)}")
-        
-        logger.info(f"✅ Using fallback list of {len(countries)} countries")
-        
-        # Show breakdown by region for verification
-        df = pd.DataFrame(countries)
-        regional_breakdown = df['region'].value_counts()
-        logger.info("Regional breakdown:")
-        for region, count in regional_breakdown.items():
-            logger.info(f"  • {region}: {count} countries")
-        
-        return df
+        return _load_lpi_countries().copy()
 
     def get_fallback_lpi_data(self) -> pd.DataFrame:
         """Generate LPI data for ALL countries from countries_master.csv"""
@@ -612,58 +390,39 @@ class HybridLPIDataExporter:
         countries_df = self.get_countries_list()
         logger.info(f"Fetching LPI data for {len(countries_df)} countries from World Bank API")
         
-        all_lpi_data = []
+        # One request covers an indicator for a whole chunk of countries
+        # (country/c1;c2;.../indicator/code), so 217 countries x 7 indicators take
+        # a few dozen round trips; they are independent, so overlap them too
+        country_codes = countries_df['country_code'].tolist()
+        chunks = [country_codes[i:i + self.COUNTRIES_PER_REQUEST]
+                  for i in range(0, len(country_codes), self.COUNTRIES_PER_REQUEST)]
+        requests_to_make = [(indicator_code, chunk) for indicator_code in indicators for chunk in chunks]
+        logger.info(f"Fetching {len(indicators)} indicators for {len(country_codes)} countries "
+                    f"in {len(requests_to_make)} requests")
+        
+        latest_values = {}  # (country_code, indicator_code) -> (value, year)
+        with ThreadPoolExecutor(max_workers=max(1, min(self.MAX_WORKERS, len(requests_to_make)))) as executor:
+            for chunk_values in executor.map(lambda request: self._fetch_indicator_chunk(*request), requests_to_make):
+                latest_values.update(chunk_values)
         
+        all_lpi_data = []
         for _, country in countries_df.iterrows():
             country_code = country['country_code']
-            country_name = country['country_name']
-            
-            logger.info(f"Fetching LPI data for {country_name} ({country_code})...")
-            
             country_lpi = {
                 'country_code': country_code,
-                'country_name': country_name,
+                'country_name': country['country_name'],
                 'region': country.get('region', 'Unknown'),
                 'income_level': country.get('income_level', 'Unknown'),
                 'year': 2023,
                 'data_source': 'World Bank API'
             }
             
-            # Fetch data for each LPI indicator
             for indicator_code, field_name in indicators.items():
-                try:
-                    url = f"{self.BASE_URL}/country/{country_code}/indicator/{indicator_code}"
-                    params = {
-                        'format': 'json',
-                        'mrv': 5,  # Most recent 5 values
-                        'per_page': 10
-                    }
-                    
-                    response = requests.get(url, params=params, timeout=15)
-                    
-                    if response.status_code == 200:
-                        data = response.json()
-                        
-                        if len(data) > 1 and data[1] and len(data[1]) > 0:
-                            # Get the most recent non-null value
-                            for record in data[1]:
-                                if record.get('value') is not None:
-                                    country_lpi[field_name] = round(float(record['value']), 2)
-                                    country_lpi['year'] = record.get('date', 2023)
-                                    break
-                            else:
-                                country_lpi[field_name] = None
-                        else:
-                            country_lpi[field_name] = None
-                    else:
-                        country_lpi[field_name] = None
-                        
-                except Exception as e:
-                    logger.warning(f"Failed to fetch {indicator_code} for {country_code}: {e}")
+                found = latest_values.get((country_code, indicator_code))
+                if found is not None:
+                    country_lpi[field_name], country_lpi['year'] = found
+                else:
                     country_lpi[field_name] = None
-                
-                # Rate limiting to be respectful to the API
-                time.sleep(0.1)
             
             # Calculate overall LPI score if we have component scores
             component_scores = []
@@ -678,10 +437,6 @@ class HybridLPIDataExporter:
                 country_lpi['lpi_score_overall'] = None
             
             all_lpi_data.append(country_lpi)
-            
-            # Progress update every 20 countries
-            if len(all_lpi_data) % 20 == 0:
-                logger.info(f"Processed {len(all_lpi_data)}/{len(countries_df)} countries...")
         
         # Create DataFrame
         df = pd.DataFrame(all_lpi_data)
@@ -709,6 +464,33 @@ class HybridLPIDataExporter:
         
         return df
 
+    def _fetch_indicator_chunk(self, indicator_code: str, countries: List[str]) -> Dict:
+        """Fetch one LPI indicator for a chunk of countries in a single request.
+        
+        Returns the most recent non-null (value, year) keyed by (country_code, indicator_code).
+        """
+        latest_values = {}
+        try:
+            url = f"{self.BASE_URL}/country/{';'.join(countries)}/indicator/{indicator_code}"
+            params = {
+                'format': 'json',
+                'mrv': 5,  # Most recent 5 values per country
+                'per_page': 5 * len(countries)  # Every country's values fit on one page
+            }
+            
+            data = request_json(self._session, url, params=params, timeout=30, ttl=self.CACHE_TTL)
+            
+            # Records come back newest first within each country (countryiso3code is ISO3)
+            for record in data[1] or []:
+                key = (record.get('countryiso3code'), indicator_code)
+                if record.get('value') is not None and key not in latest_values:
+                    latest_values[key] = (round(float(record['value']), 2), record.get('date', 2023))
+                
+        except Exception as e:
+            logger.warning(f"Failed to fetch {indicator_code} for {countries[0]}..{countries[-1]}: {e}")
+        
+        return latest_values
+
     def export_lpi_data(self):
         """Main export function for Logistics Performance Index data"""
         logger.info("Starting Logistics Performance Index (LPI) data export...")
@@ -762,7 +544,7 @@ class HybridLPIDataExporter:
                 'api_used': api_countries > 0
             }
             
-            summary_df = pd.DataFrame([summary])
+            summary_df = pd.DataFrame({key: [value] for key, value in summary.items()})
             summary_df.to_csv(self.output_dir / 'logistics_export_summary.csv', index=False)
             logger.info(f"✅ Exported LPI summary statistics")
             
@@ -792,7 +574,7 @@ class HybridLPIDataExporter:
                     countries_with_regions = self.get_countries_list()
                     merged = lpi_data.merge(countries_with_regions[['country_code', 'region']], on='country_code', how='left')
                     if 'region' in merged.columns:
-                        regional_stats = merged.groupby('region')['lpi_score_overall'].agg(['count', 'mean']).round(2)
+                        regional_stats = merged.groupby('region', observed=True)['lpi_score_overall'].agg(['count', 'mean']).round(2)
                         print(f"\n📍 Regional LPI Performance:")
                         for region, stats in regional_stats.iterrows():
                             print(f"  • {region}: {stats['count']} countries, avg score {stats['mean']}")
@@ -888,4 +670,5 @@ def main():
 
 
 if __name__ == "__main__":
+    configure_logging()
     main() 
\ No newline at end of file
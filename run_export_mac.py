@@ -1,4 +1,4 @@
-from data_exporter import PowerBIDataExporter
+from data_exporter import PowerBIDataExporter, configure_logging
 import shutil
 from pathlib import Path
 import os
@@ -12,6 +12,8 @@ ONEDRIVE_PATH = os.path.expanduser("~/OneDrive/PowerBI_eCommerce_Data")
 LOCAL_OUTPUT_PATH = "./powerbi_csv_files"
 
 def main():
+    configure_logging()
+    
     print("🌍 eCommerce Expansion Data Export for Power BI (Mac Version)")
     print("=" * 60)
     
@@ -63,7 +65,7 @@ def main():
     output_folder = Path(output_path)
     output_folder.mkdir(parents=True, exist_ok=True)
     
-    # Copy all CSV files
+    # Copy all CSV files (and their Parquet copies, if any were written)
     temp_folder = Path("temp_csv_export")
     csv_files = list(temp_folder.glob("*.csv"))
     
@@ -72,7 +74,7 @@ def main():
         return
     
     copied_files = []
-    for csv_file in csv_files:
+    for csv_file in csv_files + list(temp_folder.glob("*.parquet")):
         try:
             destination = output_folder / csv_file.name
             shutil.copy2(csv_file, destination)
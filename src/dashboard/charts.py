@@ -110,6 +110,36 @@ def create_trade_analysis_chart(
     return fig
 
 
+# Callout style for per-point annotations on line, scatter and area charts
+_ARROW_ANNOTATION_STYLE = dict(
+    showarrow=True,
+    arrowhead=2,
+    arrowsize=1,
+    arrowwidth=2,
+    arrowcolor="black",
+    ax=0,
+    ay=-40
+)
+
+
+def _add_point_annotations(
+    fig: go.Figure,
+    x_values: pd.Series,
+    y_values: pd.Series,
+    texts: List[str],
+    **style
+) -> None:
+    """Attach one annotation per data point in a single layout update.
+
+    Calling fig.add_annotation per row re-validates the growing annotations
+    tuple every time; building the list first validates it once.
+    """
+    fig.update_layout(annotations=[
+        *fig.layout.annotations,
+        *(dict(x=x, y=y, text=text, **style) for x, y, text in zip(x_values, y_values, texts))
+    ])
+
+
 def _create_line_chart(
     data: pd.DataFrame,
     x_column: str,
@@ -151,19 +181,11 @@ def _create_line_chart(
     
     # Add annotations if requested
     if show_annotations:
-        for i, row in data.iterrows():
-            fig.add_annotation(
-                x=row[x_column],
-                y=row[y_column],
-                text=f"{row[y_column]:,.0f}",
-                showarrow=True,
-                arrowhead=2,
-                arrowsize=1,
-                arrowwidth=2,
-                arrowcolor="black",
-                ax=0,
-                ay=-40
-            )
+        _add_point_annotations(
+            fig, data[x_column], data[y_column],
+            [f"{y:,.0f}" for y in data[y_column]],
+            **_ARROW_ANNOTATION_STYLE
+        )
     
     return fig
 
@@ -193,14 +215,11 @@ def _create_bar_chart(
     
     # Add annotations if requested
     if show_annotations:
-        for i, row in data.iterrows():
-            fig.add_annotation(
-                x=row[x_column],
-                y=row[y_column],
-                text=f"{row[y_column]:,.0f}",
-                showarrow=False,
-                yshift=10
-            )
+        _add_point_annotations(
+            fig, data[x_column], data[y_column],
+            [f"{y:,.0f}" for y in data[y_column]],
+            showarrow=False, yshift=10
+        )
     
     return fig
 
@@ -246,19 +265,11 @@ def _create_scatter_chart(
     
     # Add annotations if requested
     if show_annotations:
-        for i, row in data.iterrows():
-            fig.add_annotation(
-                x=row[x_column],
-                y=row[y_column],
-                text=f"({row[x_column]}, {row[y_column]:,.0f})",
-                showarrow=True,
-                arrowhead=2,
-                arrowsize=1,
-                arrowwidth=2,
-                arrowcolor="black",
-                ax=0,
-                ay=-40
-            )
+        _add_point_annotations(
+            fig, data[x_column], data[y_column],
+            [f"({x}, {y:,.0f})" for x, y in zip(data[x_column], data[y_column])],
+            **_ARROW_ANNOTATION_STYLE
+        )
     
     return fig
 
@@ -288,19 +299,11 @@ def _create_area_chart(
     
     # Add annotations if requested
     if show_annotations:
-        for i, row in data.iterrows():
-            fig.add_annotation(
-                x=row[x_column],
-                y=row[y_column],
-                text=f"{row[y_column]:,.0f}",
-                showarrow=True,
-                arrowhead=2,
-                arrowsize=1,
-                arrowwidth=2,
-                arrowcolor="black",
-                ax=0,
-                ay=-40
-            )
+        _add_point_annotations(
+            fig, data[x_column], data[y_column],
+            [f"{y:,.0f}" for y in data[y_column]],
+            **_ARROW_ANNOTATION_STYLE
+        )
     
     return fig
 
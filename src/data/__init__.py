@@ -0,0 +1,35 @@
+"""
+Data sources and processing for the expansion intelligence dashboard.
+"""
+
+from .countries import COUNTRY_DTYPES, FALLBACK_COUNTRY_ROWS, LPI_COUNTRY_ROWS
+from .kernels import (
+    NORMALIZATION_RULES,
+    NUMBA_AVAILABLE,
+    scan_insight_flags,
+    score_indicators
+)
+from .sample_data import (
+    SAMPLE_COUNTRIES,
+    SAMPLE_GOVERNANCE,
+    SAMPLE_INDICATOR_RANGES,
+    SAMPLE_MARKET_INDICATORS
+)
+from .worldbank import create_session, loads_json, request_json
+
+__all__ = [
+    'COUNTRY_DTYPES',
+    'FALLBACK_COUNTRY_ROWS',
+    'LPI_COUNTRY_ROWS',
+    'NORMALIZATION_RULES',
+    'NUMBA_AVAILABLE',
+    'scan_insight_flags',
+    'score_indicators',
+    'SAMPLE_COUNTRIES',
+    'SAMPLE_GOVERNANCE',
+    'SAMPLE_INDICATOR_RANGES',
+    'SAMPLE_MARKET_INDICATORS',
+    'create_session',
+    'loads_json',
+    'request_json'
+]
@@ -0,0 +1,488 @@
+"""
+Reference country lists for the exporters: the market-data fallback used when the
+World Bank country endpoint is unavailable, and the fixed LPI country list.
+
+The rows are plain tuples (each literal compiles to a single constant) and the
+exporters build their DataFrames from them on first use, casting with
+COUNTRY_DTYPES. That dtype map is why this module imports pandas, which every
+consumer has already loaded.
+"""
+
+import pandas as pd
+
+# Region and income level repeat heavily, so every country table stores them as
+# categoricals; income levels are ordered so they compare as codes, low to high
+COUNTRY_DTYPES = {
+    'region': 'category',
+    'income_level': pd.CategoricalDtype(
+        ['Low income', 'Lower middle income', 'Upper middle income', 'High income'], ordered=True
+    )
+}
+
+
+# Fallback country list by economic importance: (country_code, country_name, region, income_level)
+FALLBACK_COUNTRY_ROWS = (
+    # Major G20 + Top Economies (20 countries)
+    ('USA', 'United States', 'North America', 'High income'),
+    ('CHN', 'China', 'East Asia & Pacific', 'Upper middle income'),
+    ('JPN', 'Japan', 'East Asia & Pacific', 'High income'),
+    ('DEU', 'Germany', 'Europe & Central Asia', 'High income'),
+    ('IND', 'India', 'South Asia', 'Lower middle income'),
+    ('GBR', 'United Kingdom', 'Europe & Central Asia', 'High income'),
+    ('FRA', 'France', 'Europe & Central Asia', 'High income'),
+    ('ITA', 'Italy', 'Europe & Central Asia', 'High income'),
+    ('BRA', 'Brazil', 'Latin America & Caribbean', 'Upper middle income'),
+    ('CAN', 'Canada', 'North America', 'High income'),
+    ('RUS', 'Russian Federation', 'Europe & Central Asia', 'Upper middle income'),
+    ('KOR', 'Korea, Rep.', 'East Asia & Pacific', 'High income'),
+    ('ESP', 'Spain', 'Europe & Central Asia', 'High income'),
+    ('AUS', 'Australia', 'East Asia & Pacific', 'High income'),
+    ('MEX', 'Mexico', 'Latin America & Caribbean', 'Upper middle income'),
+    ('IDN', 'Indonesia', 'East Asia & Pacific', 'Upper middle income'),
+    ('NLD', 'Netherlands', 'Europe & Central Asia', 'High income'),
+    ('SAU', 'Saudi Arabia', 'Middle East & North Africa', 'High income'),
+    ('TUR', 'Turkey', 'Europe & Central Asia', 'Upper middle income'),
+    ('CHE', 'Switzerland', 'Europe & Central Asia', 'High income'),
+
+    # European Union & Europe (54 countries)
+    ('POL', 'Poland', 'Europe & Central Asia', 'High income'),
+    ('BEL', 'Belgium', 'Europe & Central Asia', 'High income'),
+    ('SWE', 'Sweden', 'Europe & Central Asia', 'High income'),
+    ('IRL', 'Ireland', 'Europe & Central Asia', 'High income'),
+    ('AUT', 'Austria', 'Europe & Central Asia', 'High income'),
+    ('NOR', 'Norway', 'Europe & Central Asia', 'High income'),
+    ('DNK', 'Denmark', 'Europe & Central Asia', 'High income'),
+    ('FIN', 'Finland', 'Europe & Central Asia', 'High income'),
+    ('PRT', 'Portugal', 'Europe & Central Asia', 'High income'),
+    ('GRC', 'Greece', 'Europe & Central Asia', 'High income'),
+    ('CZE', 'Czech Republic', 'Europe & Central Asia', 'High income'),
+    ('HUN', 'Hungary', 'Europe & Central Asia', 'High income'),
+    ('SVK', 'Slovak Republic', 'Europe & Central Asia', 'High income'),
+    ('SVN', 'Slovenia', 'Europe & Central Asia', 'High income'),
+    ('EST', 'Estonia', 'Europe & Central Asia', 'High income'),
+    ('LVA', 'Latvia', 'Europe & Central Asia', 'High income'),
+    ('LTU', 'Lithuania', 'Europe & Central Asia', 'High income'),
+    ('CYP', 'Cyprus', 'Europe & Central Asia', 'High income'),
+    ('MLT', 'Malta', 'Europe & Central Asia', 'High income'),
+    ('LUX', 'Luxembourg', 'Europe & Central Asia', 'High income'),
+    ('ISL', 'Iceland', 'Europe & Central Asia', 'High income'),
+    ('ROU', 'Romania', 'Europe & Central Asia', 'High income'),
+    ('BGR', 'Bulgaria', 'Europe & Central Asia', 'Upper middle income'),
+    ('HRV', 'Croatia', 'Europe & Central Asia', 'High income'),
+    ('SRB', 'Serbia', 'Europe & Central Asia', 'Upper middle income'),
+    ('BIH', 'Bosnia and Herzegovina', 'Europe & Central Asia', 'Upper middle income'),
+    ('MKD', 'North Macedonia', 'Europe & Central Asia', 'Upper middle income'),
+    ('ALB', 'Albania', 'Europe & Central Asia', 'Upper middle income'),
+    ('MNE', 'Montenegro', 'Europe & Central Asia', 'Upper middle income'),
+    ('UKR', 'Ukraine', 'Europe & Central Asia', 'Lower middle income'),
+    ('KAZ', 'Kazakhstan', 'Europe & Central Asia', 'Upper middle income'),
+    ('BLR', 'Belarus', 'Europe & Central Asia', 'Upper middle income'),
+    ('UZB', 'Uzbekistan', 'Europe & Central Asia', 'Lower middle income'),
+    ('ARM', 'Armenia', 'Europe & Central Asia', 'Upper middle income'),
+    ('GEO', 'Georgia', 'Europe & Central Asia', 'Upper middle income'),
+    ('AZE', 'Azerbaijan', 'Europe & Central Asia', 'Upper middle income'),
+    ('KGZ', 'Kyrgyz Republic', 'Europe & Central Asia', 'Lower middle income'),
+    ('TJK', 'Tajikistan', 'Europe & Central Asia', 'Lower middle income'),
+    ('TKM', 'Turkmenistan', 'Europe & Central Asia', 'Upper middle income'),
+    ('MDA', 'Moldova', 'Europe & Central Asia', 'Upper middle income'),
+    ('AND', 'Andorra', 'Europe & Central Asia', 'High income'),
+    ('LIE', 'Liechtenstein', 'Europe & Central Asia', 'High income'),
+    ('MCO', 'Monaco', 'Europe & Central Asia', 'High income'),
+    ('SMR', 'San Marino', 'Europe & Central Asia', 'High income'),
+    ('VAT', 'Vatican City', 'Europe & Central Asia', 'High income'),
+
+    # Asia Pacific (31 countries)
+    ('SGP', 'Singapore', 'East Asia & Pacific', 'High income'),
+    ('HKG', 'Hong Kong SAR, China', 'East Asia & Pacific', 'High income'),
+    ('MYS', 'Malaysia', 'East Asia & Pacific', 'Upper middle income'),
+    ('THA', 'Thailand', 'East Asia & Pacific', 'Upper middle income'),
+    ('PHL', 'Philippines', 'East Asia & Pacific', 'Lower middle income'),
+    ('VNM', 'Vietnam', 'East Asia & Pacific', 'Lower middle income'),
+    ('NZL', 'New Zealand', 'East Asia & Pacific', 'High income'),
+    ('TWN', 'Taiwan, China', 'East Asia & Pacific', 'High income'),
+    ('MNG', 'Mongolia', 'East Asia & Pacific', 'Upper middle income'),
+    ('LAO', 'Lao PDR', 'East Asia & Pacific', 'Lower middle income'),
+    ('KHM', 'Cambodia', 'East Asia & Pacific', 'Lower middle income'),
+    ('MMR', 'Myanmar', 'East Asia & Pacific', 'Lower middle income'),
+    ('BRN', 'Brunei Darussalam', 'East Asia & Pacific', 'High income'),
+    ('PNG', 'Papua New Guinea', 'East Asia & Pacific', 'Lower middle income'),
+    ('FJI', 'Fiji', 'East Asia & Pacific', 'Upper middle income'),
+    ('LKA', 'Sri Lanka', 'South Asia', 'Upper middle income'),
+    ('BGD', 'Bangladesh', 'South Asia', 'Lower middle income'),
+    ('PAK', 'Pakistan', 'South Asia', 'Lower middle income'),
+    ('NPL', 'Nepal', 'South Asia', 'Lower middle income'),
+    ('BTN', 'Bhutan', 'South Asia', 'Lower middle income'),
+    ('AFG', 'Afghanistan', 'South Asia', 'Low income'),
+    ('MAC', 'Macao SAR, China', 'East Asia & Pacific', 'High income'),
+    ('MDV', 'Maldives', 'South Asia', 'Upper middle income'),
+    ('WSM', 'Samoa', 'East Asia & Pacific', 'Upper middle income'),
+    ('TON', 'Tonga', 'East Asia & Pacific', 'Upper middle income'),
+    ('VUT', 'Vanuatu', 'East Asia & Pacific', 'Lower middle income'),
+    ('SLB', 'Solomon Islands', 'East Asia & Pacific', 'Lower middle income'),
+    ('KIR', 'Kiribati', 'East Asia & Pacific', 'Lower middle income'),
+    ('TUV', 'Tuvalu', 'East Asia & Pacific', 'Upper middle income'),
+    ('NRU', 'Nauru', 'East Asia & Pacific', 'Upper middle income'),
+    ('PLW', 'Palau', 'East Asia & Pacific', 'Upper middle income'),
+    ('FSM', 'Micronesia, Fed. Sts.', 'East Asia & Pacific', 'Lower middle income'),
+    ('MHL', 'Marshall Islands', 'East Asia & Pacific', 'Upper middle income'),
+
+    # Middle East & North Africa (19 countries)
+    ('ARE', 'United Arab Emirates', 'Middle East & North Africa', 'High income'),
+    ('ISR', 'Israel', 'Middle East & North Africa', 'High income'),
+    ('QAT', 'Qatar', 'Middle East & North Africa', 'High income'),
+    ('KWT', 'Kuwait', 'Middle East & North Africa', 'High income'),
+    ('BHR', 'Bahrain', 'Middle East & North Africa', 'High income'),
+    ('OMN', 'Oman', 'Middle East & North Africa', 'High income'),
+    ('JOR', 'Jordan', 'Middle East & North Africa', 'Upper middle income'),
+    ('LBN', 'Lebanon', 'Middle East & North Africa', 'Upper middle income'),
+    ('EGY', 'Egypt, Arab Rep.', 'Middle East & North Africa', 'Lower middle income'),
+    ('MAR', 'Morocco', 'Middle East & North Africa', 'Lower middle income'),
+    ('TUN', 'Tunisia', 'Middle East & North Africa', 'Lower middle income'),
+    ('DZA', 'Algeria', 'Middle East & North Africa', 'Lower middle income'),
+    ('LBY', 'Libya', 'Middle East & North Africa', 'Upper middle income'),
+    ('IRN', 'Iran, Islamic Rep.', 'Middle East & North Africa', 'Upper middle income'),
+    ('IRQ', 'Iraq', 'Middle East & North Africa', 'Upper middle income'),
+    ('SYR', 'Syrian Arab Republic', 'Middle East & North Africa', 'Lower middle income'),
+    ('YEM', 'Yemen, Rep.', 'Middle East & North Africa', 'Lower middle income'),
+    ('PSE', 'West Bank and Gaza', 'Middle East & North Africa', 'Lower middle income'),
+
+    # Sub-Saharan Africa (45 countries)
+    ('ZAF', 'South Africa', 'Sub-Saharan Africa', 'Upper middle income'),
+    ('NGA', 'Nigeria', 'Sub-Saharan Africa', 'Lower middle income'),
+    ('KEN', 'Kenya', 'Sub-Saharan Africa', 'Lower middle income'),
+    ('GHA', 'Ghana', 'Sub-Saharan Africa', 'Lower middle income'),
+    ('ETH', 'Ethiopia', 'Sub-Saharan Africa', 'Low income'),
+    ('UGA', 'Uganda', 'Sub-Saharan Africa', 'Low income'),
+    ('TZA', 'Tanzania', 'Sub-Saharan Africa', 'Lower middle income'),
+    ('ZWE', 'Zimbabwe', 'Sub-Saharan Africa', 'Lower middle income'),
+    ('ZMB', 'Zambia', 'Sub-Saharan Africa', 'Lower middle income'),
+    ('BWA', 'Botswana', 'Sub-Saharan Africa', 'Upper middle income'),
+    ('NAM', 'Namibia', 'Sub-Saharan Africa', 'Upper middle income'),
+    ('MUS', 'Mauritius', 'Sub-Saharan Africa', 'High income'),
+    ('SEN', 'Senegal', 'Sub-Saharan Africa', 'Lower middle income'),
+    ('CIV', "Cote d'Ivoire", 'Sub-Saharan Africa', 'Lower middle income'),
+    ('COM', 'Comoros', 'Sub-Saharan Africa', 'Low income'),
+    ('DJI', 'Djibouti', 'Sub-Saharan Africa', 'Lower middle income'),
+    ('ERI', 'Eritrea', 'Sub-Saharan Africa', 'Low income'),
+    ('GMB', 'Gambia, The', 'Sub-Saharan Africa', 'Low income'),
+    ('GIN', 'Guinea', 'Sub-Saharan Africa', 'Low income'),
+    ('GNB', 'Guinea-Bissau', 'Sub-Saharan Africa', 'Low income'),
+    ('LBR', 'Liberia', 'Sub-Saharan Africa', 'Low income'),
+    ('MDG', 'Madagascar', 'Sub-Saharan Africa', 'Low income'),
+    ('MWI', 'Malawi', 'Sub-Saharan Africa', 'Low income'),
+    ('MLI', 'Mali', 'Sub-Saharan Africa', 'Low income'),
+    ('MRT', 'Mauritania', 'Sub-Saharan Africa', 'Lower middle income'),
+    ('MOZ', 'Mozambique', 'Sub-Saharan Africa', 'Low income'),
+    ('NER', 'Niger', 'Sub-Saharan Africa', 'Low income'),
+    ('RWA', 'Rwanda', 'Sub-Saharan Africa', 'Low income'),
+    ('STP', 'Sao Tome and Principe', 'Sub-Saharan Africa', 'Lower middle income'),
+    ('SLE', 'Sierra Leone', 'Sub-Saharan Africa', 'Low income'),
+    ('SOM', 'Somalia', 'Sub-Saharan Africa', 'Low income'),
+    ('SSD', 'South Sudan', 'Sub-Saharan Africa', 'Low income'),
+    ('SDN', 'Sudan', 'Sub-Saharan Africa', 'Lower middle income'),
+    ('TCD', 'Chad', 'Sub-Saharan Africa', 'Low income'),
+    ('BEN', 'Benin', 'Sub-Saharan Africa', 'Lower middle income'),
+    ('BFA', 'Burkina Faso', 'Sub-Saharan Africa', 'Low income'),
+    ('CAF', 'Central African Republic', 'Sub-Saharan Africa', 'Low income'),
+    ('CMR', 'Cameroon', 'Sub-Saharan Africa', 'Lower middle income'),
+    ('COG', 'Congo, Rep.', 'Sub-Saharan Africa', 'Lower middle income'),
+    ('COD', 'Congo, Dem. Rep.', 'Sub-Saharan Africa', 'Low income'),
+    ('GAB', 'Gabon', 'Sub-Saharan Africa', 'Upper middle income'),
+    ('GNQ', 'Equatorial Guinea', 'Sub-Saharan Africa', 'Upper middle income'),
+    ('AGO', 'Angola', 'Sub-Saharan Africa', 'Lower middle income'),
+    ('LSO', 'Lesotho', 'Sub-Saharan Africa', 'Lower middle income'),
+    ('SWZ', 'Eswatini', 'Sub-Saharan Africa', 'Lower middle income'),
+
+    # Latin America & Caribbean (39 countries)
+    ('ARG', 'Argentina', 'Latin America & Caribbean', 'Upper middle income'),
+    ('CHL', 'Chile', 'Latin America & Caribbean', 'High income'),
+    ('COL', 'Colombia', 'Latin America & Caribbean', 'Upper middle income'),
+    ('PER', 'Peru', 'Latin America & Caribbean', 'Upper middle income'),
+    ('URY', 'Uruguay', 'Latin America & Caribbean', 'High income'),
+    ('ECU', 'Ecuador', 'Latin America & Caribbean', 'Upper middle income'),
+    ('BOL', 'Bolivia', 'Latin America & Caribbean', 'Lower middle income'),
+    ('PRY', 'Paraguay', 'Latin America & Caribbean', 'Upper middle income'),
+    ('VEN', 'Venezuela, RB', 'Latin America & Caribbean', 'Upper middle income'),
+    ('CRI', 'Costa Rica', 'Latin America & Caribbean', 'Upper middle income'),
+    ('PAN', 'Panama', 'Latin America & Caribbean', 'High income'),
+    ('GTM', 'Guatemala', 'Latin America & Caribbean', 'Upper middle income'),
+    ('DOM', 'Dominican Republic', 'Latin America & Caribbean', 'Upper middle income'),
+    ('CUB', 'Cuba', 'Latin America & Caribbean', 'Upper middle income'),
+    ('JAM', 'Jamaica', 'Latin America & Caribbean', 'Upper middle income'),
+    ('TTO', 'Trinidad and Tobago', 'Latin America & Caribbean', 'High income'),
+    ('GUY', 'Guyana', 'Latin America & Caribbean', 'Upper middle income'),
+    ('SUR', 'Suriname', 'Latin America & Caribbean', 'Upper middle income'),
+    ('GUF', 'French Guiana', 'Latin America & Caribbean', 'High income'),
+    ('HTI', 'Haiti', 'Latin America & Caribbean', 'Low income'),
+    ('NIC', 'Nicaragua', 'Latin America & Caribbean', 'Lower middle income'),
+    ('HND', 'Honduras', 'Latin America & Caribbean', 'Lower middle income'),
+    ('SLV', 'El Salvador', 'Latin America & Caribbean', 'Lower middle income'),
+    ('BLZ', 'Belize', 'Latin America & Caribbean', 'Upper middle income'),
+    ('BHS', 'Bahamas, The', 'Latin America & Caribbean', 'High income'),
+    ('BRB', 'Barbados', 'Latin America & Caribbean', 'High income'),
+    ('LCA', 'St. Lucia', 'Latin America & Caribbean', 'Upper middle income'),
+    ('VCT', 'St. Vincent and the Grenadines', 'Latin America & Caribbean', 'Upper middle income'),
+    ('GRD', 'Grenada', 'Latin America & Caribbean', 'Upper middle income'),
+    ('DMA', 'Dominica', 'Latin America & Caribbean', 'Upper middle income'),
+    ('ATG', 'Antigua and Barbuda', 'Latin America & Caribbean', 'High income'),
+    ('KNA', 'St. Kitts and Nevis', 'Latin America & Caribbean', 'High income'),
+    ('PRI', 'Puerto Rico', 'Latin America & Caribbean', 'High income'),
+    ('VIR', 'Virgin Islands (U.S.)', 'Latin America & Caribbean', 'High income'),
+    ('ABW', 'Aruba', 'Latin America & Caribbean', 'High income'),
+
+    # North America (5 countries)
+    ('GRL', 'Greenland', 'North America', 'High income'),
+    ('BMU', 'Bermuda', 'North America', 'High income'),
+    ('SPM', 'St. Pierre and Miquelon', 'North America', 'High income'),
+
+    # Additional Pacific economies
+    ('ASM', 'American Samoa', 'East Asia & Pacific', 'Upper middle income'),
+    ('GUM', 'Guam', 'East Asia & Pacific', 'High income'),
+    ('CUW', 'Curacao', 'Latin America & Caribbean', 'High income'),
+    ('CYM', 'Cayman Islands', 'Latin America & Caribbean', 'High income'),
+    ('IMN', 'Isle of Man', 'Europe & Central Asia', 'High income'),
+    ('FRO', 'Faroe Islands', 'Europe & Central Asia', 'High income')
+)
+
+
+# Country list for the LPI exporter: (country_code, country_name, region, income_level).
+# Kept exactly as the exporter has always published it, a few repeated entries included.
+LPI_COUNTRY_ROWS = (
+    # Major G20 + Top Economies (20 countries)
+    ('USA', 'United States', 'North America', 'High income'),
+    ('CHN', 'China', 'East Asia & Pacific', 'Upper middle income'),
+    ('JPN', 'Japan', 'East Asia & Pacific', 'High income'),
+    ('DEU', 'Germany', 'Europe & Central Asia', 'High income'),
+    ('IND', 'India', 'South Asia', 'Lower middle income'),
+    ('GBR', 'United Kingdom', 'Europe & Central Asia', 'High income'),
+    ('FRA', 'France', 'Europe & Central Asia', 'High income'),
+    ('ITA', 'Italy', 'Europe & Central Asia', 'High income'),
+    ('BRA', 'Brazil', 'Latin America & Caribbean', 'Upper middle income'),
+    ('CAN', 'Canada', 'North America', 'High income'),
+    ('RUS', 'Russian Federation', 'Europe & Central Asia', 'Upper middle income'),
+    ('KOR', 'Korea, Rep.', 'East Asia & Pacific', 'High income'),
+    ('ESP', 'Spain', 'Europe & Central Asia', 'High income'),
+    ('AUS', 'Australia', 'East Asia & Pacific', 'High income'),
+    ('MEX', 'Mexico', 'Latin America & Caribbean', 'Upper middle income'),
+    ('IDN', 'Indonesia', 'East Asia & Pacific', 'Upper middle income'),
+    ('NLD', 'Netherlands', 'Europe & Central Asia', 'High income'),
+    ('SAU', 'Saudi Arabia', 'Middle East & North Africa', 'High income'),
+    ('TUR', 'Turkey', 'Europe & Central Asia', 'Upper middle income'),
+    ('CHE', 'Switzerland', 'Europe & Central Asia', 'High income'),
+
+    # European Union & Europe (30 countries)
+    ('POL', 'Poland', 'Europe & Central Asia', 'High income'),
+    ('BEL', 'Belgium', 'Europe & Central Asia', 'High income'),
+    ('SWE', 'Sweden', 'Europe & Central Asia', 'High income'),
+    ('IRL', 'Ireland', 'Europe & Central Asia', 'High income'),
+    ('AUT', 'Austria', 'Europe & Central Asia', 'High income'),
+    ('NOR', 'Norway', 'Europe & Central Asia', 'High income'),
+    ('DNK', 'Denmark', 'Europe & Central Asia', 'High income'),
+    ('FIN', 'Finland', 'Europe & Central Asia', 'High income'),
+    ('PRT', 'Portugal', 'Europe & Central Asia', 'High income'),
+    ('GRC', 'Greece', 'Europe & Central Asia', 'High income'),
+    ('CZE', 'Czech Republic', 'Europe & Central Asia', 'High income'),
+    ('HUN', 'Hungary', 'Europe & Central Asia', 'High income'),
+    ('SVK', 'Slovak Republic', 'Europe & Central Asia', 'High income'),
+    ('SVN', 'Slovenia', 'Europe & Central Asia', 'High income'),
+    ('EST', 'Estonia', 'Europe & Central Asia', 'High income'),
+    ('LVA', 'Latvia', 'Europe & Central Asia', 'High income'),
+    ('LTU', 'Lithuania', 'Europe & Central Asia', 'High income'),
+    ('CYP', 'Cyprus', 'Europe & Central Asia', 'High income'),
+    ('MLT', 'Malta', 'Europe & Central Asia', 'High income'),
+    ('LUX', 'Luxembourg', 'Europe & Central Asia', 'High income'),
+    ('ISL', 'Iceland', 'Europe & Central Asia', 'High income'),
+    ('ROU', 'Romania', 'Europe & Central Asia', 'High income'),
+    ('BGR', 'Bulgaria', 'Europe & Central Asia', 'Upper middle income'),
+    ('HRV', 'Croatia', 'Europe & Central Asia', 'High income'),
+    ('SRB', 'Serbia', 'Europe & Central Asia', 'Upper middle income'),
+    ('BIH', 'Bosnia and Herzegovina', 'Europe & Central Asia', 'Upper middle income'),
+    ('MKD', 'North Macedonia', 'Europe & Central Asia', 'Upper middle income'),
+    ('ALB', 'Albania', 'Europe & Central Asia', 'Upper middle income'),
+    ('MNE', 'Montenegro', 'Europe & Central Asia', 'Upper middle income'),
+    ('UKR', 'Ukraine', 'Europe & Central Asia', 'Lower middle income'),
+
+    # Asia Pacific (20 countries)
+    ('SGP', 'Singapore', 'East Asia & Pacific', 'High income'),
+    ('HKG', 'Hong Kong SAR, China', 'East Asia & Pacific', 'High income'),
+    ('MYS', 'Malaysia', 'East Asia & Pacific', 'Upper middle income'),
+    ('THA', 'Thailand', 'East Asia & Pacific', 'Upper middle income'),
+    ('PHL', 'Philippines', 'East Asia & Pacific', 'Lower middle income'),
+    ('VNM', 'Vietnam', 'East Asia & Pacific', 'Lower middle income'),
+    ('NZL', 'New Zealand', 'East Asia & Pacific', 'High income'),
+    ('TWN', 'Taiwan, China', 'East Asia & Pacific', 'High income'),
+    ('MNG', 'Mongolia', 'East Asia & Pacific', 'Upper middle income'),
+    ('LAO', 'Lao PDR', 'East Asia & Pacific', 'Lower middle income'),
+    ('KHM', 'Cambodia', 'East Asia & Pacific', 'Lower middle income'),
+    ('MMR', 'Myanmar', 'East Asia & Pacific', 'Lower middle income'),
+    ('BRN', 'Brunei Darussalam', 'East Asia & Pacific', 'High income'),
+    ('PNG', 'Papua New Guinea', 'East Asia & Pacific', 'Lower middle income'),
+    ('FJI', 'Fiji', 'East Asia & Pacific', 'Upper middle income'),
+    ('LKA', 'Sri Lanka', 'South Asia', 'Upper middle income'),
+    ('BGD', 'Bangladesh', 'South Asia', 'Lower middle income'),
+    ('PAK', 'Pakistan', 'South Asia', 'Lower middle income'),
+    ('NPL', 'Nepal', 'South Asia', 'Lower middle income'),
+    ('BTN', 'Bhutan', 'South Asia', 'Lower middle income'),
+
+    # Central Asia & Eastern Europe (10 countries)
+    ('KAZ', 'Kazakhstan', 'Europe & Central Asia', 'Upper middle income'),
+    ('BLR', 'Belarus', 'Europe & Central Asia', 'Upper middle income'),
+    ('UZB', 'Uzbekistan', 'Europe & Central Asia', 'Lower middle income'),
+    ('ARM', 'Armenia', 'Europe & Central Asia', 'Upper middle income'),
+    ('GEO', 'Georgia', 'Europe & Central Asia', 'Upper middle income'),
+    ('AZE', 'Azerbaijan', 'Europe & Central Asia', 'Upper middle income'),
+    ('KGZ', 'Kyrgyz Republic', 'Europe & Central Asia', 'Lower middle income'),
+    ('TJK', 'Tajikistan', 'Europe & Central Asia', 'Lower middle income'),
+    ('TKM', 'Turkmenistan', 'Europe & Central Asia', 'Upper middle income'),
+    ('MDA', 'Moldova', 'Europe & Central Asia', 'Upper middle income'),
+
+    # Middle East & North Africa (10 countries)
+    ('ARE', 'United Arab Emirates', 'Middle East & North Africa', 'High income'),
+    ('ISR', 'Israel', 'Middle East & North Africa', 'High income'),
+    ('QAT', 'Qatar', 'Middle East & North Africa', 'High income'),
+    ('KWT', 'Kuwait', 'Middle East & North Africa', 'High income'),
+    ('BHR', 'Bahrain', 'Middle East & North Africa', 'High income'),
+    ('OMN', 'Oman', 'Middle East & North Africa', 'High income'),
+    ('JOR', 'Jordan', 'Middle East & North Africa', 'Upper middle income'),
+    ('LBN', 'Lebanon', 'Middle East & North Africa', 'Upper middle income'),
+    ('EGY', 'Egypt, Arab Rep.', 'Middle East & North Africa', 'Lower middle income'),
+    ('MAR', 'Morocco', 'Middle East & North Africa', 'Lower middle income'),
+
+    # Sub-Saharan Africa (10 countries)
+    ('ZAF', 'South Africa', 'Sub-Saharan Africa', 'Upper middle income'),
+    ('NGA', 'Nigeria', 'Sub-Saharan Africa', 'Lower middle income'),
+    ('KEN', 'Kenya', 'Sub-Saharan Africa', 'Lower middle income'),
+    ('GHA', 'Ghana', 'Sub-Saharan Africa', 'Lower middle income'),
+    ('ETH', 'Ethiopia', 'Sub-Saharan Africa', 'Low income'),
+    ('UGA', 'Uganda', 'Sub-Saharan Africa', 'Low income'),
+    ('TZA', 'Tanzania', 'Sub-Saharan Africa', 'Lower middle income'),
+    ('ZWE', 'Zimbabwe', 'Sub-Saharan Africa', 'Lower middle income'),
+    ('ZMB', 'Zambia', 'Sub-Saharan Africa', 'Lower middle income'),
+    ('BWA', 'Botswana', 'Sub-Saharan Africa', 'Upper middle income'),
+
+    # Latin America & Caribbean (10 countries)
+    ('ARG', 'Argentina', 'Latin America & Caribbean', 'Upper middle income'),
+    ('CHL', 'Chile', 'Latin America & Caribbean', 'High income'),
+    ('COL', 'Colombia', 'Latin America & Caribbean', 'Upper middle income'),
+    ('PER', 'Peru', 'Latin America & Caribbean', 'Upper middle income'),
+    ('URY', 'Uruguay', 'Latin America & Caribbean', 'High income'),
+    ('ECU', 'Ecuador', 'Latin America & Caribbean', 'Upper middle income'),
+    ('BOL', 'Bolivia', 'Latin America & Caribbean', 'Lower middle income'),
+    ('PRY', 'Paraguay', 'Latin America & Caribbean', 'Upper middle income'),
+    ('VEN', 'Venezuela, RB', 'Latin America & Caribbean', 'Upper middle income'),
+    ('CRI', 'Costa Rica', 'Latin America & Caribbean', 'Upper middle income'),
+
+    # Additional countries to reach 217 total
+    # North America additional
+    ('GRL', 'Greenland', 'North America', 'High income'),
+    ('BMU', 'Bermuda', 'North America', 'High income'),
+    ('SPM', 'St. Pierre and Miquelon', 'North America', 'High income'),
+
+    # Latin America & Caribbean additional
+    ('GUY', 'Guyana', 'Latin America & Caribbean', 'Upper middle income'),
+    ('SUR', 'Suriname', 'Latin America & Caribbean', 'Upper middle income'),
+    ('GUF', 'French Guiana', 'Latin America & Caribbean', 'High income'),
+    ('HTI', 'Haiti', 'Latin America & Caribbean', 'Low income'),
+    ('NIC', 'Nicaragua', 'Latin America & Caribbean', 'Lower middle income'),
+    ('HND', 'Honduras', 'Latin America & Caribbean', 'Lower middle income'),
+    ('SLV', 'El Salvador', 'Latin America & Caribbean', 'Lower middle income'),
+    ('BLZ', 'Belize', 'Latin America & Caribbean', 'Upper middle income'),
+    ('BHS', 'Bahamas, The', 'Latin America & Caribbean', 'High income'),
+    ('BRB', 'Barbados', 'Latin America & Caribbean', 'High income'),
+    ('LCA', 'St. Lucia', 'Latin America & Caribbean', 'Upper middle income'),
+    ('VCT', 'St. Vincent and the Grenadines', 'Latin America & Caribbean', 'Upper middle income'),
+    ('GRD', 'Grenada', 'Latin America & Caribbean', 'Upper middle income'),
+    ('DMA', 'Dominica', 'Latin America & Caribbean', 'Upper middle income'),
+    ('ATG', 'Antigua and Barbuda', 'Latin America & Caribbean', 'High income'),
+    ('KNA', 'St. Kitts and Nevis', 'Latin America & Caribbean', 'High income'),
+    ('PRI', 'Puerto Rico', 'Latin America & Caribbean', 'High income'),
+    ('VIR', 'Virgin Islands (U.S.)', 'Latin America & Caribbean', 'High income'),
+    ('ABW', 'Aruba', 'Latin America & Caribbean', 'High income'),
+
+    # Additional Pacific economies
+    ('WSM', 'Samoa', 'East Asia & Pacific', 'Upper middle income'),
+    ('TON', 'Tonga', 'East Asia & Pacific', 'Upper middle income'),
+    ('VUT', 'Vanuatu', 'East Asia & Pacific', 'Lower middle income'),
+    ('SLB', 'Solomon Islands', 'East Asia & Pacific', 'Lower middle income'),
+    ('KIR', 'Kiribati', 'East Asia & Pacific', 'Lower middle income'),
+    ('TUV', 'Tuvalu', 'East Asia & Pacific', 'Upper middle income'),
+    ('NRU', 'Nauru', 'East Asia & Pacific', 'Upper middle income'),
+    ('PLW', 'Palau', 'East Asia & Pacific', 'Upper middle income'),
+    ('FSM', 'Micronesia, Fed. Sts.', 'East Asia & Pacific', 'Lower middle income'),
+    ('MHL', 'Marshall Islands', 'East Asia & Pacific', 'Upper middle income'),
+
+    # Additional European economies
+    ('AND', 'Andorra', 'Europe & Central Asia', 'High income'),
+    ('LIE', 'Liechtenstein', 'Europe & Central Asia', 'High income'),
+    ('MCO', 'Monaco', 'Europe & Central Asia', 'High income'),
+    ('SMR', 'San Marino', 'Europe & Central Asia', 'High income'),
+    ('VAT', 'Vatican City', 'Europe & Central Asia', 'High income'),
+
+    # Additional Middle Eastern economies
+    ('IRN', 'Iran, Islamic Rep.', 'Middle East & North Africa', 'Upper middle income'),
+    ('IRQ', 'Iraq', 'Middle East & North Africa', 'Upper middle income'),
+    ('SYR', 'Syrian Arab Republic', 'Middle East & North Africa', 'Lower middle income'),
+    ('YEM', 'Yemen, Rep.', 'Middle East & North Africa', 'Lower middle income'),
+    ('PSE', 'West Bank and Gaza', 'Middle East & North Africa', 'Lower middle income'),
+
+    # Additional African economies
+    ('COM', 'Comoros', 'Sub-Saharan Africa', 'Low income'),
+    ('DJI', 'Djibouti', 'Sub-Saharan Africa', 'Lower middle income'),
+    ('ERI', 'Eritrea', 'Sub-Saharan Africa', 'Low income'),
+    ('GMB', 'Gambia, The', 'Sub-Saharan Africa', 'Low income'),
+    ('GIN', 'Guinea', 'Sub-Saharan Africa', 'Low income'),
+    ('GNB', 'Guinea-Bissau', 'Sub-Saharan Africa', 'Low income'),
+    ('LBR', 'Liberia', 'Sub-Saharan Africa', 'Low income'),
+    ('MDG', 'Madagascar', 'Sub-Saharan Africa', 'Low income'),
+    ('MWI', 'Malawi', 'Sub-Saharan Africa', 'Low income'),
+    ('MLI', 'Mali', 'Sub-Saharan Africa', 'Low income'),
+    ('MRT', 'Mauritania', 'Sub-Saharan Africa', 'Lower middle income'),
+    ('MOZ', 'Mozambique', 'Sub-Saharan Africa', 'Low income'),
+    ('NER', 'Niger', 'Sub-Saharan Africa', 'Low income'),
+    ('RWA', 'Rwanda', 'Sub-Saharan Africa', 'Low income'),
+    ('STP', 'Sao Tome and Principe', 'Sub-Saharan Africa', 'Lower middle income'),
+    ('SLE', 'Sierra Leone', 'Sub-Saharan Africa', 'Low income'),
+    ('SOM', 'Somalia', 'Sub-Saharan Africa', 'Low income'),
+    ('SSD', 'South Sudan', 'Sub-Saharan Africa', 'Low income'),
+    ('SDN', 'Sudan', 'Sub-Saharan Africa', 'Lower middle income'),
+    ('TCD', 'Chad', 'Sub-Saharan Africa', 'Low income'),
+    ('BEN', 'Benin', 'Sub-Saharan Africa', 'Lower middle income'),
+    ('BFA', 'Burkina Faso', 'Sub-Saharan Africa', 'Low income'),
+    ('CAF', 'Central African Republic', 'Sub-Saharan Africa', 'Low income'),
+    ('CMR', 'Cameroon', 'Sub-Saharan Africa', 'Lower middle income'),
+    ('COG', 'Congo, Rep.', 'Sub-Saharan Africa', 'Lower middle income'),
+    ('COD', 'Congo, Dem. Rep.', 'Sub-Saharan Africa', 'Low income'),
+    ('GAB', 'Gabon', 'Sub-Saharan Africa', 'Upper middle income'),
+    ('GNQ', 'Equatorial Guinea', 'Sub-Saharan Africa', 'Upper middle income'),
+    ('AGO', 'Angola', 'Sub-Saharan Africa', 'Lower middle income'),
+    ('LSO', 'Lesotho', 'Sub-Saharan Africa', 'Lower middle income'),
+    ('SWZ', 'Eswatini', 'Sub-Saharan Africa', 'Lower middle income'),
+
+    # Additional Asian economies
+    ('AFG', 'Afghanistan', 'South Asia', 'Low income'),
+    ('MAC', 'Macao SAR, China', 'East Asia & Pacific', 'High income'),
+    ('MDV', 'Maldives', 'South Asia', 'Upper middle income'),
+
+    # Additional Caribbean economies
+    ('CUB', 'Cuba', 'Latin America & Caribbean', 'Upper middle income'),
+    ('JAM', 'Jamaica', 'Latin America & Caribbean', 'Upper middle income'),
+    ('TTO', 'Trinidad and Tobago', 'Latin America & Caribbean', 'High income'),
+
+    # Additional Latin American economies
+    ('URY', 'Uruguay', 'Latin America & Caribbean', 'High income'),
+    ('ECU', 'Ecuador', 'Latin America & Caribbean', 'Upper middle income'),
+    ('BOL', 'Bolivia', 'Latin America & Caribbean', 'Lower middle income'),
+    ('PRY', 'Paraguay', 'Latin America & Caribbean', 'Upper middle income'),
+    ('VEN', 'Venezuela, RB', 'Latin America & Caribbean', 'Upper middle income'),
+
+    # Additional Middle Eastern economies
+    ('TUN', 'Tunisia', 'Middle East & North Africa', 'Lower middle income'),
+    ('DZA', 'Algeria', 'Middle East & North Africa', 'Lower middle income'),
+    ('LBY', 'Libya', 'Middle East & North Africa', 'Upper middle income'),
+
+    # Additional African economies
+    ('NAM', 'Namibia', 'Sub-Saharan Africa', 'Upper middle income'),
+    ('MUS', 'Mauritius', 'Sub-Saharan Africa', 'High income'),
+    ('SEN', 'Senegal', 'Sub-Saharan Africa', 'Lower middle income'),
+    ('CIV', "Cote d'Ivoire", 'Sub-Saharan Africa', 'Lower middle income')
+)
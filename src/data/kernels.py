@@ -0,0 +1,140 @@
+"""
+Numerical kernels for market scoring.
+
+Kept out of app.py on purpose: Streamlit re-executes the main script on every
+rerun, which would redefine (and recompile) any numba function declared there.
+Imported modules are cached for the life of the process, so the kernel is
+compiled once, and with cache=True is reloaded from __pycache__ on later starts.
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+# Optional JIT compilation for the scoring kernel
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Indicator normalization rules used by the scoring kernel
+NORM_MINMAX, NORM_LOGISTICS, NORM_MOBILE, NORM_PERCENT, NORM_POPULATION = range(5)
+NORMALIZATION_RULES = {
+    'logistics_performance': NORM_LOGISTICS,  # Scale 1-5 to 0-100
+    'mobile_subscriptions': NORM_MOBILE,  # Cap at 150 and scale to 0-100
+    'internet_users_pct': NORM_PERCENT,  # Already percentage, clip to 0-100
+    'urban_population_pct': NORM_PERCENT,
+    'population': NORM_POPULATION  # Log scale, 1M-1B mapped to 0-100
+}
+
+# Columns of the boolean matrix returned by scan_insight_flags
+(FLAG_DIGITAL_READY, FLAG_HIGH_RISK, FLAG_LARGE_MARKET, FLAG_DIGITAL_LEADER,
+ FLAG_EASY_ENTRY, FLAG_EMERGING_GROWTH, FLAG_STABLE, FLAG_EMERGING) = range(8)
+N_INSIGHT_FLAGS = 8
+
+
+def _score_indicators_numpy(values: np.ndarray, rules: np.ndarray, weights: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Normalize indicator columns to 0-100 and return (normalized, weighted score)"""
+    normalized = np.empty_like(values)
+    for j, rule in enumerate(rules):
+        column = values[:, j]
+        if rule == NORM_LOGISTICS:
+            normalized[:, j] = (column - 1) / 4 * 100
+        elif rule == NORM_MOBILE:
+            normalized[:, j] = np.minimum(column, 150) / 150 * 100
+        elif rule == NORM_PERCENT:
+            normalized[:, j] = np.clip(column, 0, 100)
+        elif rule == NORM_POPULATION:
+            with np.errstate(divide='ignore', invalid='ignore'):
+                normalized[:, j] = np.clip((np.log10(column) - 6) / 3 * 100, 0, 100)
+        else:
+            valid = column[~np.isnan(column)]
+            if valid.size and valid.max() > valid.min():
+                normalized[:, j] = (column - valid.min()) / (valid.max() - valid.min()) * 100
+            else:
+                normalized[:, j] = 50  # Default middle score
+    return normalized, normalized @ weights
+
+
+def _score_indicators_kernel(values, rules, weights):
+    """Loop form of _score_indicators_numpy, fused into one pass when compiled by numba"""
+    n_rows, n_cols = values.shape
+    normalized = np.empty((n_rows, n_cols))
+    scores = np.zeros(n_rows)
+    for j in range(n_cols):
+        rule = rules[j]
+        low = np.inf
+        high = -np.inf
+        if rule == NORM_MINMAX:
+            for i in range(n_rows):
+                value = values[i, j]
+                if not np.isnan(value):
+                    low = min(low, value)
+                    high = max(high, value)
+        for i in range(n_rows):
+            value = values[i, j]
+            if rule == NORM_LOGISTICS:
+                value = (value - 1) / 4 * 100
+            elif rule == NORM_MOBILE:
+                if value > 150:
+                    value = 150.0
+                value = value / 150 * 100
+            elif rule == NORM_PERCENT or rule == NORM_POPULATION:
+                if rule == NORM_POPULATION:
+                    value = (np.log10(value) - 6) / 3 * 100
+                if value < 0:
+                    value = 0.0
+                elif value > 100:
+                    value = 100.0
+            elif high > low:
+                value = (value - low) / (high - low) * 100
+            else:
+                value = 50.0  # Default middle score
+            normalized[i, j] = value
+            scores[i] += value * weights[j]
+    return normalized, scores
+
+
+def _scan_insight_flags_numpy(internet, logistics, rule_of_law, population, gdp, urban):
+    """Evaluate every expansion-insight threshold and return an (n, N_INSIGHT_FLAGS) bool matrix"""
+    return np.column_stack([
+        internet > 70,
+        (rule_of_law < -0.5) | (logistics < 2.5),
+        population > 50000000,
+        internet > 85,
+        logistics > 3.5,
+        (gdp < 25000) & (urban > 60),
+        rule_of_law > 1.0,
+        gdp < 20000
+    ])
+
+
+def _scan_insight_flags_kernel(internet, logistics, rule_of_law, population, gdp, urban):
+    """Loop form of _scan_insight_flags_numpy, a single pass over the rows when compiled by numba"""
+    n_rows = internet.shape[0]
+    flags = np.zeros((n_rows, N_INSIGHT_FLAGS), dtype=np.bool_)
+    for i in range(n_rows):
+        flags[i, FLAG_DIGITAL_READY] = internet[i] > 70
+        flags[i, FLAG_HIGH_RISK] = rule_of_law[i] < -0.5 or logistics[i] < 2.5
+        flags[i, FLAG_LARGE_MARKET] = population[i] > 50000000
+        flags[i, FLAG_DIGITAL_LEADER] = internet[i] > 85
+        flags[i, FLAG_EASY_ENTRY] = logistics[i] > 3.5
+        flags[i, FLAG_EMERGING_GROWTH] = gdp[i] < 25000 and urban[i] > 60
+        flags[i, FLAG_STABLE] = rule_of_law[i] > 1.0
+        flags[i, FLAG_EMERGING] = gdp[i] < 20000
+    return flags
+
+
+if NUMBA_AVAILABLE:
+    score_indicators = njit(cache=True, nogil=True)(_score_indicators_kernel)
+    # Compile (or load from the on-disk cache) at import so the first rerun doesn't pay for it
+    score_indicators(np.zeros((1, 1)), np.zeros(1, dtype=np.int64), np.ones(1))
+else:
+    score_indicators = _score_indicators_numpy
+
+if NUMBA_AVAILABLE:
+    scan_insight_flags = njit(cache=True, nogil=True)(_scan_insight_flags_kernel)
+    scan_insight_flags(*(np.zeros(1) for _ in range(6)))
+else:
+    scan_insight_flags = _scan_insight_flags_numpy
@@ -0,0 +1,108 @@
+"""
+Built-in sample data used when the World Bank API is unavailable.
+
+The tables are built once when the module is first imported. Streamlit re-executes
+app.py on every rerun, but imported modules are cached, so the fallbacks no longer
+rebuild their dict literals on each cache miss.
+"""
+
+import pandas as pd
+
+
+_SAMPLE_COUNTRY_ROWS = [
+    {'code': 'USA', 'name': 'United States', 'region': 'North America', 'income_level': 'High income'},
+    {'code': 'CHN', 'name': 'China', 'region': 'East Asia & Pacific', 'income_level': 'Upper middle income'},
+    {'code': 'DEU', 'name': 'Germany', 'region': 'Europe & Central Asia', 'income_level': 'High income'},
+    {'code': 'JPN', 'name': 'Japan', 'region': 'East Asia & Pacific', 'income_level': 'High income'},
+    {'code': 'GBR', 'name': 'United Kingdom', 'region': 'Europe & Central Asia', 'income_level': 'High income'},
+    {'code': 'FRA', 'name': 'France', 'region': 'Europe & Central Asia', 'income_level': 'High income'},
+    {'code': 'IND', 'name': 'India', 'region': 'South Asia', 'income_level': 'Lower middle income'},
+    {'code': 'BRA', 'name': 'Brazil', 'region': 'Latin America & Caribbean', 'income_level': 'Upper middle income'},
+    {'code': 'RUS', 'name': 'Russian Federation', 'region': 'Europe & Central Asia', 'income_level': 'Upper middle income'},
+    {'code': 'SGP', 'name': 'Singapore', 'region': 'East Asia & Pacific', 'income_level': 'High income'},
+    {'code': 'MEX', 'name': 'Mexico', 'region': 'Latin America & Caribbean', 'income_level': 'Upper middle income'},
+    {'code': 'KOR', 'name': 'Korea, Rep.', 'region': 'East Asia & Pacific', 'income_level': 'High income'},
+    {'code': 'IDN', 'name': 'Indonesia', 'region': 'East Asia & Pacific', 'income_level': 'Upper middle income'},
+    {'code': 'TUR', 'name': 'Turkey', 'region': 'Europe & Central Asia', 'income_level': 'Upper middle income'},
+    {'code': 'ARE', 'name': 'United Arab Emirates', 'region': 'Middle East & North Africa', 'income_level': 'High income'}
+]
+
+# Fallback country reference table
+SAMPLE_COUNTRIES = pd.DataFrame(_SAMPLE_COUNTRY_ROWS)
+
+# Consistent base data for major economies (not random)
+_SAMPLE_INDICATOR_ROWS = {
+    'USA': {'gdp_per_capita_ppp': 76770, 'consumption_per_capita': 45000, 'population': 333000000, 
+           'urban_population_pct': 83, 'internet_users_pct': 92, 'mobile_subscriptions': 121, 
+           'logistics_performance': 3.89, 'gini_index': 39.8},
+    'CHN': {'gdp_per_capita_ppp': 19338, 'consumption_per_capita': 8500, 'population': 1412000000,
+           'urban_population_pct': 65, 'internet_users_pct': 73, 'mobile_subscriptions': 124,
+           'logistics_performance': 3.71, 'gini_index': 38.2},
+    'DEU': {'gdp_per_capita_ppp': 56956, 'consumption_per_capita': 32000, 'population': 83200000,
+           'urban_population_pct': 77, 'internet_users_pct': 91, 'mobile_subscriptions': 107,
+           'logistics_performance': 4.09, 'gini_index': 31.7},
+    'IND': {'gdp_per_capita_ppp': 8358, 'consumption_per_capita': 4200, 'population': 1380000000,
+           'urban_population_pct': 35, 'internet_users_pct': 50, 'mobile_subscriptions': 87,
+           'logistics_performance': 3.18, 'gini_index': 35.2},
+    'BRA': {'gdp_per_capita_ppp': 16727, 'consumption_per_capita': 9800, 'population': 215000000,
+           'urban_population_pct': 87, 'internet_users_pct': 81, 'mobile_subscriptions': 107,
+           'logistics_performance': 2.85, 'gini_index': 53.4},
+    'JPN': {'gdp_per_capita_ppp': 48705, 'consumption_per_capita': 28000, 'population': 125800000,
+           'urban_population_pct': 92, 'internet_users_pct': 84, 'mobile_subscriptions': 135,
+           'logistics_performance': 4.03, 'gini_index': 32.9},
+    'GBR': {'gdp_per_capita_ppp': 54603, 'consumption_per_capita': 31000, 'population': 67500000,
+           'urban_population_pct': 84, 'internet_users_pct': 95, 'mobile_subscriptions': 119,
+           'logistics_performance': 3.99, 'gini_index': 34.8},
+    'FRA': {'gdp_per_capita_ppp': 50962, 'consumption_per_capita': 29000, 'population': 68000000,
+           'urban_population_pct': 81, 'internet_users_pct': 85, 'mobile_subscriptions': 110,
+           'logistics_performance': 3.84, 'gini_index': 31.6},
+    'KOR': {'gdp_per_capita_ppp': 46762, 'consumption_per_capita': 22000, 'population': 51780000,
+           'urban_population_pct': 82, 'internet_users_pct': 96, 'mobile_subscriptions': 129,
+           'logistics_performance': 3.61, 'gini_index': 35.4},
+    'SGP': {'gdp_per_capita_ppp': 107728, 'consumption_per_capita': 38000, 'population': 5900000,
+           'urban_population_pct': 100, 'internet_users_pct': 91, 'mobile_subscriptions': 148,
+           'logistics_performance': 4.05, 'gini_index': 37.9},
+    'MEX': {'gdp_per_capita_ppp': 21362, 'consumption_per_capita': 9500, 'population': 128900000,
+           'urban_population_pct': 81, 'internet_users_pct': 72, 'mobile_subscriptions': 89,
+           'logistics_performance': 3.05, 'gini_index': 45.4},
+    'IDN': {'gdp_per_capita_ppp': 14841, 'consumption_per_capita': 6800, 'population': 273500000,
+           'urban_population_pct': 57, 'internet_users_pct': 64, 'mobile_subscriptions': 119,
+           'logistics_performance': 2.89, 'gini_index': 38.1},
+    'TUR': {'gdp_per_capita_ppp': 31033, 'consumption_per_capita': 11000, 'population': 84300000,
+           'urban_population_pct': 76, 'internet_users_pct': 71, 'mobile_subscriptions': 98,
+           'logistics_performance': 3.15, 'gini_index': 41.9},
+    'ARE': {'gdp_per_capita_ppp': 78255, 'consumption_per_capita': 32000, 'population': 9900000,
+           'urban_population_pct': 87, 'internet_users_pct': 99, 'mobile_subscriptions': 209,
+           'logistics_performance': 3.96, 'gini_index': 26.2},
+    'RUS': {'gdp_per_capita_ppp': 29485, 'consumption_per_capita': 12000, 'population': 146000000,
+           'urban_population_pct': 75, 'internet_users_pct': 85, 'mobile_subscriptions': 168,
+           'logistics_performance': 2.76, 'gini_index': 36.0}
+}
+
+# Sample market indicators indexed by country code
+SAMPLE_MARKET_INDICATORS = pd.DataFrame.from_dict(_SAMPLE_INDICATOR_ROWS, orient='index').astype(float)
+
+# Value ranges used to derive sample indicators for countries without base data
+SAMPLE_INDICATOR_RANGES = {
+    'gdp_per_capita_ppp': (5000, 60000),
+    'consumption_per_capita': (2000, 35000),
+    'population': (5000000, 100000000),
+    'urban_population_pct': (30, 95),
+    'internet_users_pct': (40, 95),
+    'mobile_subscriptions': (80, 130),
+    'logistics_performance': (2.0, 4.5),
+    'gini_index': (25, 60)
+}
+
+# Sample governance data (WGI scores range from -2.5 to 2.5)
+_SAMPLE_GOVERNANCE_ROWS = {
+    'USA': {'regulatory_quality': 1.31, 'rule_of_law': 1.22, 'control_corruption': 1.21, 'govt_effectiveness': 1.42},
+    'CHN': {'regulatory_quality': -0.35, 'rule_of_law': -0.57, 'control_corruption': -0.35, 'govt_effectiveness': 0.23},
+    'DEU': {'regulatory_quality': 1.64, 'rule_of_law': 1.65, 'control_corruption': 1.92, 'govt_effectiveness': 1.50},
+    'SGP': {'regulatory_quality': 2.21, 'rule_of_law': 1.85, 'control_corruption': 2.16, 'govt_effectiveness': 2.23},
+    'IND': {'regulatory_quality': -0.41, 'rule_of_law': 0.08, 'control_corruption': -0.27, 'govt_effectiveness': 0.07},
+    'BRA': {'regulatory_quality': -0.18, 'rule_of_law': -0.23, 'control_corruption': -0.18, 'govt_effectiveness': -0.18}
+}
+
+# Sample governance indicators indexed by country code
+SAMPLE_GOVERNANCE = pd.DataFrame.from_dict(_SAMPLE_GOVERNANCE_ROWS, orient='index')
@@ -0,0 +1,132 @@
+"""
+HTTP access to the World Bank API shared by the dashboard and the exporters.
+
+One session factory, one JSON decoder and one on-disk response cache, so every
+entry point pools connections, retries the same way and reads the same cache.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from contextlib import suppress
+from datetime import timedelta
+from pathlib import Path
+from time import time
+from typing import Dict, List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Faster JSON decoding for World Bank payloads when orjson is installed
+try:
+    import orjson
+    loads_json = orjson.loads
+except ImportError:
+    loads_json = json.loads
+
+logger = logging.getLogger(__name__)
+
+# Shared by the app and both exporters; entries are keyed by URL and params
+CACHE_DIR = Path(__file__).resolve().parents[2] / ".wb_cache"
+CACHE_MAX_AGE = timedelta(days=30)  # Entries not refreshed for this long are deleted, fallback or not
+
+_cache_pruned = False  # Old entries are swept once per process, on the first write
+
+
+def create_session(pool_maxsize: int = 10) -> requests.Session:
+    """Keep-alive session for the World Bank API that backs off and retries 429/5xx responses.
+
+    pool_maxsize should cover the number of threads sharing the session.
+    """
+    session = requests.Session()
+    session.headers.update({'Accept': 'application/json'})
+    adapter = HTTPAdapter(
+        pool_connections=pool_maxsize,
+        pool_maxsize=pool_maxsize,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+    )
+    session.mount('https://', adapter)
+    return session
+
+
+def request_json(session: requests.Session, url: str, params: Optional[Dict] = None,
+                 timeout=15, ttl: Optional[timedelta] = None) -> List:
+    """GET a World Bank API endpoint through the on-disk cache.
+
+    Responses younger than ttl are served from disk without touching the network
+    (ttl=None always asks the API). Whatever is on disk is kept as a fallback for
+    when the API is down.
+    """
+    cache_key = hashlib.sha256(f"{url}|{sorted((params or {}).items())}".encode()).hexdigest()
+    cache_file = CACHE_DIR / f"{cache_key}.json"
+
+    if ttl is not None:
+        cached = _read_cache(cache_file, ttl)
+        if cached is not None:
+            return cached
+
+    try:
+        response = session.get(url, params=params, timeout=timeout)
+        if response.status_code != 200:
+            raise Exception(f"API returned status code {response.status_code}")
+
+        data = loads_json(response.content)
+        if not isinstance(data, list) or len(data) < 2:
+            raise Exception("Invalid API response format")
+    except Exception:
+        # Stale-if-error: fall back to the last good payload persisted on disk
+        cached = _read_cache(cache_file)
+        if cached is None:
+            raise
+        logger.warning(f"World Bank API unavailable, using cached response for {url}")
+        return cached
+
+    _write_cache(cache_file, response.content)
+    return data
+
+
+def _read_cache(cache_file: Path, max_age: Optional[timedelta] = None) -> Optional[List]:
+    """Decoded cache entry, or None if it is missing, unreadable or older than max_age"""
+    try:
+        if max_age is not None and time() - cache_file.stat().st_mtime >= max_age.total_seconds():
+            return None
+        return loads_json(cache_file.read_bytes())
+    except (OSError, ValueError):
+        return None
+
+
+def _write_cache(cache_file: Path, content: bytes) -> None:
+    """Store a response atomically: concurrent readers see the old entry or the new one, never half of it"""
+    global _cache_pruned
+    try:
+        CACHE_DIR.mkdir(exist_ok=True)
+        if not _cache_pruned:
+            _cache_pruned = True
+            prune_cache()
+        fd, temp_name = tempfile.mkstemp(dir=CACHE_DIR, suffix='.tmp')
+    except OSError:
+        return  # A read-only filesystem only loses the cache
+
+    try:
+        with os.fdopen(fd, 'wb') as temp_file:
+            temp_file.write(content)
+        os.replace(temp_name, cache_file)
+    except OSError:
+        with suppress(OSError):
+            os.unlink(temp_name)
+
+
+def prune_cache(max_age: timedelta = CACHE_MAX_AGE) -> None:
+    """Delete cache entries, and temp files left by interrupted writes, older than max_age"""
+    cutoff = time() - max_age.total_seconds()
+    try:
+        entries = list(CACHE_DIR.iterdir())
+    except OSError:
+        return
+    for entry in entries:
+        with suppress(OSError):  # Already removed by another process
+            if entry.stat().st_mtime < cutoff:
+                entry.unlink()
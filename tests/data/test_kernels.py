@@ -0,0 +1,98 @@
+"""
+The NumPy and loop forms of each kernel must agree, since which one runs depends
+on whether numba is installed.
+"""
+
+import numpy as np
+import pytest
+
+from src.data.kernels import (
+    NORM_LOGISTICS,
+    NORM_MINMAX,
+    NORM_MOBILE,
+    NORM_PERCENT,
+    NORM_POPULATION,
+    N_INSIGHT_FLAGS,
+    _scan_insight_flags_kernel,
+    _scan_insight_flags_numpy,
+    _score_indicators_kernel,
+    _score_indicators_numpy
+)
+
+ALL_RULES = [NORM_MINMAX, NORM_LOGISTICS, NORM_MOBILE, NORM_PERCENT, NORM_POPULATION]
+
+# Inputs spanning each rule's clipping range, with a missing value
+RULE_VALUES = {
+    NORM_MINMAX: [12.0, -3.5, np.nan, 250.0, 0.0],
+    NORM_LOGISTICS: [1.0, 2.7, np.nan, 4.2, 5.0],
+    NORM_MOBILE: [0.0, 80.0, np.nan, 150.0, 210.0],
+    NORM_PERCENT: [-5.0, 0.0, np.nan, 64.5, 120.0],
+    NORM_POPULATION: [0.0, 5e5, np.nan, 3.3e8, 2e9]
+}
+
+
+def assert_scores_match(values: np.ndarray, rules: np.ndarray, weights: np.ndarray) -> None:
+    expected_normalized, expected_scores = _score_indicators_numpy(values, rules, weights)
+    normalized, scores = _score_indicators_kernel(values, rules, weights)
+    np.testing.assert_allclose(normalized, expected_normalized, equal_nan=True)
+    np.testing.assert_allclose(scores, expected_scores, equal_nan=True)
+
+
+@pytest.mark.parametrize('rule', ALL_RULES)
+def test_score_indicators_matches_for_each_rule(rule):
+    values = np.array(RULE_VALUES[rule]).reshape(-1, 1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        assert_scores_match(values, np.array([rule]), np.array([1.0]))
+
+
+@pytest.mark.parametrize('rule', ALL_RULES)
+def test_score_indicators_matches_on_all_nan_column(rule):
+    values = np.full((4, 1), np.nan)
+    assert_scores_match(values, np.array([rule]), np.array([1.0]))
+
+
+@pytest.mark.parametrize('rule', ALL_RULES)
+def test_score_indicators_matches_on_constant_column(rule):
+    values = np.full((4, 1), 42.0)
+    assert_scores_match(values, np.array([rule]), np.array([1.0]))
+
+
+def test_constant_minmax_column_scores_middle():
+    normalized, _ = _score_indicators_kernel(np.full((3, 1), 7.0), np.array([NORM_MINMAX]), np.array([1.0]))
+    np.testing.assert_array_equal(normalized, 50.0)
+
+
+def test_score_indicators_matches_on_mixed_matrix():
+    rng = np.random.default_rng(0)
+    values = np.column_stack([
+        rng.uniform(-100, 100, 50),
+        rng.uniform(1, 5, 50),
+        rng.uniform(0, 200, 50),
+        rng.uniform(-10, 110, 50),
+        rng.uniform(1e5, 2e9, 50)
+    ])
+    weights = np.array([0.1, 0.3, 0.2, 0.15, 0.25])
+    assert_scores_match(values, np.array(ALL_RULES), weights)
+
+
+def test_scan_insight_flags_matches():
+    rng = np.random.default_rng(1)
+    n = 200
+    columns = (
+        rng.uniform(0, 100, n),  # internet
+        rng.uniform(1, 5, n),  # logistics
+        rng.uniform(-2.5, 2.5, n),  # rule_of_law
+        rng.uniform(1e5, 1.5e9, n),  # population
+        rng.uniform(500, 120000, n),  # gdp
+        rng.uniform(10, 100, n)  # urban
+    )
+    expected = _scan_insight_flags_numpy(*columns)
+    flags = _scan_insight_flags_kernel(*columns)
+    assert flags.shape == expected.shape == (n, N_INSIGHT_FLAGS)
+    np.testing.assert_array_equal(flags, expected)
+
+
+def test_scan_insight_flags_matches_with_nan():
+    # NaN fails every comparison in both forms, e.g. a missing urban share
+    columns = tuple(np.array([np.nan, 90.0, 3.0]) for _ in range(6))
+    np.testing.assert_array_equal(_scan_insight_flags_kernel(*columns), _scan_insight_flags_numpy(*columns))
@@ -0,0 +1,168 @@
+"""
+request_json against a temporary cache directory, with a stub session in place
+of the World Bank API.
+"""
+
+import json
+import os
+from datetime import timedelta
+from time import time
+
+import pytest
+
+from src.data import worldbank
+from src.data.worldbank import prune_cache, request_json
+
+URL = 'https://api.worldbank.org/v2/country/USA/indicator/NY.GDP.PCAP.PP.CD'
+PARAMS = {'format': 'json', 'date': '2020:2023'}
+PAYLOAD = [{'page': 1}, [{'value': 65000.0}]]
+
+
+class StubResponse:
+    def __init__(self, payload, status_code=200):
+        self.status_code = status_code
+        self.content = json.dumps(payload).encode()
+
+
+class StubSession:
+    """Answers every GET with the next queued response, or raises it if it is an exception"""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.calls = 0
+
+    def get(self, url, params=None, timeout=None):
+        self.calls += 1
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    directory = tmp_path / 'wb_cache'
+    monkeypatch.setattr(worldbank, 'CACHE_DIR', directory)
+    monkeypatch.setattr(worldbank, '_cache_pruned', False)
+    return directory
+
+
+def age(path, seconds):
+    """Backdate a file's modification time"""
+    timestamp = time() - seconds
+    os.utime(path, (timestamp, timestamp))
+
+
+def test_fresh_entry_is_served_without_network(cache_dir):
+    session = StubSession(StubResponse(PAYLOAD))
+    assert request_json(session, URL, PARAMS, ttl=timedelta(hours=1)) == PAYLOAD
+    assert request_json(session, URL, PARAMS, ttl=timedelta(hours=1)) == PAYLOAD
+    assert session.calls == 1
+
+
+def test_expired_entry_is_refetched(cache_dir):
+    updated = [{'page': 1}, [{'value': 70000.0}]]
+    session = StubSession(StubResponse(PAYLOAD), StubResponse(updated))
+    request_json(session, URL, PARAMS, ttl=timedelta(hours=1))
+    age(next(cache_dir.glob('*.json')), 2 * 3600)
+
+    assert request_json(session, URL, PARAMS, ttl=timedelta(hours=1)) == updated
+    assert session.calls == 2
+    assert request_json(session, URL, PARAMS, ttl=timedelta(hours=1)) == updated  # Rewritten, so fresh again
+
+
+def test_no_ttl_always_asks_the_api(cache_dir):
+    session = StubSession(StubResponse(PAYLOAD), StubResponse(PAYLOAD))
+    request_json(session, URL, PARAMS)
+    request_json(session, URL, PARAMS)
+    assert session.calls == 2
+
+
+def test_params_are_part_of_the_key(cache_dir):
+    other = [{'page': 1}, [{'value': 1.0}]]
+    session = StubSession(StubResponse(PAYLOAD), StubResponse(other))
+    request_json(session, URL, PARAMS, ttl=timedelta(hours=1))
+    assert request_json(session, URL, {**PARAMS, 'date': '2019'}, ttl=timedelta(hours=1)) == other
+    assert len(list(cache_dir.glob('*.json'))) == 2
+
+
+@pytest.mark.parametrize('failure', [
+    ConnectionError('API down'),
+    StubResponse(PAYLOAD, status_code=503),
+    StubResponse({'message': 'Invalid value'})
+])
+def test_stale_entry_is_served_when_api_fails(cache_dir, failure):
+    session = StubSession(StubResponse(PAYLOAD), failure)
+    request_json(session, URL, PARAMS, ttl=timedelta(hours=1))
+    age(next(cache_dir.glob('*.json')), 90 * 86400)  # Expired, but still the last good payload
+
+    assert request_json(session, URL, PARAMS, ttl=timedelta(hours=1)) == PAYLOAD
+    assert session.calls == 2
+
+
+def test_failure_without_cache_entry_raises(cache_dir):
+    session = StubSession(ConnectionError('API down'))
+    with pytest.raises(ConnectionError):
+        request_json(session, URL, PARAMS, ttl=timedelta(hours=1))
+
+
+def test_corrupt_entry_is_ignored(cache_dir):
+    session = StubSession(StubResponse(PAYLOAD), ConnectionError('API down'))
+    request_json(session, URL, PARAMS, ttl=timedelta(hours=1))
+    next(cache_dir.glob('*.json')).write_bytes(b'[{"page": 1}, [{"val')
+
+    with pytest.raises(ConnectionError):
+        request_json(session, URL, PARAMS, ttl=timedelta(hours=1))
+
+
+def test_write_replaces_entry_and_leaves_no_temp_files(cache_dir):
+    updated = [{'page': 1}, [{'value': 70000.0}]]
+    session = StubSession(StubResponse(PAYLOAD), StubResponse(updated))
+    request_json(session, URL, PARAMS)
+    request_json(session, URL, PARAMS)
+
+    entries = list(cache_dir.iterdir())
+    assert len(entries) == 1 and entries[0].suffix == '.json'
+    assert json.loads(entries[0].read_bytes()) == updated
+
+
+def test_failed_replace_keeps_old_entry(cache_dir, monkeypatch):
+    session = StubSession(StubResponse(PAYLOAD), StubResponse([{'page': 1}, []]))
+    request_json(session, URL, PARAMS)
+
+    def failing_replace(src, dst):
+        raise OSError('disk full')
+    monkeypatch.setattr(worldbank.os, 'replace', failing_replace)
+    request_json(session, URL, PARAMS)
+
+    entries = list(cache_dir.iterdir())
+    assert len(entries) == 1
+    assert json.loads(entries[0].read_bytes()) == PAYLOAD
+
+
+def test_prune_removes_only_old_entries(cache_dir):
+    cache_dir.mkdir()
+    old, recent, leftover = cache_dir / 'old.json', cache_dir / 'recent.json', cache_dir / 'leftover.tmp'
+    for path in (old, recent, leftover):
+        path.write_bytes(b'[]')
+    age(old, 31 * 86400)
+    age(leftover, 31 * 86400)
+
+    prune_cache()
+    assert list(cache_dir.iterdir()) == [recent]
+
+
+def test_first_write_prunes_once(cache_dir):
+    cache_dir.mkdir()
+    old = cache_dir / 'old.json'
+    old.write_bytes(b'[]')
+    age(old, 31 * 86400)
+
+    session = StubSession(StubResponse(PAYLOAD), StubResponse(PAYLOAD))
+    request_json(session, URL, PARAMS)
+    assert not old.exists()
+
+    old.write_bytes(b'[]')
+    age(old, 31 * 86400)
+    request_json(session, URL, {**PARAMS, 'date': '2019'})
+    assert old.exists()  # Swept on the first write of the process only
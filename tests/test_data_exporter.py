@@ -0,0 +1,126 @@
+"""
+The vectorized score table and the pre-rendered CSV text must match what the
+per-combination pandas implementation and a plain to_csv produce.
+"""
+
+from datetime import datetime
+from itertools import product
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from data_exporter import PowerBIDataExporter, _load_fallback_countries
+
+METADATA_COLUMNS = ['business_type', 'product_category', 'risk_tolerance', 'analysis_focus']
+
+
+@pytest.fixture
+def exporter(tmp_path):
+    return PowerBIDataExporter(output_dir=str(tmp_path / 'powerbi_data'))
+
+
+@pytest.fixture
+def market_data(exporter):
+    """Sample indicators for a spread of income levels, with a few missing values"""
+    countries = _load_fallback_countries().iloc[::15].reset_index(drop=True)
+    data = exporter._get_sample_indicators_data(countries)
+    data.loc[1, 'logistics_performance'] = np.nan
+    data.loc[3, 'gini_index'] = np.nan
+    data.loc[5, 'internet_users_pct'] = np.nan
+    return data
+
+
+def reference_scores(exporter: PowerBIDataExporter, market_data: pd.DataFrame) -> pd.DataFrame:
+    """Score one combination at a time with pandas, as the exporter did before the score kernel"""
+    frames = []
+    for business_type, category, risk, focus in product(
+            exporter.BUSINESS_TYPES, exporter.PRODUCT_CATEGORIES,
+            exporter.RISK_TOLERANCES, exporter.ANALYSIS_FOCUSES):
+        df = market_data.copy()
+        weights = exporter._combination_weights(category, business_type, focus, df.columns)
+
+        for indicator in weights:
+            if indicator not in df.columns:
+                continue
+            if indicator == 'logistics_performance':
+                df[f'{indicator}_normalized'] = ((df[indicator] - 1) / 4) * 100
+            elif indicator == 'mobile_subscriptions':
+                df[f'{indicator}_normalized'] = np.minimum(df[indicator], 150) / 150 * 100
+            elif indicator in ['internet_users_pct', 'urban_population_pct']:
+                df[f'{indicator}_normalized'] = np.clip(df[indicator], 0, 100)
+            elif indicator == 'population':
+                df[f'{indicator}_normalized'] = np.clip((np.log10(df[indicator]) - 6) / 3 * 100, 0, 100)
+            else:
+                min_val, max_val = df[indicator].min(), df[indicator].max()
+                if max_val > min_val:
+                    df[f'{indicator}_normalized'] = ((df[indicator] - min_val) / (max_val - min_val)) * 100
+                else:
+                    df[f'{indicator}_normalized'] = 50.0
+
+        df['market_attractiveness_score'] = 0.0
+        for indicator, weight in weights.items():
+            if f'{indicator}_normalized' in df.columns:
+                df['market_attractiveness_score'] += df[f'{indicator}_normalized'] * weight
+
+        gini_scaled = (df['gini_index'] - df['gini_index'].min()) / (df['gini_index'].max() - df['gini_index'].min())
+        if risk == 'Conservative':
+            df['market_attractiveness_score'] -= gini_scaled * 30
+            df['market_attractiveness_score'] += (df['gdp_per_capita_ppp'] > 30000).astype(int) * 15
+        elif risk == 'Aggressive':
+            df['market_attractiveness_score'] -= gini_scaled * 5
+            df['market_attractiveness_score'] += (df['gdp_per_capita_ppp'] < 20000).astype(int) * 20
+        df['market_attractiveness_score'] = np.clip(df['market_attractiveness_score'], 0, 100)
+
+        df['business_type'] = business_type
+        df['product_category'] = category
+        df['risk_tolerance'] = risk
+        df['analysis_focus'] = focus
+        df['calculation_date'] = datetime.now()
+        frames.append(df)
+    return pd.concat(frames, ignore_index=True)
+
+
+def test_market_scores_match_per_combination_reference(exporter, market_data, monkeypatch):
+    monkeypatch.setattr(exporter, 'get_market_indicators_for_all_countries', lambda: market_data.copy())
+    scores = exporter.calculate_all_market_scores()
+    expected = reference_scores(exporter, market_data)
+
+    assert list(scores.columns) == list(expected.columns)
+    assert len(scores) == len(expected)
+    text_columns = [*market_data.select_dtypes(include=['object', 'string']).columns, *METADATA_COLUMNS]
+    for column in text_columns:
+        assert scores[column].astype(object).tolist() == expected[column].astype(object).tolist(), column
+    float_columns = expected.columns[expected.dtypes == np.float64]
+    np.testing.assert_allclose(
+        scores[float_columns].to_numpy(dtype=np.float64),
+        expected[float_columns].to_numpy(dtype=np.float64),
+        rtol=1e-9, atol=1e-9, equal_nan=True
+    )
+
+
+def test_market_scores_csv_text_matches_plain_to_csv(exporter, market_data, monkeypatch):
+    monkeypatch.setattr(exporter, 'get_market_indicators_for_all_countries', lambda: market_data.copy())
+    scores = exporter.calculate_all_market_scores()
+    assert exporter._render_float_columns(scores).to_csv(index=False) == scores.to_csv(index=False)
+
+
+def test_render_float_columns_matches_to_csv():
+    repeated = np.tile([0.1, 1 / 3, np.nan, 1e-7, 2.5e12, -0.0, 42.0], 20)
+    df = pd.DataFrame({
+        'country_code': ['USA', 'CHN'] * 70,
+        'repeated': repeated,
+        'distinct': np.linspace(0, 1, len(repeated)),
+        'all_missing': np.nan,
+        'count': np.arange(len(repeated))
+    })
+    rendered = PowerBIDataExporter._render_float_columns(df)
+    assert rendered['repeated'].dtype != np.float64  # Mostly duplicates, so pre-rendered
+    assert rendered['distinct'].dtype == np.float64  # Left for to_csv to format
+    assert rendered.to_csv(index=False) == df.to_csv(index=False)
+
+
+def test_write_table_csv_matches_to_csv(exporter, market_data):
+    exporter._write_table(market_data, 'market_indicators')
+    written = (exporter.output_dir / 'market_indicators.csv').read_text()
+    assert written == market_data.to_csv(index=False)